@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2026 Tom Groß
+
+"""
+Measures the import time of ``nexus.cli.colors`` and the cost of looking
+up colors and effects.
+
+Usage: ``python benchmarks/cli_palette_bench.py``
+"""
+
+import subprocess
+import sys
+import timeit
+
+N_LOOKUPS = 1_000_000
+
+
+def _import_time_us() -> tuple[int, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import nexus.cli.colors"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    for line in result.stderr.splitlines():
+        if line.rstrip().endswith("| nexus.cli.colors"):
+            self_us, cumulative_us, _ = line.split("|")
+            return int(self_us.split(":")[1]), int(cumulative_us)
+
+    raise RuntimeError("nexus.cli.colors was not imported!")
+
+
+def main() -> None:
+    from nexus.cli.colors import EFFECTS, get_default_palette, get_palette
+
+    self_us, cumulative_us = _import_time_us()
+    print(
+        f"Import of nexus.cli.colors: {self_us / 1e3:.2f} ms "
+        f"({cumulative_us / 1e3:.2f} ms including nexus.core)"
+    )
+
+    first = timeit.timeit(lambda: get_palette.__wrapped__("mocha"), number=1000)
+    print(f"Building a flavor: {first / 1000 * 1e6:.2f} µs")
+
+    palette = get_default_palette()
+    for name, stmt in [
+        ("palette.blue", lambda: palette.blue),
+        ("EFFECTS.bold.on", lambda: EFFECTS.bold.on),
+        ("get_default_palette()", get_default_palette),
+    ]:
+        duration = timeit.timeit(stmt, number=N_LOOKUPS)
+        print(f"{name}: {duration / N_LOOKUPS * 1e9:.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2026 Tom Groß
+
+"""
+Measures the cold start time of ``nexus config get cli.color_palette``
+in fresh interpreter processes, compared to the startup of a bare
+interpreter. The target is an overhead below 150 ms, which requires that
+neither discord.py, aiohttp nor numpy are imported.
+
+Usage: ``python benchmarks/cli_startup_bench.py``
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+N_RUNS = 20
+TARGET_OVERHEAD_MS = 150
+
+_BARE_COMMAND = [sys.executable, "-c", "pass"]
+_CLI_COMMAND = [
+    sys.executable,
+    "-c",
+    "from nexus.cli.cli import entry_point; "
+    "entry_point(['config', 'get', 'cli.color_palette'])",
+]
+
+
+def _median_ms(command: list[str]) -> float:
+    # Warm up the file system cache and the bytecode cache
+    subprocess.run(command, capture_output=True, check=True)
+
+    timings = []
+    for _ in range(N_RUNS):
+        start = time.perf_counter()
+        subprocess.run(command, capture_output=True, check=True)
+        timings.append((time.perf_counter() - start) * 1e3)
+
+    return statistics.median(timings)
+
+
+def main() -> None:
+    bare = _median_ms(_BARE_COMMAND)
+    cli = _median_ms(_CLI_COMMAND)
+    overhead = cli - bare
+
+    print(f"Bare interpreter: median {bare:.1f} ms")
+    print(f"nexus config get: median {cli:.1f} ms (overhead {overhead:.1f} ms)")
+    print(
+        f"Target: overhead < {TARGET_OVERHEAD_MS} ms "
+        f"({'met' if overhead < TARGET_OVERHEAD_MS else 'missed'})"
+    )
+
+
+if __name__ == "__main__":
+    main()
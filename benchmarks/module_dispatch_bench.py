@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2026 Tom Groß
+
+"""
+Measures the dispatch throughput of gateway events with 50 loaded modules,
+of which 5 listen to ``MESSAGE_CREATE``. Compares the dispatch table with
+broadcasting every event to every module.
+
+Usage: ``python benchmarks/module_dispatch_bench.py``
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+N_MODULES = 50
+N_EVENTS = 100_000
+EVENTS = [
+    "MESSAGE_CREATE",
+    "MESSAGE_UPDATE",
+    "MESSAGE_DELETE",
+    "GUILD_CREATE",
+    "GUILD_MEMBER_ADD",
+    "GUILD_MEMBER_REMOVE",
+    "INTERACTION_CREATE",
+    "PRESENCE_UPDATE",
+    "TYPING_START",
+    "VOICE_STATE_UPDATE",
+]
+
+
+def _create_module_class(event: str) -> type:
+    from nexus.core.module import Module, listener
+
+    class BenchModule(Module):
+        def __init__(self, name: str, path: Path) -> None:
+            from nexus.core.config import TOMLConfiguration
+
+            super().__init__(
+                name=name, optional=False, config=TOMLConfiguration(path / "m.toml")
+            )
+            self.count = 0
+
+        @listener(event)
+        async def handle(self, payload: object) -> None:
+            self.count += 1
+
+        async def on_event(self, event_name: str, payload: object) -> None:
+            # What every module has to do if events are broadcast
+            if event_name in self._listeners:
+                for name in self._listeners[event_name]:
+                    await getattr(self, name)(payload)
+
+    return BenchModule
+
+
+async def _run(tmp_path: Path) -> None:
+    from nexus.core.module import EventDispatcher
+
+    modules = [
+        _create_module_class(EVENTS[i % len(EVENTS)])(name=f"m{i}", path=tmp_path)
+        for i in range(N_MODULES)
+    ]
+
+    dispatcher = EventDispatcher()
+    start = time.perf_counter()
+    dispatcher.rebuild(modules=modules)
+    rebuild_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(N_EVENTS):
+        await dispatcher.dispatch("MESSAGE_CREATE", None)
+    table_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(N_EVENTS):
+        for module in modules:
+            await module.on_event("MESSAGE_CREATE", None)
+    broadcast_time = time.perf_counter() - start
+
+    print(f"Rebuilt dispatch table in {rebuild_time * 1e3:.3f} ms")
+    print(f"Dispatch table: {N_EVENTS / table_time:,.0f} events/s")
+    print(f"Broadcast:      {N_EVENTS / broadcast_time:,.0f} events/s")
+    print(f"Speedup: {broadcast_time / table_time:.1f}x")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        asyncio.run(_run(Path(tmp_dir)))
+
+
+if __name__ == "__main__":
+    main()
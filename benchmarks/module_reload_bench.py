@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2026 Tom Groß
+
+"""
+Measures how long it takes to reload the modules after one out of 40
+modules changed, compared with reloading all of them. Every fifth module
+depends on the one before it.
+
+Usage: ``python benchmarks/module_reload_bench.py``
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+N_MODULES = 40
+N_RUNS = 5
+PACKAGE = "bench_modules"
+
+_MODULE_SOURCE = """
+from nexus.core.module import module, listener
+
+VERSION = {version}
+TABLE = {{i: str(i) * 10 for i in range(2000)}}
+
+
+class Module(module.Module):
+    dependencies = {dependencies!r}
+
+    def __init__(self, config):
+        super().__init__(name="m{index}", optional=False, config=config)
+
+    @listener("MESSAGE_CREATE")
+    async def on_message(self, message):
+        pass
+"""
+
+
+def _write_module(root: Path, index: int, version: int) -> None:
+    dependencies = (f"m{index - 1}",) if index % 5 == 4 else ()
+
+    (root / f"m{index}").mkdir(exist_ok=True)
+    (root / f"m{index}" / "__init__.py").touch()
+    (root / f"m{index}" / "module.py").write_text(
+        _MODULE_SOURCE.format(version=version, dependencies=dependencies, index=index)
+    )
+
+
+def main() -> None:
+    from nexus.core.config import TOMLConfiguration
+    from nexus.core.module import ModuleManager
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir) / PACKAGE
+        root.mkdir()
+        (root / "__init__.py").touch()
+        for index in range(N_MODULES):
+            _write_module(root, index=index, version=0)
+
+        sys.path.insert(0, tmp_dir)
+
+        config = TOMLConfiguration(
+            Path(tmp_dir) / "modules.toml", create_if_not_exists=True
+        )
+        config.dump({"modules": []})
+
+        manager = ModuleManager(module_config=config, package=PACKAGE)
+        asyncio.run(manager.reload_modules())
+        for index in range(N_MODULES):
+            asyncio.run(manager.enable_module(f"m{index}"))
+
+        incremental_times = []
+        full_times = []
+        for run in range(1, N_RUNS + 1):
+            # m3 is a dependency of m4, so two modules are reloaded
+            _write_module(root, index=3, version=run)
+            start = time.perf_counter()
+            asyncio.run(manager.reload_modules())
+            incremental_times.append(time.perf_counter() - start)
+
+            for index in range(N_MODULES):
+                _write_module(root, index=index, version=run)
+            start = time.perf_counter()
+            asyncio.run(manager.reload_modules())
+            full_times.append(time.perf_counter() - start)
+
+        assert sys.modules[f"{PACKAGE}.m3.module"].VERSION == N_RUNS
+
+    incremental = min(incremental_times)
+    full = min(full_times)
+    print(f"Reload after 1 of {N_MODULES} modules changed: {incremental * 1e3:.2f} ms")
+    print(f"Reload after all {N_MODULES} modules changed:  {full * 1e3:.2f} ms")
+    print(f"Speedup: {full / incremental:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2026 Tom Groß
+
+"""
+Measures permission checks for 100k members with up to 20 of 1k roles, which
+grant 300 distinct permissions. Compares sets of permission names with the
+compiled bitsets of the resolver, one member at a time and all at once.
+
+Usage: ``python benchmarks/permission_resolve_bench.py``
+"""
+
+import random
+import time
+
+N_MEMBERS = 100_000
+N_ROLES = 1_000
+N_PERMISSIONS = 300
+MAX_ROLES_PER_MEMBER = 20
+PERMISSION = "p42"
+
+
+def main() -> None:
+    from nexus.modules.permissions.resolver import PermissionResolver
+
+    rng = random.Random(0)
+    permissions = [f"p{i}" for i in range(N_PERMISSIONS)]
+    grants = {
+        role: set(rng.sample(permissions, rng.randint(1, 15)))
+        for role in range(N_ROLES)
+    }
+    members = [
+        rng.sample(range(N_ROLES), rng.randint(1, MAX_ROLES_PER_MEMBER))
+        for _ in range(N_MEMBERS)
+    ]
+
+    start = time.perf_counter()
+    resolver = PermissionResolver()
+    for role, names in grants.items():
+        resolver.set_role(role, names)
+    resolver.resolve_many([[0]])
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [PERMISSION in set().union(*(grants[r] for r in m)) for m in members]
+    set_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = [resolver.has_permissions(member, PERMISSION) for member in members]
+    bitset_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = resolver.check_many(members, PERMISSION)
+    batch_time = time.perf_counter() - start
+
+    assert single == expected == batch.tolist()
+
+    print(f"Compiled {N_ROLES} roles in {compile_time * 1e3:.1f} ms")
+    print(f"Name sets:         {N_MEMBERS / set_time:>12,.0f} checks/s")
+    print(f"Bitsets:           {N_MEMBERS / bitset_time:>12,.0f} checks/s")
+    print(f"Bitsets (batched): {N_MEMBERS / batch_time:>12,.0f} checks/s")
+    print(
+        f"Speedup: {set_time / bitset_time:.1f}x, {set_time / batch_time:.1f}x batched"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2026 Tom Groß
+
+"""
+Measures how long it takes to enumerate 500 registered services and to
+look one of them up by its name.
+
+Usage: ``python benchmarks/service_load_bench.py``
+"""
+
+import os
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+N_SERVICES = 500
+
+
+def _create_services(parent_dir: Path) -> dict[str, str]:
+    services = {}
+
+    for i in range(N_SERVICES):
+        root_dir = parent_dir / f"service_{i}"
+        for directory in ["plugins", "config/modules", "config/plugins"]:
+            (root_dir / directory).mkdir(parents=True)
+
+        unique_id = str(uuid.uuid4())
+        (root_dir / "nexus.toml").write_text(f'uuid = "{unique_id}"\n')
+        for name in ["bots", "modules", "plugins"]:
+            (root_dir / f"{name}.toml").touch()
+
+        services[unique_id] = str(root_dir.resolve())
+
+    return services
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["HOME"] = tmp_dir
+
+        from nexus.core.service.register import ServiceRegister
+        from nexus.core.service.service import Service  # noqa: F401
+
+        services = _create_services(Path(tmp_dir) / "services")
+
+        register = ServiceRegister()
+        register._config.dump(
+            {
+                "services": services,
+                "names": {Path(path).name: uid for uid, path in services.items()},
+            }
+        )
+
+        start = time.perf_counter()
+        loaded = ServiceRegister().get_services()
+        enumerate_time = time.perf_counter() - start
+
+        ServiceRegister._identity_map.clear()
+
+        start = time.perf_counter()
+        ServiceRegister().get_service_by_name(f"service_{N_SERVICES - 1}")
+        lookup_time = time.perf_counter() - start
+
+    print(f"Loaded {len(loaded)} services in {enumerate_time * 1e3:.2f} ms")
+    print(f"  per service: {enumerate_time / len(loaded) * 1e6:.1f} µs")
+    print(f"Lookup by name: {lookup_time * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2026 Tom Groß
+
+"""
+Compares 1,000 individual writes to a TOML configuration with the same
+writes grouped into a single transaction.
+
+Usage: ``python benchmarks/toml_transaction_bench.py``
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from nexus.core.config import TOMLConfiguration
+
+N_KEYS = 1000
+
+
+def _bench(config: TOMLConfiguration, use_transaction: bool) -> float:
+    config.dump({"section": {}})
+
+    start = time.perf_counter()
+    if use_transaction:
+        with config.transaction():
+            for i in range(N_KEYS):
+                config[f"section.key_{i}"] = i
+    else:
+        for i in range(N_KEYS):
+            config[f"section.key_{i}"] = i
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = TOMLConfiguration(
+            Path(tmp_dir) / "bench.toml", create_if_not_exists=True
+        )
+
+        individual = _bench(config, use_transaction=False)
+        transaction = _bench(config, use_transaction=True)
+
+    print(f"{N_KEYS} individual sets:     {individual * 1e3:10.2f} ms")
+    print(f"{N_KEYS} sets in transaction: {transaction * 1e3:10.2f} ms")
+    print(f"Speedup: {individual / transaction:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
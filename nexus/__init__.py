@@ -1,8 +1,24 @@
 from . import version
-from rich import traceback
 
-from nexus.core import VariableLibrary
+__version__ = version.__version__
 
-traceback.install(show_locals=VariableLibrary.get_variable("exceptions.show_locals"))
 
-__version__ = version.__version__
+def install_traceback() -> None:
+    """
+    Installs rich tracebacks, showing local variables depending on the
+    ``exceptions.show_locals`` variable. Since rich is expensive to import,
+    it is only imported once the first uncaught exception occurs.
+    """
+    import sys
+
+    def excepthook(exc_type, exc_value, exc_traceback) -> None:
+        from rich import traceback
+
+        from nexus.core import VariableLibrary
+
+        traceback.install(
+            show_locals=VariableLibrary.get_variable("exceptions.show_locals")
+        )
+        sys.excepthook(exc_type, exc_value, exc_traceback)
+
+    sys.excepthook = excepthook
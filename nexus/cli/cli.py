@@ -2,16 +2,14 @@
 # Copyright (c) 2026 Tom Groß
 
 from datetime import datetime
-from pathlib import Path
+from functools import partial
 
 import rich_click as click
 
 import nexus
 from nexus.cli.colors import EFFECTS, RESET, get_default_palette
-from nexus.core.config import TOMLConfiguration
-
-from .config import commands as config
-from .service import commands as service
+from nexus.cli.lazy import LazyGroup
+from nexus.metadata import get_metadata
 
 palette = get_default_palette()
 
@@ -45,12 +43,12 @@ def _print_info(ctx, param, value):
 
 
 def _create_epilog(short):
-    pyproject = TOMLConfiguration(Path(nexus.__file__).parent.parent / "pyproject.toml")
-    authors = pyproject["project.authors"]
-    authors = ",".join([author["name"] for author in authors])
-    lic = pyproject["project.license"]
-    repo_url = pyproject["project.urls.Repository"]
-    docu_url = pyproject["project.urls.Documentation"]
+    metadata = get_metadata()
+    authors = ",".join(metadata.authors)
+    lic = metadata.license
+    repo_url = metadata.urls.get("Repository")
+    docu_url = metadata.urls.get("Documentation")
+    license_url = metadata.urls.get("License")
     year = datetime.now().year
 
     version = nexus.version.version
@@ -76,15 +74,25 @@ def _create_epilog(short):
             + f"📚 {palette.base}For more information on this package visit "
             f"{EFFECTS.bold.on}{EFFECTS.underline.on}{palette.blue}{docu_url}{RESET}!\n\n"
             + f"⚖️ {palette.base}This package is licensed under the "
-            f"{EFFECTS.bold.on}{palette.green}{lic['text']}{RESET} {palette.base}license. "
+            f"{EFFECTS.bold.on}{palette.green}{lic}{RESET} {palette.base}license. "
             + f"More information on this license can be found under "
-            f"{EFFECTS.bold.on}{EFFECTS.underline.on}{palette.sky}{lic['url']}{RESET}."
+            f"{EFFECTS.bold.on}{EFFECTS.underline.on}{palette.sky}{license_url}{RESET}."
         )
 
 
 # Structure of the entry_point group and adding of the subcommands
 # taken from https://stackoverflow.com/a/39228156
-@click.group(epilog=_create_epilog(short=True))
+# The subcommands are only imported once they are invoked and the epilog
+# is only rendered once the help is shown.
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "config": "nexus.cli.config.commands.command",
+        "coordinator": "nexus.cli.coordinator.commands.command",
+        "service": "nexus.cli.service.commands.command",
+    },
+    epilog_factory=partial(_create_epilog, short=True),
+)
 @click.option(
     "--version",
     "-v",
@@ -101,8 +109,4 @@ def _create_epilog(short):
     help="Displays some information about backpy.",
 )
 def entry_point(**kwargs):
-    pass
-
-
-entry_point.add_command(config.command)
-entry_point.add_command(service.command)
+    nexus.install_traceback()
@@ -1,13 +1,22 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 # Copyright (c) 2026 Tom Groß
 
-from enum import Enum
-
-from catppuccin.palette import PALETTE as _PALETTE
+import os
+import sys
+from functools import cache
 
 from nexus.core.config import VariableLibrary
 
-__all__ = ["get_default_palette", "rgb_to_ansi"]
+__all__ = [
+    "get_default_palette",
+    "get_palette",
+    "rgb_to_ansi",
+    "colors_enabled",
+    "Palette",
+    "PALETTE",
+    "EFFECTS",
+    "RESET",
+]
 
 
 # RGB to ANSI guide from
@@ -17,31 +26,245 @@ def rgb_to_ansi(r: int, g: int, b: int, foreground: bool = True) -> str:
     return f"\x1b[{fg_bg_str}{r};{g};{b}m"
 
 
-def _get_value(self, instance, owner):
-    return self.value
+def colors_enabled() -> bool:
+    """
+    Checks whether the output should be colored. This is not the case if the
+    ``NO_COLOR`` environment variable is set (see https://no-color.org) or if
+    the standard output is not a terminal.
+
+    Returns
+    -------
+
+    bool : Whether ANSI codes should be used.
+    """
+    if os.environ.get("NO_COLOR", ""):
+        return False
+
+    return sys.stdout is not None and sys.stdout.isatty()
+
+
+# The RGB values of the catppuccin palette (https://catppuccin.com/palette)
+# taken from the 'catppuccin' package v2.5.0.
+_FLAVORS: dict[str, dict[str, tuple[int, int, int]]] = {
+    "latte": {
+        "rosewater": (220, 138, 120),
+        "flamingo": (221, 120, 120),
+        "pink": (234, 118, 203),
+        "mauve": (136, 57, 239),
+        "red": (210, 15, 57),
+        "maroon": (230, 69, 83),
+        "peach": (254, 100, 11),
+        "yellow": (223, 142, 29),
+        "green": (64, 160, 43),
+        "teal": (23, 146, 153),
+        "sky": (4, 165, 229),
+        "sapphire": (32, 159, 181),
+        "blue": (30, 102, 245),
+        "lavender": (114, 135, 253),
+        "text": (76, 79, 105),
+        "subtext1": (92, 95, 119),
+        "subtext0": (108, 111, 133),
+        "overlay2": (124, 127, 147),
+        "overlay1": (140, 143, 161),
+        "overlay0": (156, 160, 176),
+        "surface2": (172, 176, 190),
+        "surface1": (188, 192, 204),
+        "surface0": (204, 208, 218),
+        "base": (239, 241, 245),
+        "mantle": (230, 233, 239),
+        "crust": (220, 224, 232),
+    },
+    "frappe": {
+        "rosewater": (242, 213, 207),
+        "flamingo": (238, 190, 190),
+        "pink": (244, 184, 228),
+        "mauve": (202, 158, 230),
+        "red": (231, 130, 132),
+        "maroon": (234, 153, 156),
+        "peach": (239, 159, 118),
+        "yellow": (229, 200, 144),
+        "green": (166, 209, 137),
+        "teal": (129, 200, 190),
+        "sky": (153, 209, 219),
+        "sapphire": (133, 193, 220),
+        "blue": (140, 170, 238),
+        "lavender": (186, 187, 241),
+        "text": (198, 208, 245),
+        "subtext1": (181, 191, 226),
+        "subtext0": (165, 173, 206),
+        "overlay2": (148, 156, 187),
+        "overlay1": (131, 139, 167),
+        "overlay0": (115, 121, 148),
+        "surface2": (98, 104, 128),
+        "surface1": (81, 87, 109),
+        "surface0": (65, 69, 89),
+        "base": (48, 52, 70),
+        "mantle": (41, 44, 60),
+        "crust": (35, 38, 52),
+    },
+    "macchiato": {
+        "rosewater": (244, 219, 214),
+        "flamingo": (240, 198, 198),
+        "pink": (245, 189, 230),
+        "mauve": (198, 160, 246),
+        "red": (237, 135, 150),
+        "maroon": (238, 153, 160),
+        "peach": (245, 169, 127),
+        "yellow": (238, 212, 159),
+        "green": (166, 218, 149),
+        "teal": (139, 213, 202),
+        "sky": (145, 215, 227),
+        "sapphire": (125, 196, 228),
+        "blue": (138, 173, 244),
+        "lavender": (183, 189, 248),
+        "text": (202, 211, 245),
+        "subtext1": (184, 192, 224),
+        "subtext0": (165, 173, 203),
+        "overlay2": (147, 154, 183),
+        "overlay1": (128, 135, 162),
+        "overlay0": (110, 115, 141),
+        "surface2": (91, 96, 120),
+        "surface1": (73, 77, 100),
+        "surface0": (54, 58, 79),
+        "base": (36, 39, 58),
+        "mantle": (30, 32, 48),
+        "crust": (24, 25, 38),
+    },
+    "mocha": {
+        "rosewater": (245, 224, 220),
+        "flamingo": (242, 205, 205),
+        "pink": (245, 194, 231),
+        "mauve": (203, 166, 247),
+        "red": (243, 139, 168),
+        "maroon": (235, 160, 172),
+        "peach": (250, 179, 135),
+        "yellow": (249, 226, 175),
+        "green": (166, 227, 161),
+        "teal": (148, 226, 213),
+        "sky": (137, 220, 235),
+        "sapphire": (116, 199, 236),
+        "blue": (137, 180, 250),
+        "lavender": (180, 190, 254),
+        "text": (205, 214, 244),
+        "subtext1": (186, 194, 222),
+        "subtext0": (166, 173, 200),
+        "overlay2": (147, 153, 178),
+        "overlay1": (127, 132, 156),
+        "overlay0": (108, 112, 134),
+        "surface2": (88, 91, 112),
+        "surface1": (69, 71, 90),
+        "surface0": (49, 50, 68),
+        "base": (30, 30, 46),
+        "mantle": (24, 24, 37),
+        "crust": (17, 17, 27),
+    },
+}
+
+
+class Palette:
+    def __init__(self, name: str, colors: dict[str, str]) -> None:
+        """
+        A flavor of the catppuccin color palette, which provides ANSI color
+        codes as plain attributes.
+
+        Parameters
+        ----------
+
+        name : str
+            The name of the flavor.
+
+        colors : dict[str, str]
+            The ANSI codes of the colors by their names.
+
+        Examples
+        --------
+
+        >>> get_palette("latte").blue
+        '\x1b[38;2;30;102;245m'
+
+        """
+        self.name: str = name
+        self.__dict__.update(colors)
 
+    def __getitem__(self, color: str) -> str:
+        return self.__dict__[color]
 
-PALETTE = dict()
 
-for val in _PALETTE.__iter__():
-    palette = val.identifier
+class _Effect:
+    def __init__(self, on: str, off: str) -> None:
+        self.on: str = on
+        self.off: str = off
 
-    PALETTE[palette] = dict()
 
-    for key, color in _PALETTE.__dict__[palette].colors.__dict__.items():
-        PALETTE[palette][key] = rgb_to_ansi(r=color.rgb.r, g=color.rgb.g, b=color.rgb.b)
+class _Effects:
+    def __init__(self, enabled: bool) -> None:
+        codes = {
+            "bold": (1, 21),
+            "dim": (2, 22),
+            "underline": (4, 24),
+            "blink": (5, 25),
+            "reverse": (7, 27),
+            "hide": (8, 28),
+        }
 
-    PALETTE[palette] = Enum(palette, PALETTE[palette])
-    PALETTE[palette].__get__ = _get_value
+        for name, (on, off) in codes.items():
+            effect = (
+                _Effect(on=f"\x1b[{on}m", off=f"\x1b[{off}m")
+                if enabled
+                else _Effect(on="", off="")
+            )
+            setattr(self, name, effect)
 
 
-_palette_dict = PALETTE.copy()
+class _Palettes:
+    def __getattr__(self, flavor: str) -> Palette:
+        try:
+            return get_palette(flavor)
+        except KeyError:
+            raise AttributeError(flavor) from None
 
-PALETTE = Enum("PALETTE", _palette_dict.copy())
+    def __getitem__(self, flavor: str) -> Palette:
+        return get_palette(flavor)
+
+    def __iter__(self):
+        return iter(_FLAVORS)
+
+
+_COLORS_ENABLED = colors_enabled()
+
+
+@cache
+def get_palette(flavor: str) -> Palette:
+    """
+    Provides a flavor of the color palette. The palette of a flavor is
+    only built once per process. If colors are disabled, all codes are empty.
+
+    Parameters
+    ----------
+
+    flavor : str
+        The name of the flavor (``latte``, ``frappe``, ``macchiato`` or ``mocha``).
+
+    Returns
+    -------
+
+    Palette : The palette of the flavor.
+    """
+    colors = _FLAVORS[flavor]
+
+    if not _COLORS_ENABLED:
+        return Palette(name=flavor, colors=dict.fromkeys(colors, ""))
+
+    return Palette(
+        name=flavor,
+        colors={name: rgb_to_ansi(*rgb) for name, rgb in colors.items()},
+    )
+
+
+PALETTE = _Palettes()
 # """
 # A variant of the catppuccin color palette, which returns ANSI color codes instead
 # of rgb / hex colors.
-# The PALETTE and the flavors can be called as enum values.
 #
 # The order of calls is always:
 #
@@ -55,33 +278,18 @@ PALETTE = Enum("PALETTE", _palette_dict.copy())
 #
 # """
 
-PALETTE._member_names_ = list(_palette_dict.keys())
-PALETTE._member_map_ = _palette_dict
-PALETTE.__get__ = _get_value
-
 
 # special ANSI characters taken from
 # https://jakob-bagterp.github.io/colorist-for-python/ansi-escape-codes/effects/#cheat-sheet
 
-RESET = "\x1b[0m"
+RESET = "\x1b[0m" if _COLORS_ENABLED else ""
 # """
 # Resets all styling of the text.
 # """
 
-EFFECTS = Enum(
-    "EFFECTS",
-    {
-        "bold": Enum("bold", {"on": "\x1b[1m", "off": "\x1b[21m"}),
-        "dim": Enum("bold", {"on": "\x1b[2m", "off": "\x1b[22m"}),
-        "underline": Enum("bold", {"on": "\x1b[4m", "off": "\x1b[24m"}),
-        "blink": Enum("bold", {"on": "\x1b[5m", "off": "\x1b[25m"}),
-        "reverse": Enum("bold", {"on": "\x1b[7m", "off": "\x1b[27m"}),
-        "hide": Enum("bold", {"on": "\x1b[8m", "off": "\x1b[28m"}),
-    },
-)
+EFFECTS = _Effects(enabled=_COLORS_ENABLED)
 # """
-# An enum containing ANSI effects for the text
-# The EFFECTS and the effects itself can be called as enum values.
+# ANSI effects for the text.
 #
 # The order of calls is always:
 #
@@ -95,11 +303,7 @@ EFFECTS = Enum(
 #
 # """
 
-EFFECTS.__get__ = _get_value
-
-for effect in EFFECTS:
-    effect.value.__get__ = _get_value
-
 
-def get_default_palette():
-    return PALETTE[VariableLibrary.get_variable("cli.color_palette")]
+@cache
+def get_default_palette() -> Palette:
+    return get_palette(VariableLibrary.get_variable("cli.color_palette"))
@@ -3,18 +3,19 @@
 
 import rich_click as click
 
-from nexus.cli.config.get_command import get_value
-from nexus.cli.config.list_command import list_variables
-from nexus.cli.config.reset_command import reset
-from nexus.cli.config.set_command import set_value
+from nexus.cli.lazy import LazyGroup
 
 
-@click.group("config", help="Actions related to configuring the package.")
+@click.group(
+    "config",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "get": "nexus.cli.config.get_command.get_value",
+        "set": "nexus.cli.config.set_command.set_value",
+        "list": "nexus.cli.config.list_command.list_variables",
+        "reset": "nexus.cli.config.reset_command.reset",
+    },
+    help="Actions related to configuring the package.",
+)
 def command():
     pass
-
-
-command.add_command(get_value)
-command.add_command(set_value)
-command.add_command(list_variables)
-command.add_command(reset)
@@ -2,9 +2,6 @@
 # Copyright (c) 2026 Tom Groß
 
 import rich_click as click
-from fuzzyfinder import fuzzyfinder
-from rich.console import Console
-from rich.tree import Tree
 
 from nexus.cli.colors import EFFECTS, RESET, get_default_palette
 from nexus.cli.elements import print_error_message
@@ -38,6 +35,8 @@ def get_value(key: str, debug: bool) -> None:
             debug=debug,
         )
     except KeyError:
+        from fuzzyfinder import fuzzyfinder
+
         matched = list(
             fuzzyfinder(
                 key,
@@ -45,10 +44,11 @@ def get_value(key: str, debug: bool) -> None:
                 highlight=True,
             )
         )
+        suggestions = "\n  ".join(matched)
         return print_error_message(
             error=KeyError(
                 f"The variable '{key}' could not be found!\n"
-                f"Did you mean one of the following?{RESET}\n\n  {'\n  '.join(matched)}"
+                f"Did you mean one of the following?{RESET}\n\n  {suggestions}"
             ),
             debug=debug,
         )
@@ -60,6 +60,8 @@ def get_value(key: str, debug: bool) -> None:
             f"{palette.maroon}{value}{RESET}"
         )
     else:
+        from rich.console import Console
+        from rich.tree import Tree
 
         def render_tree(d, tree):
             for k, v in d.items():
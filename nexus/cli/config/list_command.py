@@ -2,7 +2,6 @@
 # Copyright (c) 2026 Tom Groß
 
 import rich_click as click
-from fuzzyfinder import fuzzyfinder
 from rich.console import Console
 from rich.tree import Tree
 
@@ -42,13 +41,16 @@ def list_variables(key: str | None, debug: bool) -> None:
             debug=debug,
         )
     except KeyError:
+        from fuzzyfinder import fuzzyfinder
+
         matched = list(
             fuzzyfinder(key, VariableLibrary.get_config().get_keys(), highlight=True)
         )
+        suggestions = "\n  ".join(matched)
         return print_error_message(
             error=KeyError(
                 f"The variable '{key}' could not be found!\n"
-                f"Did you mean one of the following?{RESET}\n\n  {'\n  '.join(matched)}"
+                f"Did you mean one of the following?{RESET}\n\n  {suggestions}"
             ),
             debug=debug,
         )
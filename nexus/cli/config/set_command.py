@@ -2,7 +2,6 @@
 # Copyright (c) 2026 Tom Groß
 
 import rich_click as click
-from fuzzyfinder import fuzzyfinder
 
 from nexus.cli.colors import EFFECTS, RESET, get_default_palette
 from nexus.cli.elements import ConfirmInput, print_error_message
@@ -90,6 +89,8 @@ def set_value(key: str, value: str, force: bool, debug: bool) -> None:
             debug=debug,
         )
     except KeyError:
+        from fuzzyfinder import fuzzyfinder
+
         matched = list(
             fuzzyfinder(
                 key,
@@ -97,10 +98,11 @@ def set_value(key: str, value: str, force: bool, debug: bool) -> None:
                 highlight=True,
             )
         )
+        suggestions = "\n  ".join(matched)
         return print_error_message(
             error=KeyError(
                 f"The variable '{key}' could not be found!\n"
-                f"Did you mean one of the following?{RESET}\n\n  {'\n  '.join(matched)}"
+                f"Did you mean one of the following?{RESET}\n\n  {suggestions}"
             ),
             debug=debug,
         )
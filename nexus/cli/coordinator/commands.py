@@ -0,0 +1,73 @@
+import rich_click as click
+
+
+@click.command(
+    name="coordinator",
+    help=(
+        "Runs a shard coordinator, from which the nodes of a bot "
+        "lease their shards, until it is interrupted."
+    ),
+)
+@click.argument("shard_count", type=click.IntRange(min=1))
+@click.option("--host", help="The host to listen on.", default="127.0.0.1", type=str)
+@click.option("--port", "-p", help="The port to listen on.", default=7420, type=int)
+@click.option(
+    "--shards-per-lease",
+    help="The number of shards in a lease.",
+    default=1,
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--max-concurrency",
+    help="The number of IDENTIFY rate limit buckets of the bot.",
+    default=1,
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--identify-interval",
+    help="The time in seconds between two IDENTIFY in the same bucket.",
+    default=5.0,
+    type=click.FloatRange(min=0),
+)
+@click.option(
+    "--lease-ttl",
+    help="The time in seconds after which a lease expires if it is not renewed.",
+    default=30.0,
+    type=click.FloatRange(min=0, min_open=True),
+)
+@click.option(
+    "--token",
+    help=(
+        "The secret the nodes have to send with every request. Without it, "
+        "the coordinator has to stay on a trusted network."
+    ),
+    envvar="NEXUS_COORDINATOR_TOKEN",
+    default=None,
+    type=str,
+)
+def command(
+    shard_count: int,
+    host: str,
+    port: int,
+    shards_per_lease: int,
+    max_concurrency: int,
+    identify_interval: float,
+    lease_ttl: float,
+    token: str | None,
+) -> None:
+    # Imported here, as the coordinator depends on discord.py
+    from nexus.core.bot.coordination import run_coordinator
+
+    try:
+        run_coordinator(
+            host=host,
+            port=port,
+            shard_count=shard_count,
+            shards_per_lease=shards_per_lease,
+            max_concurrency=max_concurrency,
+            identify_interval=identify_interval,
+            lease_ttl=lease_ttl,
+            token=token,
+        )
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2026 Tom Groß
+
+import importlib
+from typing import Callable
+
+import rich_click as click
+
+__all__ = ["LazyGroup"]
+
+
+# Adapted from the click documentation on lazily loading subcommands
+# https://click.palletsprojects.com/en/stable/complex/#lazily-loading-subcommands
+class LazyGroup(click.RichGroup):
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: dict[str, str] | None = None,
+        epilog_factory: Callable[[], str] | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Initializes a group, whose subcommands are only imported once they
+        are invoked or listed and whose epilog is only created once the
+        help is shown.
+
+        Parameters
+        ----------
+
+        lazy_subcommands : dict[str, str] | None, optional
+            A mapping of the subcommand names to the import paths of the
+            commands (e.g. ``{"get": "nexus.cli.config.get_command.get_value"}``).
+            Default is ``None``.
+
+        epilog_factory : Callable[[], str] | None, optional
+            A function creating the epilog. It is called on the first access
+            of the epilog and takes precedence over the ``epilog`` argument.
+            Default is ``None``.
+
+        """
+        self._epilog_factory: Callable[[], str] | None = epilog_factory
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: dict[str, str] = lazy_subcommands or {}
+
+    @property
+    def epilog(self) -> str | None:
+        if self._epilog_factory is not None:
+            self._epilog = self._epilog_factory()
+            self._epilog_factory = None
+        return self._epilog
+
+    @epilog.setter
+    def epilog(self, value: str | None) -> None:
+        self._epilog = value
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return super().list_commands(ctx) + sorted(self.lazy_subcommands)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        module_name, attribute = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+        command = getattr(importlib.import_module(module_name), attribute)
+
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazily loaded subcommand '{cmd_name}' is not a click command "
+                f"(is '{type(command).__name__}')!"
+            )
+
+        return command
@@ -1,13 +1,13 @@
 import rich_click as click
 
-from .init_command import init
+from nexus.cli.lazy import LazyGroup
 
 
 @click.group(
-    name="service", help="Actions related to initializing and managing services."
+    name="service",
+    cls=LazyGroup,
+    lazy_subcommands={"init": "nexus.cli.service.init_command.init"},
+    help="Actions related to initializing and managing services.",
 )
 def command():
     pass
-
-
-command.add_command(init)
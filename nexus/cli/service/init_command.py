@@ -2,7 +2,7 @@ from pathlib import Path
 
 import rich_click as click
 
-from nexus.core.exceptions.services import ServiceExistsError
+from nexus.core.exceptions.services import InvalidServiceError, ServiceExistsError
 from nexus.core.service.register import ServiceRegister
 from nexus.core.service.service import Service
 
@@ -31,7 +31,7 @@ def init(name: str, path: Path, import_config: Path | None) -> None:
         raise ServiceExistsError(
             "There is already a service with this name! Service names have to be unique."
         )
-    except KeyError:
+    except InvalidServiceError:
         pass
 
     service = Service(name=name, parent_dir=path)
@@ -1,3 +1,3 @@
-from .bot import Bot
+from .bot import Bot, ShardedBot
 
-__all__ = ["Bot"]
+__all__ = ["Bot", "ShardedBot"]
@@ -1,32 +1,181 @@
-from discord import Client, Intents
+import logging
+from typing import TYPE_CHECKING, Any, Callable
 
+from discord import AutoShardedClient, Client, Intents
 
-class Bot(Client):
-    def __init__(self, name: str, intents: list[str], default_intents: bool) -> None:
+from nexus.core.bot.intents import resolve_intents
 
+if TYPE_CHECKING:
+    from nexus.core.bot.coordination import ShardCoordinator
+
+__all__ = ["Bot", "ShardedBot", "EventSink"]
+
+_logger = logging.getLogger(__name__)
+
+# Receives the name and the raw payload of every gateway event,
+# e.g. ``ModuleManager.dispatch_nowait``
+EventSink = Callable[[str, dict[str, Any]], None]
+
+
+class _BotMixin:
+    def _init_bot(
+        self,
+        name: str,
+        intents: list[str],
+        default_intents: bool,
+        token: str | None,
+        intent_requirements: list[str] | None,
+        event_sink: EventSink | None,
+    ) -> None:
         self.name: str = name
+        self.token: str | None = token
 
         self._include_default_intents: bool = default_intents
         self._intents: list[str] = intents
+        self._intent_requirements: list[str] | None = intent_requirements
+        self._event_sink: EventSink | None = event_sink
 
-        super().__init__(intents=self.get_intents())
+    def set_event_sink(self, event_sink: EventSink | None) -> None:
+        self._event_sink = event_sink
+
+    def _install_event_bridge(self) -> None:
+        # discord.py hands the payload of every gateway event to a parser of
+        # its connection state. The parsers are wrapped in place, as the
+        # gateway looks them up in this dictionary.
+        parsers = self._connection.parsers
+        for event, parser in parsers.items():
+            parsers[event] = self._bridge_parser(event=event, parser=parser)
+
+    def _bridge_parser(
+        self, event: str, parser: Callable[[Any], None]
+    ) -> Callable[[Any], None]:
+        def parse(data: Any) -> None:
+            parser(data)
+
+            if self._event_sink is not None:
+                try:
+                    self._event_sink(event, data)
+                except Exception:
+                    _logger.exception(
+                        "The bot '%s' failed to forward the event '%s'.",
+                        self.name,
+                        event,
+                    )
+
+        return parse
 
     def get_intents(self) -> Intents:
-        intents = Intents.default() if self._include_default_intents else Intents.none()
+        return resolve_intents(
+            intents=self._intents,
+            default_intents=self._include_default_intents,
+            requirements=self._intent_requirements,
+        )
+
+
+class Bot(_BotMixin, Client):
+    def __init__(
+        self,
+        name: str,
+        intents: list[str],
+        default_intents: bool,
+        token: str | None = None,
+        intent_requirements: list[str] | None = None,
+        event_sink: EventSink | None = None,
+    ) -> None:
+        """
+        A bot connecting to the gateway with a single shard.
+
+        Parameters
+        ----------
+
+        intent_requirements : list[str] | None, optional
+            The intents required by the modules. If given, the bot only
+            subscribes to these intents and the configured ``intents``.
+            Default is ``None``.
+
+        event_sink : Callable[[str, dict[str, Any]], None] | None, optional
+            The function receiving every gateway event after discord.py
+            parsed it, e.g. ``ModuleManager.dispatch_nowait``.
+            Default is ``None``.
+
+        """
+        self._init_bot(
+            name=name,
+            intents=intents,
+            default_intents=default_intents,
+            token=token,
+            intent_requirements=intent_requirements,
+            event_sink=event_sink,
+        )
+
+        super().__init__(intents=self.get_intents())
+        self._install_event_bridge()
+
+
+class ShardedBot(_BotMixin, AutoShardedClient):
+    def __init__(
+        self,
+        name: str,
+        intents: list[str],
+        default_intents: bool,
+        token: str | None = None,
+        intent_requirements: list[str] | None = None,
+        shard_count: int | None = None,
+        shard_ids: list[int] | None = None,
+        coordinator: "ShardCoordinator | None" = None,
+        event_sink: EventSink | None = None,
+    ) -> None:
+        """
+        A bot connecting to the gateway with several shards.
+
+        Parameters
+        ----------
+
+        intent_requirements : list[str] | None, optional
+            The intents required by the modules. If given, the bot only
+            subscribes to these intents and the configured ``intents``.
+            Default is ``None``.
+
+        shard_count : int | None, optional
+            The total number of shards of the bot. If ``None``, the number
+            recommended by Discord is used.
+            Default is ``None``.
+
+        shard_ids : list[int] | None, optional
+            The shards this bot connects. If ``None``, all shards are connected.
+            Requires ``shard_count`` to be set.
+            Default is ``None``.
 
-        for intent in self._intents:
-            target_value = True
+        coordinator : ShardCoordinator | None, optional
+            The coordinator which grants IDENTIFY slots to the shards.
+            If ``None``, the shards IDENTIFY one after another.
+            Default is ``None``.
 
-            # Check if intent is negated
-            if intent.startswith("!"):
-                target_value = False
-                intent = intent.removeprefix("!")
+        event_sink : Callable[[str, dict[str, Any]], None] | None, optional
+            The function receiving every gateway event after discord.py
+            parsed it, e.g. ``ModuleManager.dispatch_nowait``.
+            Default is ``None``.
 
-            intent = intent.lower()
+        """
+        self._init_bot(
+            name=name,
+            intents=intents,
+            default_intents=default_intents,
+            token=token,
+            intent_requirements=intent_requirements,
+            event_sink=event_sink,
+        )
+        self._coordinator: "ShardCoordinator | None" = coordinator
 
-            if intent not in Intents.VALID_FLAGS:
-                raise ValueError(f"The intent '{intent}' does not exist!")
+        super().__init__(
+            intents=self.get_intents(), shard_count=shard_count, shard_ids=shard_ids
+        )
+        self._install_event_bridge()
 
-            setattr(intents, intent, target_value)
+    async def before_identify_hook(
+        self, shard_id: int | None, *, initial: bool = False
+    ) -> None:
+        if self._coordinator is None:
+            return await super().before_identify_hook(shard_id, initial=initial)
 
-        return intents
+        await self._coordinator.acquire_identify(shard_id=shard_id or 0)
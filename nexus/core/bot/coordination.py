@@ -0,0 +1,677 @@
+import asyncio
+import hmac
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, replace
+from typing import Any
+
+from nexus.core.bot.bot import Bot, EventSink, ShardedBot
+from nexus.core.bot.sharding import ShardLauncher, partition_shards
+from nexus.core.bot.spec import BotSpec
+from nexus.core.exceptions.generic import ShardCoordinationError
+
+__all__ = [
+    "ShardLease",
+    "ShardCoordinator",
+    "LocalShardCoordinator",
+    "CoordinatorServer",
+    "RemoteShardCoordinator",
+    "ShardNode",
+    "run_coordinator",
+]
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ShardLease:
+    lease_id: str
+    node: str
+    shard_ids: list[int]
+    shard_count: int
+    ttl: float
+
+
+class ShardCoordinator(ABC):
+    """
+    Coordinates the shards of a bot running on several nodes. Nodes lease
+    ranges of shards and have to acquire an IDENTIFY slot before a shard
+    connects to the gateway.
+    """
+
+    @abstractmethod
+    async def acquire_shards(self, node: str) -> ShardLease | None:
+        """
+        Leases a free range of shards.
+
+        Parameters
+        ----------
+
+        node : str
+            The name of the node leasing the shards.
+
+        Returns
+        -------
+
+        ShardLease | None : The lease or ``None`` if all shards are leased.
+        """
+
+    @abstractmethod
+    async def renew(self, lease_id: str) -> bool:
+        """
+        Renews a lease before it expires.
+
+        Parameters
+        ----------
+
+        lease_id : str
+            The ID of the lease.
+
+        Returns
+        -------
+
+        bool : Whether the lease is still held. If ``False``, the lease
+        expired and its shards may be leased by another node.
+        """
+
+    @abstractmethod
+    async def release(self, lease_id: str) -> None:
+        """
+        Releases a lease, so its shards can be leased by another node.
+
+        Parameters
+        ----------
+
+        lease_id : str
+            The ID of the lease.
+
+        """
+
+    @abstractmethod
+    async def acquire_identify(self, shard_id: int) -> None:
+        """
+        Waits until the shard is allowed to IDENTIFY. Shards share the
+        rate limit bucket ``shard_id % max_concurrency``.
+
+        Parameters
+        ----------
+
+        shard_id : int
+            The ID of the shard which is about to IDENTIFY.
+
+        """
+
+
+class LocalShardCoordinator(ShardCoordinator):
+    def __init__(
+        self,
+        shard_count: int,
+        shards_per_lease: int = 1,
+        max_concurrency: int = 1,
+        identify_interval: float = 5.0,
+        lease_ttl: float = 30.0,
+    ) -> None:
+        """
+        Initializes a coordinator, which keeps its state in memory.
+        It can be shared by nodes in the same event loop or served to other
+        processes and machines with a ``CoordinatorServer``.
+
+        Parameters
+        ----------
+
+        shard_count : int
+            The total number of shards of the bot.
+
+        shards_per_lease : int, optional
+            The number of shards in a lease.
+            Default is ``1``.
+
+        max_concurrency : int, optional
+            The number of IDENTIFY rate limit buckets, as reported by
+            Discord as ``session_start_limit.max_concurrency``.
+            Default is ``1``.
+
+        identify_interval : float, optional
+            The time in seconds between two IDENTIFY in the same bucket.
+            Default is ``5.0``.
+
+        lease_ttl : float, optional
+            The time in seconds after which a lease expires if it is not renewed.
+            Default is ``30.0``.
+
+        """
+        if max_concurrency < 1:
+            raise ValueError("The maximum concurrency has to be positive!")
+
+        self._shard_count: int = shard_count
+        self._groups: list[list[int]] = partition_shards(
+            shard_count=shard_count, shards_per_process=shards_per_lease
+        )
+        self._max_concurrency: int = max_concurrency
+        self._identify_interval: float = identify_interval
+        self._lease_ttl: float = lease_ttl
+
+        # Lease ID -> (group index, node, expiry)
+        self._leases: dict[str, tuple[int, str, float]] = {}
+        self._next_identify: list[float] = [0.0] * max_concurrency
+        self._bucket_locks: list[asyncio.Lock] = [
+            asyncio.Lock() for _ in range(max_concurrency)
+        ]
+
+    def get_leases(self) -> list[ShardLease]:
+        """
+        Provides all leases which did not expire.
+
+        Returns
+        -------
+
+        list[ShardLease] : The active leases.
+        """
+        self._expire()
+        now = time.monotonic()
+
+        return [
+            self._create_lease(
+                lease_id=lease_id, index=index, node=node, ttl=expiry - now
+            )
+            for lease_id, (index, node, expiry) in self._leases.items()
+        ]
+
+    async def acquire_shards(self, node: str) -> ShardLease | None:
+        self._expire()
+
+        leased = {index for index, _, _ in self._leases.values()}
+        for index in range(len(self._groups)):
+            if index in leased:
+                continue
+
+            lease_id = uuid.uuid4().hex
+            self._leases[lease_id] = (index, node, time.monotonic() + self._lease_ttl)
+
+            return self._create_lease(
+                lease_id=lease_id, index=index, node=node, ttl=self._lease_ttl
+            )
+
+        return None
+
+    async def renew(self, lease_id: str) -> bool:
+        self._expire()
+
+        if lease_id not in self._leases:
+            return False
+
+        index, node, _ = self._leases[lease_id]
+        self._leases[lease_id] = (index, node, time.monotonic() + self._lease_ttl)
+
+        return True
+
+    async def release(self, lease_id: str) -> None:
+        self._leases.pop(lease_id, None)
+
+    async def acquire_identify(self, shard_id: int) -> None:
+        if not 0 <= shard_id < self._shard_count:
+            raise ShardCoordinationError(f"The shard {shard_id} does not exist!")
+
+        bucket = shard_id % self._max_concurrency
+
+        async with self._bucket_locks[bucket]:
+            delay = self._next_identify[bucket] - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            self._next_identify[bucket] = time.monotonic() + self._identify_interval
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+
+        for lease_id, (_, _, expiry) in list(self._leases.items()):
+            if expiry <= now:
+                del self._leases[lease_id]
+
+    def _create_lease(
+        self, lease_id: str, index: int, node: str, ttl: float
+    ) -> ShardLease:
+        return ShardLease(
+            lease_id=lease_id,
+            node=node,
+            shard_ids=self._groups[index].copy(),
+            shard_count=self._shard_count,
+            ttl=ttl,
+        )
+
+
+class CoordinatorServer:
+    def __init__(
+        self,
+        coordinator: ShardCoordinator,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        token: str | None = None,
+    ) -> None:
+        """
+        Initializes a server, which provides a coordinator to nodes on other
+        processes or machines. Every request is a single line of JSON on
+        its own connection. Requests are only authenticated with a token,
+        so a server without one has to stay on a trusted network.
+
+        Parameters
+        ----------
+
+        coordinator : ShardCoordinator
+            The coordinator to serve.
+
+        host : str, optional
+            The host to listen on.
+            Default is ``"127.0.0.1"``.
+
+        port : int, optional
+            The port to listen on. If ``0``, a free port is chosen.
+            Default is ``0``.
+
+        token : str | None, optional
+            The secret every request has to include. If ``None``, requests
+            are not authenticated.
+            Default is ``None``.
+
+        """
+        self._coordinator: ShardCoordinator = coordinator
+        self._host: str = host
+        self._port: int = port
+        self._token: str | None = token
+        self._server: asyncio.Server | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        if self._server is None:
+            return self._host, self._port
+
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle, host=self._host, port=self._port
+        )
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request = json.loads(await reader.readline())
+            response = {"ok": True, "result": await self._dispatch(request=request)}
+        except (ShardCoordinationError, KeyError, TypeError, ValueError) as e:
+            response = {"ok": False, "error": str(e)}
+
+        try:
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _dispatch(self, request: dict[str, Any]) -> Any:
+        if self._token is not None and not hmac.compare_digest(
+            str(request.get("token", "")).encode(), self._token.encode()
+        ):
+            raise ShardCoordinationError("The request is not authorized!")
+
+        match request["op"]:
+            case "acquire":
+                lease = await self._coordinator.acquire_shards(node=request["node"])
+                return asdict(lease) if lease is not None else None
+            case "renew":
+                return await self._coordinator.renew(lease_id=request["lease_id"])
+            case "release":
+                return await self._coordinator.release(lease_id=request["lease_id"])
+            case "identify":
+                return await self._coordinator.acquire_identify(
+                    shard_id=request["shard_id"]
+                )
+            case op:
+                raise ShardCoordinationError(f"The operation '{op}' does not exist!")
+
+
+class RemoteShardCoordinator(ShardCoordinator):
+    def __init__(
+        self, host: str, port: int, token: str | None = None, timeout: float = 10.0
+    ) -> None:
+        """
+        Initializes a client of a coordinator provided by a ``CoordinatorServer``.
+
+        Parameters
+        ----------
+
+        host : str
+            The host of the server.
+
+        port : int
+            The port of the server.
+
+        token : str | None, optional
+            The secret of the server. If ``None``, requests are sent without one.
+            Default is ``None``.
+
+        timeout : float, optional
+            The time in seconds a request may take, including connecting.
+            Default is ``10.0``.
+
+        """
+        self._host: str = host
+        self._port: int = port
+        self._token: str | None = token
+        self._timeout: float = timeout
+
+    @classmethod
+    def from_address(
+        cls, address: str, token: str | None = None
+    ) -> "RemoteShardCoordinator":
+        """
+        Creates a client from an address in the form ``host:port``.
+        """
+        host, _, port = address.rpartition(":")
+
+        if not host or not port.isdigit():
+            raise ValueError(f"The coordinator address '{address}' is invalid!")
+
+        return cls(host=host, port=int(port), token=token)
+
+    async def acquire_shards(self, node: str) -> ShardLease | None:
+        lease = await self._request(op="acquire", node=node)
+        return ShardLease(**lease) if lease is not None else None
+
+    async def renew(self, lease_id: str) -> bool:
+        return await self._request(op="renew", lease_id=lease_id)
+
+    async def release(self, lease_id: str) -> None:
+        await self._request(op="release", lease_id=lease_id)
+
+    async def acquire_identify(self, shard_id: int) -> None:
+        await self._request(op="identify", shard_id=shard_id)
+
+    async def _request(self, op: str, **kwargs: Any) -> Any:
+        request = {"op": op, **kwargs}
+        if self._token is not None:
+            request["token"] = self._token
+
+        try:
+            line = await asyncio.wait_for(
+                self._send(request=request), timeout=self._timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise ShardCoordinationError(
+                f"The coordinator at {self._host}:{self._port} did not respond "
+                f"within {self._timeout}s!"
+            ) from e
+
+        if not line:
+            raise ShardCoordinationError(
+                f"The coordinator at {self._host}:{self._port} closed the connection!"
+            )
+
+        response = json.loads(line)
+        if not response["ok"]:
+            raise ShardCoordinationError(response["error"])
+
+        return response["result"]
+
+    async def _send(self, request: dict[str, Any]) -> bytes:
+        try:
+            reader, writer = await asyncio.open_connection(self._host, self._port)
+        except OSError as e:
+            raise ShardCoordinationError(
+                f"The coordinator at {self._host}:{self._port} is not reachable!"
+            ) from e
+
+        try:
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+            return await reader.readline()
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+
+class ShardNode:
+    def __init__(
+        self,
+        spec: BotSpec,
+        coordinator: ShardCoordinator,
+        node: str | None = None,
+        renew_interval: float | None = None,
+        retry_interval: float = 5.0,
+        max_leases: int | None = None,
+        event_sink: EventSink | None = None,
+    ) -> None:
+        """
+        Initializes a node, which leases shards from a coordinator and runs
+        them as a ``ShardedBot`` for as long as it holds the lease. The shards
+        of bots with ``shards_per_process`` are run in worker processes by a
+        ``ShardLauncher`` instead.
+
+        A node keeps leasing shards until it holds ``max_leases`` leases or
+        all shards are leased, so all shards are connected even if there are
+        fewer nodes than leases. It waits ``retry_interval`` seconds after
+        every lease, so nodes started at the same time share the shards.
+
+        Parameters
+        ----------
+
+        spec : BotSpec
+            The bot to run.
+
+        coordinator : ShardCoordinator
+            The coordinator to lease the shards from.
+
+        node : str | None, optional
+            The name of the node. If ``None``, the host name and process ID
+            are used.
+            Default is ``None``.
+
+        renew_interval : float | None, optional
+            The interval in seconds in which the lease is renewed. If ``None``,
+            a third of the lease's time to live is used.
+            Default is ``None``.
+
+        retry_interval : float, optional
+            The time in seconds to wait before leasing again if no shards
+            are free or the bot stopped and between two leases.
+            Default is ``5.0``.
+
+        max_leases : int | None, optional
+            The maximum number of leases the node holds at the same time.
+            If ``None``, the number of leases is unlimited.
+            Default is ``None``.
+
+        event_sink : Callable[[str, dict[str, Any]], None] | None, optional
+            The function receiving every gateway event of the leased shards.
+            Default is ``None``.
+
+        """
+        self._spec: BotSpec = spec
+        self._event_sink: EventSink | None = event_sink
+        self._coordinator: ShardCoordinator = coordinator
+        self._node: str = node or f"{socket.gethostname()}-{os.getpid()}"
+        self._renew_interval: float | None = renew_interval
+        self._retry_interval: float = retry_interval
+        self._max_leases: int | None = max_leases
+        self._shutdown_event: asyncio.Event | None = None
+
+    @property
+    def node(self) -> str:
+        return self._node
+
+    def request_shutdown(self) -> None:
+        if self._shutdown_event is not None:
+            self._shutdown_event.set()
+
+    async def run(self) -> None:
+        """
+        Leases shards and runs them until a shutdown is requested.
+        """
+        self._shutdown_event = asyncio.Event()
+        tasks: set[asyncio.Task] = set()
+
+        try:
+            while not self._is_shutting_down():
+                tasks = {task for task in tasks if not task.done()}
+
+                lease = None
+                if self._max_leases is None or len(tasks) < self._max_leases:
+                    try:
+                        lease = await self._coordinator.acquire_shards(node=self._node)
+                    except ShardCoordinationError:
+                        _logger.exception(
+                            "Node '%s' could not lease shards.", self._node
+                        )
+
+                if lease is not None:
+                    tasks.add(asyncio.create_task(self._hold_lease(lease=lease)))
+
+                await self._sleep(self._retry_interval)
+        finally:
+            self.request_shutdown()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _hold_lease(self, lease: ShardLease) -> None:
+        try:
+            await self._run_lease(lease=lease)
+        finally:
+            try:
+                await self._coordinator.release(lease_id=lease.lease_id)
+            except ShardCoordinationError:
+                _logger.warning(
+                    "Node '%s' could not release shards %s.",
+                    self._node,
+                    lease.shard_ids,
+                )
+
+    async def _run_lease(self, lease: ShardLease) -> None:
+        _logger.info("Node '%s' leased shards %s.", self._node, lease.shard_ids)
+
+        spec = replace(self._spec, shard_count=lease.shard_count)
+        if spec.is_multiprocess():
+            launcher = ShardLauncher(spec=spec, shard_ids=lease.shard_ids)
+            task = asyncio.create_task(launcher.run())
+        else:
+            bot = spec.create_bot(
+                shard_ids=lease.shard_ids,
+                coordinator=self._coordinator,
+                event_sink=self._event_sink,
+            )
+            task = asyncio.create_task(self._run_bot(bot=bot))
+
+        shutdown_task = asyncio.create_task(self._shutdown_event.wait())
+        renew_interval = self._renew_interval or lease.ttl / 3
+
+        try:
+            while True:
+                await asyncio.wait(
+                    [task, shutdown_task],
+                    timeout=renew_interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if task.done() or self._is_shutting_down():
+                    break
+
+                try:
+                    renewed = await self._coordinator.renew(lease_id=lease.lease_id)
+                except ShardCoordinationError:
+                    renewed = False
+
+                # Another node may lease the shards now, so they have to
+                # disconnect to not be connected twice
+                if not renewed:
+                    _logger.warning(
+                        "Node '%s' lost the lease of shards %s.",
+                        self._node,
+                        lease.shard_ids,
+                    )
+                    break
+        finally:
+            shutdown_task.cancel()
+
+            # The launcher stops its worker processes on its own once
+            # a shutdown is requested, so it must not be cancelled
+            if spec.is_multiprocess():
+                launcher.request_shutdown()
+            else:
+                if not bot.is_closed():
+                    await bot.close()
+
+                task.cancel()
+
+            results = await asyncio.gather(task, return_exceptions=True)
+            if isinstance(results[0], Exception):
+                _logger.error(
+                    "Shards %s of node '%s' crashed.",
+                    lease.shard_ids,
+                    self._node,
+                    exc_info=results[0],
+                )
+
+    async def _run_bot(self, bot: Bot | ShardedBot) -> None:
+        await bot.start(self._spec.token)
+
+    def _is_shutting_down(self) -> bool:
+        return self._shutdown_event is not None and self._shutdown_event.is_set()
+
+    async def _sleep(self, delay: float) -> None:
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+
+def run_coordinator(
+    host: str,
+    port: int,
+    shard_count: int,
+    shards_per_lease: int = 1,
+    max_concurrency: int = 1,
+    identify_interval: float = 5.0,
+    lease_ttl: float = 30.0,
+    token: str | None = None,
+) -> None:
+    """
+    Runs a coordinator server until the process is interrupted. See
+    ``LocalShardCoordinator`` and ``CoordinatorServer`` for the parameters.
+    """
+    if token is None:
+        _logger.warning(
+            "The coordinator at %s:%s does not authenticate requests and has "
+            "to stay on a trusted network.",
+            host,
+            port,
+        )
+
+    coordinator = LocalShardCoordinator(
+        shard_count=shard_count,
+        shards_per_lease=shards_per_lease,
+        max_concurrency=max_concurrency,
+        identify_interval=identify_interval,
+        lease_ttl=lease_ttl,
+    )
+
+    asyncio.run(
+        CoordinatorServer(
+            coordinator=coordinator, host=host, port=port, token=token
+        ).serve_forever()
+    )
@@ -0,0 +1,304 @@
+from dataclasses import dataclass
+from typing import Iterable
+
+from discord import Intents
+
+__all__ = [
+    "EVENT_INTENTS",
+    "IntentReport",
+    "get_event_intents",
+    "expand_intent",
+    "intents_from_requirements",
+    "resolve_intents",
+    "analyze_intents",
+]
+
+# The intents with a single flag, in the order of their bits
+_FLAGS = [
+    "guilds",
+    "members",
+    "moderation",
+    "emojis_and_stickers",
+    "integrations",
+    "webhooks",
+    "invites",
+    "voice_states",
+    "presences",
+    "guild_messages",
+    "guild_reactions",
+    "guild_typing",
+    "dm_messages",
+    "dm_reactions",
+    "dm_typing",
+    "message_content",
+    "guild_scheduled_events",
+    "auto_moderation_configuration",
+    "auto_moderation_execution",
+    "guild_polls",
+    "dm_polls",
+]
+
+
+def _events(intents: tuple[str, ...], *events: str) -> dict[str, tuple[str, ...]]:
+    return dict.fromkeys(events, intents)
+
+
+# Gateway event -> intents needed to receive it in guilds and direct messages.
+# Events which are not listed (e.g. INTERACTION_CREATE) need no intent.
+EVENT_INTENTS: dict[str, tuple[str, ...]] = {
+    **_events(
+        ("guilds",),
+        "GUILD_CREATE",
+        "GUILD_UPDATE",
+        "GUILD_DELETE",
+        "GUILD_ROLE_CREATE",
+        "GUILD_ROLE_UPDATE",
+        "GUILD_ROLE_DELETE",
+        "CHANNEL_CREATE",
+        "CHANNEL_UPDATE",
+        "CHANNEL_DELETE",
+        "THREAD_CREATE",
+        "THREAD_UPDATE",
+        "THREAD_DELETE",
+        "THREAD_LIST_SYNC",
+        "THREAD_MEMBER_UPDATE",
+        "STAGE_INSTANCE_CREATE",
+        "STAGE_INSTANCE_UPDATE",
+        "STAGE_INSTANCE_DELETE",
+    ),
+    **_events(("guilds", "dm_messages"), "CHANNEL_PINS_UPDATE"),
+    **_events(
+        ("members",),
+        "GUILD_MEMBER_ADD",
+        "GUILD_MEMBER_UPDATE",
+        "GUILD_MEMBER_REMOVE",
+        "THREAD_MEMBERS_UPDATE",
+    ),
+    **_events(
+        ("moderation",),
+        "GUILD_AUDIT_LOG_ENTRY_CREATE",
+        "GUILD_BAN_ADD",
+        "GUILD_BAN_REMOVE",
+    ),
+    **_events(
+        ("emojis_and_stickers",),
+        "GUILD_EMOJIS_UPDATE",
+        "GUILD_STICKERS_UPDATE",
+        "GUILD_SOUNDBOARD_SOUND_CREATE",
+        "GUILD_SOUNDBOARD_SOUND_UPDATE",
+        "GUILD_SOUNDBOARD_SOUND_DELETE",
+        "GUILD_SOUNDBOARD_SOUNDS_UPDATE",
+    ),
+    **_events(
+        ("integrations",),
+        "GUILD_INTEGRATIONS_UPDATE",
+        "INTEGRATION_CREATE",
+        "INTEGRATION_UPDATE",
+        "INTEGRATION_DELETE",
+    ),
+    **_events(("webhooks",), "WEBHOOKS_UPDATE"),
+    **_events(("invites",), "INVITE_CREATE", "INVITE_DELETE"),
+    **_events(("voice_states",), "VOICE_CHANNEL_EFFECT_SEND", "VOICE_STATE_UPDATE"),
+    **_events(("presences",), "PRESENCE_UPDATE"),
+    **_events(
+        ("guild_messages", "dm_messages"),
+        "MESSAGE_CREATE",
+        "MESSAGE_UPDATE",
+        "MESSAGE_DELETE",
+    ),
+    **_events(("guild_messages",), "MESSAGE_DELETE_BULK"),
+    **_events(
+        ("guild_reactions", "dm_reactions"),
+        "MESSAGE_REACTION_ADD",
+        "MESSAGE_REACTION_REMOVE",
+        "MESSAGE_REACTION_REMOVE_ALL",
+        "MESSAGE_REACTION_REMOVE_EMOJI",
+    ),
+    **_events(("guild_typing", "dm_typing"), "TYPING_START"),
+    **_events(
+        ("guild_scheduled_events",),
+        "GUILD_SCHEDULED_EVENT_CREATE",
+        "GUILD_SCHEDULED_EVENT_UPDATE",
+        "GUILD_SCHEDULED_EVENT_DELETE",
+        "GUILD_SCHEDULED_EVENT_USER_ADD",
+        "GUILD_SCHEDULED_EVENT_USER_REMOVE",
+    ),
+    **_events(
+        ("auto_moderation_configuration",),
+        "AUTO_MODERATION_RULE_CREATE",
+        "AUTO_MODERATION_RULE_UPDATE",
+        "AUTO_MODERATION_RULE_DELETE",
+    ),
+    **_events(("auto_moderation_execution",), "AUTO_MODERATION_ACTION_EXECUTION"),
+    **_events(
+        ("guild_polls", "dm_polls"),
+        "MESSAGE_POLL_VOTE_ADD",
+        "MESSAGE_POLL_VOTE_REMOVE",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class IntentReport:
+    """
+    The comparison of the intents of a bot with the intents needed by the
+    enabled modules.
+
+    Attributes
+    ----------
+
+    configured : Intents
+        The intents of the bot.
+
+    required : Intents
+        The minimal intents needed by the modules.
+
+    unused : list[str]
+        The intents of the bot no module needs (over-subscription).
+
+    missing : dict[str, list[str]]
+        The intents needed by the modules the bot does not have, with the
+        handlers needing them.
+
+    """
+
+    configured: Intents
+    required: Intents
+    unused: list[str]
+    missing: dict[str, list[str]]
+
+
+def get_event_intents(event: str) -> tuple[str, ...]:
+    return EVENT_INTENTS.get(event.upper(), ())
+
+
+def expand_intent(intent: str) -> list[str]:
+    """
+    Expands an intent to its single flag intents (e.g. ``messages`` to
+    ``guild_messages`` and ``dm_messages``).
+    """
+    intent = intent.lower()
+
+    if intent not in Intents.VALID_FLAGS:
+        raise ValueError(f"The intent '{intent}' does not exist!")
+
+    value = Intents.VALID_FLAGS[intent]
+    return [flag for flag in _FLAGS if Intents.VALID_FLAGS[flag] & value]
+
+
+def intents_from_requirements(requirements: Iterable[str]) -> Intents:
+    """
+    Creates the minimal intents containing the required intents.
+    ``guilds`` is always included, as the cache of the bot depends on it.
+
+    Parameters
+    ----------
+
+    requirements : Iterable[str]
+        The names of the required intents.
+
+    Returns
+    -------
+
+    Intents : The minimal intents.
+    """
+    intents = Intents.none()
+    intents.guilds = True
+
+    for intent in requirements:
+        for flag in expand_intent(intent):
+            setattr(intents, flag, True)
+
+    return intents
+
+
+def resolve_intents(
+    intents: list[str],
+    default_intents: bool = True,
+    requirements: Iterable[str] | None = None,
+) -> Intents:
+    """
+    Resolves the intents of a bot.
+
+    Parameters
+    ----------
+
+    intents : list[str]
+        The intents to enable. Intents prefixed with ``!`` are disabled.
+
+    default_intents : bool, optional
+        Whether to start from the default intents instead of no intents.
+        Ignored if ``requirements`` is given.
+        Default is ``True``.
+
+    requirements : Iterable[str] | None, optional
+        The intents required by the modules. If given, the intents start from
+        the minimal intents containing them.
+        Default is ``None``.
+
+    Returns
+    -------
+
+    Intents : The resolved intents.
+    """
+    if requirements is not None:
+        resolved = intents_from_requirements(requirements)
+    else:
+        resolved = Intents.default() if default_intents else Intents.none()
+
+    for intent in intents:
+        target_value = True
+
+        # Check if intent is negated
+        if intent.startswith("!"):
+            target_value = False
+            intent = intent.removeprefix("!")
+
+        intent = intent.lower()
+
+        if intent not in Intents.VALID_FLAGS:
+            raise ValueError(f"The intent '{intent}' does not exist!")
+
+        setattr(resolved, intent, target_value)
+
+    return resolved
+
+
+def analyze_intents(
+    configured: Intents, requirements: dict[str, set[str]]
+) -> IntentReport:
+    """
+    Compares the intents of a bot with the intents needed by the modules.
+
+    Parameters
+    ----------
+
+    configured : Intents
+        The intents of the bot.
+
+    requirements : dict[str, set[str]]
+        The required intents with the handlers needing them.
+
+    Returns
+    -------
+
+    IntentReport : The comparison.
+    """
+    required = intents_from_requirements(requirements)
+
+    missing: dict[str, set[str]] = {}
+    for intent, sources in requirements.items():
+        for flag in expand_intent(intent):
+            if not getattr(configured, flag):
+                missing.setdefault(flag, set()).update(sources)
+
+    return IntentReport(
+        configured=configured,
+        required=required,
+        unused=[
+            flag
+            for flag in _FLAGS
+            if getattr(configured, flag) and not getattr(required, flag)
+        ],
+        missing={flag: sorted(missing[flag]) for flag in _FLAGS if flag in missing},
+    )
@@ -1,9 +1,56 @@
+import asyncio
+import logging
+import os
+import signal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from nexus.core.bot.bot import Bot, ShardedBot
+from nexus.core.bot.coordination import RemoteShardCoordinator, ShardNode
+from nexus.core.bot.intents import IntentReport, analyze_intents
+from nexus.core.bot.sharding import ShardLauncher
+from nexus.core.bot.spec import BotSpec
+from nexus.core.bot.supervisor import BotSupervisor
 from nexus.core.config.toml import TOMLConfiguration
+from nexus.core.exceptions.generic import InvalidConfigurationError
+
+if TYPE_CHECKING:
+    from nexus.core.module.manager import ModuleManager
+
+_logger = logging.getLogger(__name__)
+
+_SUPERVISOR_SETTINGS = frozenset(
+    {"login_delay", "backoff_base", "backoff_factor", "backoff_max"}
+)
 
 
 class BotManager:
-    def __init__(self, bot_config: TOMLConfiguration) -> None:
+    def __init__(
+        self,
+        bot_config: TOMLConfiguration,
+        module_manager: "ModuleManager | None" = None,
+    ) -> None:
+        """
+        Initializes a manager, which runs the bots of a service.
+
+        Parameters
+        ----------
+
+        bot_config : TOMLConfiguration
+            The bot configuration of the service.
+
+        module_manager : ModuleManager | None, optional
+            The modules handling the gateway events of the bots. If ``None``,
+            events are only handled by discord.py.
+            Default is ``None``.
+
+        """
         self._bot_configuration: TOMLConfiguration = bot_config
+        self._module_manager: "ModuleManager | None" = module_manager
+        self._supervisor: BotSupervisor | None = None
+        self._launchers: list[ShardLauncher] = []
+        self._nodes: list[ShardNode] = []
+        self._intent_requirements: dict[str, set[str]] | None = None
 
     def reset_config(self) -> None:
         self._bot_configuration.dump(
@@ -11,3 +58,378 @@ class BotManager:
                 "bots": [],
             }
         )
+
+    def set_intent_requirements(self, requirements: dict[str, set[str]]) -> None:
+        """
+        Sets the intents required by the enabled modules, overriding those
+        the module manager provides. Bots with ``auto_intents`` only subscribe
+        to these intents.
+
+        Parameters
+        ----------
+
+        requirements : dict[str, set[str]]
+            The required intents with the handlers needing them.
+
+        """
+        self._intent_requirements = {
+            intent: set(sources) for intent, sources in requirements.items()
+        }
+
+    def get_intent_requirements(self) -> dict[str, set[str]] | None:
+        """
+        Provides the intents required by the enabled modules, as set by
+        ``set_intent_requirements`` or else as provided by the module
+        manager when called.
+
+        Returns
+        -------
+
+        dict[str, set[str]] | None : The required intents with the handlers
+        needing them, or ``None`` if they are unknown.
+        """
+        if self._intent_requirements is not None:
+            return self._intent_requirements
+
+        if self._module_manager is not None:
+            return self._module_manager.get_intent_requirements()
+
+        return None
+
+    def get_intent_reports(self) -> dict[str, IntentReport]:
+        """
+        Compares the intents of every bot with the intents required by
+        the enabled modules.
+
+        Returns
+        -------
+
+        dict[str, IntentReport] : The reports by bot name.
+        """
+        return {
+            spec.name: analyze_intents(
+                configured=spec.get_intents(),
+                requirements=self.get_intent_requirements() or {},
+            )
+            for spec in self.get_bot_specs()
+        }
+
+    def get_bot_specs(self) -> list[BotSpec]:
+        """
+        Reads the specification of every entry of the ``bots`` array in the bot
+        configuration. Every entry has a ``name``, optional ``intents``
+        and ``default_intents`` and exactly one token source:
+        ``token``, ``token_env`` (an environment variable) or
+        ``token_file`` (a path relative to the service directory).
+
+        Bots can be sharded with ``shard_count``. If ``shards_per_process``
+        is set additionally, the shards are split into groups which run
+        in separate processes. Bots with ``auto_intents`` only subscribe to
+        the intents required by the enabled modules and the configured
+        ``intents``. Bots with a ``coordinator`` (``host:port``)
+        lease their shards from a coordinator shared by several nodes,
+        at most ``max_leases`` leases per node, and authenticate with its
+        ``coordinator_token``. Leased shards are run in
+        processes as well if ``shards_per_process`` is set.
+        The IDENTIFY of the shards is rate limited by ``max_concurrency``
+        buckets, as reported by Discord.
+
+        Returns
+        -------
+
+        list[BotSpec] : The specifications of the configured bots.
+
+        Raises
+        ------
+
+        InvalidConfigurationError
+            If a bot uses ``auto_intents``, but the intents required by the
+            modules are unknown, as there is no module manager.
+        """
+        requirements = self.get_intent_requirements()
+
+        specs = []
+        for entry in self._bot_configuration["bots"]:
+            if "name" not in entry:
+                raise InvalidConfigurationError(
+                    "Every bot in the bot configuration needs a 'name'!"
+                )
+
+            shard_count = entry.get("shard_count")
+            shards_per_process = entry.get("shards_per_process")
+
+            # Coordinated bots get the shard count from their coordinator
+            if (
+                shards_per_process is not None
+                and shard_count is None
+                and "coordinator" not in entry
+            ):
+                raise InvalidConfigurationError(
+                    f"The bot '{entry['name']}' needs a 'shard_count' or a "
+                    "'coordinator' to use 'shards_per_process'!"
+                )
+
+            if entry.get("auto_intents", False) and requirements is None:
+                raise InvalidConfigurationError(
+                    f"The bot '{entry['name']}' uses 'auto_intents', but the "
+                    "intents required by the modules are unknown!"
+                )
+
+            for key, value in [
+                ("shard_count", shard_count),
+                ("shards_per_process", shards_per_process),
+                ("max_concurrency", entry.get("max_concurrency")),
+                ("max_leases", entry.get("max_leases")),
+            ]:
+                if value is not None and (not isinstance(value, int) or value < 1):
+                    raise InvalidConfigurationError(
+                        f"The '{key}' of the bot '{entry['name']}' "
+                        "has to be a positive integer!"
+                    )
+
+            if not isinstance(entry.get("coordinator_token", ""), str):
+                raise InvalidConfigurationError(
+                    f"The 'coordinator_token' of the bot '{entry['name']}' "
+                    "has to be a string!"
+                )
+
+            specs.append(
+                BotSpec(
+                    name=entry["name"],
+                    intents=entry.get("intents", []),
+                    default_intents=entry.get("default_intents", True),
+                    intent_requirements=(
+                        sorted(requirements)
+                        if entry.get("auto_intents", False)
+                        else None
+                    ),
+                    token=self._get_token(entry=entry),
+                    shard_count=shard_count,
+                    shards_per_process=shards_per_process,
+                    coordinator=entry.get("coordinator"),
+                    coordinator_token=entry.get("coordinator_token"),
+                    max_concurrency=entry.get("max_concurrency", 1),
+                    max_leases=entry.get("max_leases"),
+                    module_config=(
+                        str(self._module_manager._module_config._path)
+                        if self._module_manager is not None
+                        else None
+                    ),
+                )
+            )
+
+        return specs
+
+    def create_bots(self) -> list[Bot | ShardedBot]:
+        """
+        Creates a bot for every entry of the ``bots`` array in the bot
+        configuration. Entries with a ``shard_count`` are created as
+        ``ShardedBot`` connecting all of their shards.
+
+        Returns
+        -------
+
+        list[Bot | ShardedBot] : The configured bots.
+        """
+        return [spec.create_bot() for spec in self.get_bot_specs()]
+
+    def _get_token(self, entry: dict[str, Any]) -> str:
+        sources = [key for key in ["token", "token_env", "token_file"] if key in entry]
+
+        if len(sources) != 1:
+            raise InvalidConfigurationError(
+                f"The bot '{entry['name']}' needs exactly one of 'token', "
+                f"'token_env' or 'token_file'!"
+            )
+
+        match sources[0]:
+            case "token":
+                return entry["token"]
+            case "token_env":
+                try:
+                    return os.environ[entry["token_env"]]
+                except KeyError:
+                    raise InvalidConfigurationError(
+                        f"The environment variable '{entry['token_env']}' "
+                        f"of the bot '{entry['name']}' is not set!"
+                    )
+            case "token_file":
+                path = self._bot_configuration._path.parent / Path(entry["token_file"])
+                try:
+                    return path.read_text().strip()
+                except FileNotFoundError:
+                    raise InvalidConfigurationError(
+                        f"The token file '{path}' of the bot '{entry['name']}' "
+                        "does not exist!"
+                    )
+
+    def run(self) -> None:
+        """
+        Runs all configured bots in a single event loop until the process
+        is interrupted.
+        """
+        asyncio.run(self.start())
+
+    async def start(self) -> None:
+        """
+        Runs all configured bots in the running event loop under a supervisor,
+        which staggers their logins and restarts them with an exponential
+        backoff. The supervisor can be configured in the ``supervisor`` table
+        of the bot configuration.
+
+        Bots with a ``coordinator`` are run by a ``ShardNode`` instead and
+        other bots with ``shards_per_process`` in worker processes by a
+        ``ShardLauncher``. The gateway events of the bots are dispatched to the modules
+        of the module manager, which worker processes load on their own.
+
+        The loaded modules of the module manager are started with
+        ``start_modules`` before the bots, so bots with ``auto_intents``
+        subscribe to the intents of the enabled modules, and stopped with
+        ``stop_modules`` once the bots stopped.
+        """
+        settings = self._get_supervisor_settings()
+
+        if self._module_manager is not None:
+            await self._module_manager.start_modules()
+
+        try:
+            await self._run_bots(settings=settings)
+        finally:
+            if self._module_manager is not None:
+                await self._module_manager.stop_modules()
+
+    async def _run_bots(self, settings: dict[str, float]) -> None:
+        specs = self.get_bot_specs()
+        self._report_intents(specs=specs)
+
+        event_sink = (
+            self._module_manager.dispatch_nowait
+            if self._module_manager is not None
+            else None
+        )
+
+        self._supervisor = BotSupervisor(
+            bots=[
+                spec.create_bot(event_sink=event_sink)
+                for spec in specs
+                if not spec.is_multiprocess() and not spec.is_coordinated()
+            ],
+            **settings,
+        )
+        self._launchers = [
+            ShardLauncher(spec=spec)
+            for spec in specs
+            if spec.is_multiprocess() and not spec.is_coordinated()
+        ]
+        self._nodes = [
+            ShardNode(
+                spec=spec,
+                coordinator=RemoteShardCoordinator.from_address(
+                    spec.coordinator, token=spec.coordinator_token
+                ),
+                max_leases=spec.max_leases,
+                event_sink=event_sink,
+            )
+            for spec in specs
+            if spec.is_coordinated()
+        ]
+
+        loop = asyncio.get_running_loop()
+        handled_signals = []
+        for sig in [signal.SIGINT, signal.SIGTERM]:
+            try:
+                loop.add_signal_handler(sig, self._request_shutdown)
+                handled_signals.append(sig)
+            except (NotImplementedError, RuntimeError):
+                # Signal handlers are not supported on Windows and only
+                # work in the main thread.
+                pass
+
+        try:
+            await asyncio.gather(
+                self._supervisor.run(),
+                *[launcher.run() for launcher in self._launchers],
+                *[node.run() for node in self._nodes],
+            )
+        finally:
+            for sig in handled_signals:
+                loop.remove_signal_handler(sig)
+            self._supervisor = None
+            self._launchers = []
+            self._nodes = []
+
+    def _get_supervisor_settings(self) -> dict[str, float]:
+        settings = (
+            self._bot_configuration["supervisor"]
+            if "supervisor" in self._bot_configuration
+            else {}
+        )
+
+        if not isinstance(settings, dict):
+            raise InvalidConfigurationError(
+                "The 'supervisor' of the bot configuration has to be a table!"
+            )
+
+        for key, value in settings.items():
+            if key not in _SUPERVISOR_SETTINGS:
+                raise InvalidConfigurationError(
+                    f"The supervisor setting '{key}' does not exist! Valid settings "
+                    f"are {', '.join(sorted(_SUPERVISOR_SETTINGS))}."
+                )
+
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise InvalidConfigurationError(
+                    f"The supervisor setting '{key}' has to be a number!"
+                )
+
+            if value < 0:
+                raise InvalidConfigurationError(
+                    f"The supervisor setting '{key}' must not be negative!"
+                )
+
+        return settings
+
+    def _report_intents(self, specs: list[BotSpec]) -> None:
+        requirements = self.get_intent_requirements()
+        if requirements is None:
+            return
+
+        for spec in specs:
+            report = analyze_intents(
+                configured=spec.get_intents(), requirements=requirements
+            )
+
+            for intent, handlers in report.missing.items():
+                _logger.warning(
+                    "The bot '%s' does not have the intent '%s' needed by %s.",
+                    spec.name,
+                    intent,
+                    ", ".join(handlers),
+                )
+
+            if report.unused:
+                _logger.info(
+                    "The bot '%s' subscribes to intents no module needs: %s.",
+                    spec.name,
+                    ", ".join(report.unused),
+                )
+
+    def _request_shutdown(self) -> None:
+        if self._supervisor is not None:
+            self._supervisor.request_shutdown()
+
+        for launcher in self._launchers:
+            launcher.request_shutdown()
+
+        for node in self._nodes:
+            node.request_shutdown()
+
+    async def stop(self) -> None:
+        for launcher in self._launchers:
+            launcher.request_shutdown()
+
+        for node in self._nodes:
+            node.request_shutdown()
+
+        if self._supervisor is not None:
+            await self._supervisor.shutdown()
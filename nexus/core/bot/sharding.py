@@ -0,0 +1,343 @@
+import asyncio
+import logging
+import multiprocessing
+import secrets
+import signal
+import time
+from dataclasses import replace
+from multiprocessing.process import BaseProcess
+from typing import Callable
+
+from nexus.core.bot.spec import BotSpec
+
+__all__ = ["ShardLauncher", "partition_shards", "run_shard_group"]
+
+_logger = logging.getLogger(__name__)
+
+ShardWorker = Callable[[BotSpec, list[int]], None]
+
+
+def partition_shards(shard_count: int, shards_per_process: int) -> list[list[int]]:
+    """
+    Splits the shards of a bot into contiguous groups, one per process.
+
+    Parameters
+    ----------
+
+    shard_count : int
+        The total number of shards.
+
+    shards_per_process : int
+        The maximum number of shards per process.
+
+    Returns
+    -------
+
+    list[list[int]] : The shard IDs of every process.
+    """
+    if shard_count < 1 or shards_per_process < 1:
+        raise ValueError(
+            "The shard count and the shards per process have to be positive!"
+        )
+
+    return [
+        list(range(start, min(start + shards_per_process, shard_count)))
+        for start in range(0, shard_count, shards_per_process)
+    ]
+
+
+def run_shard_group(spec: BotSpec, shard_ids: list[int]) -> None:
+    """
+    The entry point of a worker process, which runs a bot with the given
+    shards until it receives SIGTERM or SIGINT. If the specification has a
+    module configuration, the process loads and starts the modules, which
+    handle the events of its shards. Shards of a specification with a
+    ``coordinator`` acquire their IDENTIFY slots from it.
+    """
+    coordinator = None
+    if spec.coordinator is not None:
+        # Imported here, as the coordination module depends on this one
+        from nexus.core.bot.coordination import RemoteShardCoordinator
+
+        coordinator = RemoteShardCoordinator.from_address(
+            spec.coordinator, token=spec.coordinator_token
+        )
+
+    module_manager = None
+    if spec.module_config is not None:
+        # Imported here, as only worker processes run modules on their own
+        from nexus.core.config.toml import TOMLConfiguration
+        from nexus.core.module.manager import ModuleManager
+
+        module_manager = ModuleManager(
+            module_config=TOMLConfiguration(spec.module_config)
+        )
+
+    bot = spec.create_bot(
+        shard_ids=shard_ids,
+        coordinator=coordinator,
+        event_sink=(
+            module_manager.dispatch_nowait if module_manager is not None else None
+        ),
+    )
+
+    async def main() -> None:
+        loop = asyncio.get_running_loop()
+        for sig in [signal.SIGINT, signal.SIGTERM]:
+            try:
+                loop.add_signal_handler(sig, lambda: loop.create_task(bot.close()))
+            except NotImplementedError:
+                pass
+
+        if module_manager is not None:
+            await module_manager.reload_modules()
+            await module_manager.start_modules()
+
+        try:
+            async with bot:
+                await bot.start(spec.token)
+        finally:
+            if module_manager is not None:
+                await module_manager.shutdown()
+
+    asyncio.run(main())
+
+
+class ShardLauncher:
+    def __init__(
+        self,
+        spec: BotSpec,
+        shard_ids: list[int] | None = None,
+        target: ShardWorker = run_shard_group,
+        backoff_base: float = 1.0,
+        backoff_factor: float = 2.0,
+        backoff_max: float = 300.0,
+        stable_after: float = 60.0,
+        poll_interval: float = 0.5,
+        shutdown_timeout: float = 30.0,
+        identify_interval: float = 5.0,
+        start_method: str = "spawn",
+    ) -> None:
+        """
+        Initializes a launcher, which runs the shards of a bot in a pool of
+        worker processes and restarts crashed workers. Unless the bot has
+        a ``coordinator``, the launcher serves a coordinator to its workers,
+        so their shards share the IDENTIFY rate limit buckets of the bot.
+
+        Parameters
+        ----------
+
+        spec : BotSpec
+            The bot to run. Needs a ``shard_count`` and ``shards_per_process``.
+
+        shard_ids : list[int] | None, optional
+            The shards to run. If ``None``, all shards of the bot are run.
+            Default is ``None``.
+
+        target : Callable[[BotSpec, list[int]], None], optional
+            The function run by every worker process with its shard IDs.
+            It has to be picklable.
+            Default is ``run_shard_group``.
+
+        backoff_base : float, optional
+            The delay in seconds before the first restart of a crashed worker.
+            Default is ``1.0``.
+
+        backoff_factor : float, optional
+            The factor by which the delay grows with every consecutive restart.
+            Default is ``2.0``.
+
+        backoff_max : float, optional
+            The maximum delay in seconds between two restarts.
+            Default is ``300.0``.
+
+        stable_after : float, optional
+            The time in seconds after which a running worker is considered
+            stable, resetting its backoff.
+            Default is ``60.0``.
+
+        poll_interval : float, optional
+            The interval in seconds in which the workers are checked.
+            Default is ``0.5``.
+
+        shutdown_timeout : float, optional
+            The time in seconds a worker has to exit after SIGTERM before it
+            is killed.
+            Default is ``30.0``.
+
+        identify_interval : float, optional
+            The time in seconds between two IDENTIFY in the same rate limit
+            bucket, if the launcher serves the coordinator.
+            Default is ``5.0``.
+
+        start_method : str, optional
+            The multiprocessing start method of the workers.
+            Default is ``"spawn"``.
+
+        """
+        if spec.shard_count is None or spec.shards_per_process is None:
+            raise ValueError(
+                f"The bot '{spec.name}' needs a shard count and "
+                "the shards per process to be launched!"
+            )
+
+        self._spec: BotSpec = spec
+        self._target: ShardWorker = target
+        if shard_ids is None:
+            shard_ids = list(range(spec.shard_count))
+
+        self._groups: list[list[int]] = [
+            [shard_ids[i] for i in group]
+            for group in partition_shards(
+                shard_count=len(shard_ids), shards_per_process=spec.shards_per_process
+            )
+        ]
+
+        self._backoff_base: float = backoff_base
+        self._backoff_factor: float = backoff_factor
+        self._backoff_max: float = backoff_max
+        self._stable_after: float = stable_after
+        self._poll_interval: float = poll_interval
+        self._shutdown_timeout: float = shutdown_timeout
+        self._identify_interval: float = identify_interval
+        self._context = multiprocessing.get_context(start_method)
+
+        self._processes: dict[int, BaseProcess] = {}
+        self._restarts: dict[int, int] = dict.fromkeys(range(len(self._groups)), 0)
+        self._shutdown_event: asyncio.Event | None = None
+
+    def get_groups(self) -> list[list[int]]:
+        return [group.copy() for group in self._groups]
+
+    def get_restarts(self) -> dict[int, int]:
+        """
+        Provides the number of restarts of every worker by its group index.
+
+        Returns
+        -------
+
+        dict[int, int] : The number of restarts by group index.
+        """
+        return self._restarts.copy()
+
+    def get_processes(self) -> dict[int, BaseProcess]:
+        return self._processes.copy()
+
+    def request_shutdown(self) -> None:
+        if self._shutdown_event is not None:
+            self._shutdown_event.set()
+
+    async def run(self) -> None:
+        """
+        Runs all workers until a shutdown is requested or all workers exited
+        on their own. Workers exiting with a non-zero exit code are restarted.
+        """
+        self._shutdown_event = asyncio.Event()
+
+        server = None
+        spec = self._spec
+        if spec.coordinator is None:
+            # Imported here, as the coordination module depends on this one
+            from nexus.core.bot.coordination import (
+                CoordinatorServer,
+                LocalShardCoordinator,
+            )
+
+            token = secrets.token_hex(16)
+            server = CoordinatorServer(
+                coordinator=LocalShardCoordinator(
+                    shard_count=spec.shard_count,
+                    max_concurrency=spec.max_concurrency,
+                    identify_interval=self._identify_interval,
+                ),
+                token=token,
+            )
+            await server.start()
+
+            host, port = server.address
+            spec = replace(spec, coordinator=f"{host}:{port}", coordinator_token=token)
+
+        tasks = [
+            asyncio.create_task(self._supervise(spec=spec, index=index))
+            for index in range(len(self._groups))
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            self.request_shutdown()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._stop_processes()
+
+            if server is not None:
+                await server.close()
+
+    def _is_shutting_down(self) -> bool:
+        return self._shutdown_event is not None and self._shutdown_event.is_set()
+
+    async def _sleep(self, delay: float) -> None:
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _supervise(self, spec: BotSpec, index: int) -> None:
+        shard_ids = self._groups[index]
+
+        attempt = 0
+        while not self._is_shutting_down():
+            process = self._context.Process(
+                target=self._target,
+                args=(spec, shard_ids),
+                name=f"nexus-{self._spec.name}-shards-{shard_ids[0]}-{shard_ids[-1]}",
+                daemon=True,
+            )
+            process.start()
+            self._processes[index] = process
+            started = time.monotonic()
+
+            while process.is_alive() and not self._is_shutting_down():
+                await self._sleep(self._poll_interval)
+
+            if self._is_shutting_down():
+                return
+
+            if process.exitcode == 0:
+                _logger.info("Shards %s of '%s' exited.", shard_ids, self._spec.name)
+                return
+
+            if time.monotonic() - started >= self._stable_after:
+                attempt = 0
+
+            delay = min(
+                self._backoff_base * self._backoff_factor**attempt, self._backoff_max
+            )
+            attempt += 1
+
+            _logger.warning(
+                "Shards %s of '%s' exited with code %s. Restarting in %.1f seconds.",
+                shard_ids,
+                self._spec.name,
+                process.exitcode,
+                delay,
+            )
+            await self._sleep(delay)
+
+            if not self._is_shutting_down():
+                self._restarts[index] += 1
+
+    async def _stop_processes(self) -> None:
+        processes = [p for p in self._processes.values() if p.is_alive()]
+
+        for process in processes:
+            process.terminate()
+
+        def join() -> None:
+            deadline = time.monotonic() + self._shutdown_timeout
+            for process in processes:
+                process.join(timeout=max(0.0, deadline - time.monotonic()))
+                if process.is_alive():
+                    process.kill()
+                    process.join()
+
+        await asyncio.to_thread(join)
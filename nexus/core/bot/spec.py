@@ -0,0 +1,99 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from discord import Intents
+
+from nexus.core.bot.bot import Bot, EventSink, ShardedBot
+from nexus.core.bot.intents import resolve_intents
+
+if TYPE_CHECKING:
+    from nexus.core.bot.coordination import ShardCoordinator
+
+__all__ = ["BotSpec"]
+
+
+@dataclass(frozen=True)
+class BotSpec:
+    name: str
+    token: str
+    intents: list[str] = field(default_factory=list)
+    default_intents: bool = True
+    intent_requirements: list[str] | None = None
+    shard_count: int | None = None
+    shards_per_process: int | None = None
+    coordinator: str | None = None
+    # The secret of the coordinator, if it authenticates requests
+    coordinator_token: str | None = None
+    # The number of IDENTIFY rate limit buckets of the bot, as reported by
+    # Discord as session_start_limit.max_concurrency
+    max_concurrency: int = 1
+    # The maximum number of leases of a node, if the bot has a coordinator
+    max_leases: int | None = None
+    # The module configuration of the service, from which worker processes
+    # load the modules handling the events of their shards
+    module_config: str | None = None
+
+    def is_multiprocess(self) -> bool:
+        return self.shards_per_process is not None
+
+    def is_coordinated(self) -> bool:
+        return self.coordinator is not None
+
+    def get_intents(self) -> Intents:
+        return resolve_intents(
+            intents=self.intents,
+            default_intents=self.default_intents,
+            requirements=self.intent_requirements,
+        )
+
+    def create_bot(
+        self,
+        shard_ids: list[int] | None = None,
+        coordinator: "ShardCoordinator | None" = None,
+        event_sink: EventSink | None = None,
+    ) -> Bot | ShardedBot:
+        """
+        Creates the bot described by this specification. Bots with a shard
+        count are created as ``ShardedBot``.
+
+        Parameters
+        ----------
+
+        shard_ids : list[int] | None, optional
+            The shards the bot connects. If ``None``, all shards are connected.
+            Default is ``None``.
+
+        coordinator : ShardCoordinator | None, optional
+            The coordinator granting IDENTIFY slots to the shards.
+            Default is ``None``.
+
+        event_sink : Callable[[str, dict[str, Any]], None] | None, optional
+            The function receiving every gateway event of the bot.
+            Default is ``None``.
+
+        Returns
+        -------
+
+        Bot | ShardedBot : The created bot.
+        """
+        if self.shard_count is None and shard_ids is None:
+            return Bot(
+                name=self.name,
+                intents=self.intents,
+                default_intents=self.default_intents,
+                token=self.token,
+                intent_requirements=self.intent_requirements,
+                event_sink=event_sink,
+            )
+
+        return ShardedBot(
+            name=self.name,
+            intents=self.intents,
+            default_intents=self.default_intents,
+            token=self.token,
+            intent_requirements=self.intent_requirements,
+            shard_count=self.shard_count,
+            shard_ids=shard_ids,
+            coordinator=coordinator,
+            event_sink=event_sink,
+        )
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from discord import LoginFailure
+
+if TYPE_CHECKING:
+    from nexus.core.bot.bot import Bot
+
+__all__ = ["BotSupervisor"]
+
+_logger = logging.getLogger(__name__)
+
+
+class BotSupervisor:
+    def __init__(
+        self,
+        bots: list["Bot"],
+        login_delay: float = 5.0,
+        backoff_base: float = 1.0,
+        backoff_factor: float = 2.0,
+        backoff_max: float = 300.0,
+    ) -> None:
+        """
+        Initializes a supervisor, which runs several bots in the same event loop.
+
+        Parameters
+        ----------
+
+        bots : list[Bot]
+            The bots to run. Each bot needs a token.
+
+        login_delay : float, optional
+            The time in seconds between the logins of two consecutive bots.
+            Staggering the logins avoids hitting the IDENTIFY rate limit.
+            Default is ``5.0``.
+
+        backoff_base : float, optional
+            The delay in seconds before the first restart of a failed bot.
+            Default is ``1.0``.
+
+        backoff_factor : float, optional
+            The factor by which the delay grows with every consecutive restart.
+            Default is ``2.0``.
+
+        backoff_max : float, optional
+            The maximum delay in seconds between two restarts.
+            Default is ``300.0``.
+
+        """
+        self._bots: list["Bot"] = bots
+        self._login_delay: float = login_delay
+        self._backoff_base: float = backoff_base
+        self._backoff_factor: float = backoff_factor
+        self._backoff_max: float = backoff_max
+
+        self._restarts: dict[str, int] = {bot.name: 0 for bot in bots}
+        self._shutdown_event: asyncio.Event | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    def get_restarts(self) -> dict[str, int]:
+        """
+        Provides the number of restarts of every bot by its name.
+
+        Returns
+        -------
+
+        dict[str, int] : The number of restarts by bot name.
+        """
+        return self._restarts.copy()
+
+    def request_shutdown(self) -> None:
+        """
+        Requests all bots to shut down. Can be called from signal handlers.
+        """
+        if self._shutdown_event is not None:
+            self._shutdown_event.set()
+
+    async def run(self) -> None:
+        """
+        Runs all bots until a shutdown is requested or all bots stopped
+        for good (e.g. because of invalid tokens).
+        """
+        self._shutdown_event = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._supervise(bot=bot, index=index))
+            for index, bot in enumerate(self._bots)
+        ]
+        shutdown_task = asyncio.create_task(self._shutdown_event.wait())
+
+        try:
+            await asyncio.wait(
+                [shutdown_task, asyncio.gather(*self._tasks)],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            shutdown_task.cancel()
+            await self.shutdown()
+
+    async def shutdown(self) -> None:
+        """
+        Closes all bots and waits for their supervision to end.
+        """
+        self.request_shutdown()
+
+        await asyncio.gather(
+            *(bot.close() for bot in self._bots if not bot.is_closed()),
+            return_exceptions=True,
+        )
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _is_shutting_down(self) -> bool:
+        return self._shutdown_event is not None and self._shutdown_event.is_set()
+
+    async def _sleep(self, delay: float) -> None:
+        # Sleeps, but wakes up early if a shutdown is requested
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _supervise(self, bot: "Bot", index: int) -> None:
+        await self._sleep(index * self._login_delay)
+
+        attempt = 0
+        while not self._is_shutting_down():
+            try:
+                await bot.start(bot.token)
+            except LoginFailure:
+                _logger.error("Bot '%s' could not log in. Not restarting.", bot.name)
+                return
+            except Exception:
+                _logger.exception("Bot '%s' crashed.", bot.name)
+
+            if self._is_shutting_down():
+                return
+
+            # Only consecutive failures increase the backoff
+            if bot.is_ready():
+                attempt = 0
+
+            delay = min(
+                self._backoff_base * self._backoff_factor**attempt, self._backoff_max
+            )
+            attempt += 1
+
+            _logger.warning("Restarting bot '%s' in %.1f seconds.", bot.name, delay)
+            await self._sleep(delay)
+
+            if self._is_shutting_down():
+                return
+
+            if not bot.is_closed():
+                await bot.close()
+            bot.clear()
+
+            self._restarts[bot.name] += 1
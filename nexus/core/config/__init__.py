@@ -1,4 +1,11 @@
-from .toml import TOMLConfiguration, MissingKeyPolicy
+from .index import ConfigIndex
+from .toml import CacheInfo, MissingKeyPolicy, TOMLConfiguration
 from .variables import VariableLibrary
 
-__all__ = ["TOMLConfiguration", "MissingKeyPolicy", "VariableLibrary"]
+__all__ = [
+    "TOMLConfiguration",
+    "MissingKeyPolicy",
+    "CacheInfo",
+    "ConfigIndex",
+    "VariableLibrary",
+]
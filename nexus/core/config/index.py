@@ -0,0 +1,94 @@
+from typing import Any, Iterator
+
+__all__ = ["ConfigIndex"]
+
+
+class ConfigIndex:
+    def __init__(self, content: dict[str, Any]) -> None:
+        """
+        Initializes a flattened index of the content of a configuration.
+        Every value is reachable through its dotted key (e.g. ``cli.rich.style``),
+        including the sections themselves.
+
+        Parameters
+        ----------
+
+        content : dict
+            The parsed content of the configuration.
+
+        """
+        self._values: dict[str, Any] = {}
+
+        self._keys: list[str] = []
+        self._leaf_keys: list[str] = []
+
+        # Maps every section to the ranges its descendants occupy in
+        # ``_keys`` and ``_leaf_keys``. Since the keys are stored in
+        # depth-first order, the descendants of a section are contiguous.
+        self._spans: dict[str, tuple[int, int, int, int]] = {}
+
+        self._index(content=content, parent=None)
+
+    def _index(self, content: dict[str, Any], parent: str | None) -> None:
+        for key, value in content.items():
+            full_key = f"{parent}.{key}" if parent is not None else key
+
+            self._values[full_key] = value
+            self._keys.append(full_key)
+
+            if isinstance(value, dict):
+                start, leaf_start = len(self._keys), len(self._leaf_keys)
+                self._index(content=value, parent=full_key)
+                self._spans[full_key] = (
+                    start,
+                    len(self._keys),
+                    leaf_start,
+                    len(self._leaf_keys),
+                )
+            else:
+                self._leaf_keys.append(full_key)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def keys(self, prefix: str | None = None, non_dict_only: bool = False) -> list[str]:
+        """
+        Provides the dotted keys of the index in the order of the configuration.
+
+        Parameters
+        ----------
+
+        prefix : str | None, optional
+            The section whose descendant keys to list. If ``None``,
+            all keys are listed.
+            Default is ``None``.
+
+        non_dict_only : bool, optional
+            Whether only to list the keys of variables and not of sections.
+            Default is ``False``.
+
+        Returns
+        -------
+
+        list[str] : The keys of the index.
+        """
+        keys = self._leaf_keys if non_dict_only else self._keys
+
+        if prefix is None:
+            return keys.copy()
+
+        if prefix not in self._spans:
+            return []
+
+        start, end, leaf_start, leaf_end = self._spans[prefix]
+
+        return keys[leaf_start:leaf_end] if non_dict_only else keys[start:end]
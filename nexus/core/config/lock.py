@@ -0,0 +1,153 @@
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from os import PathLike
+from pathlib import Path
+from typing import Iterator
+
+from nexus.core.exceptions.generic import ConfigLockTimeoutError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+__all__ = ["FileLock"]
+
+
+class _LockState:
+    # The state of a lock file in this process, shared by all its FileLocks
+    def __init__(self) -> None:
+        self.thread_lock: threading.RLock = threading.RLock()
+        self.fd: int | None = None
+        self.exclusive: bool = False
+        self.depth: int = 0
+
+
+# Resolved path -> state of the lock file. flock locks belong to the open
+# file description, so two descriptors of the same file in one process
+# would block each other.
+_STATES: "weakref.WeakValueDictionary[Path, _LockState]" = weakref.WeakValueDictionary()
+_STATES_LOCK = threading.Lock()
+
+
+class FileLock:
+    def __init__(
+        self, path: PathLike | str, timeout: float = 10.0, poll_interval: float = 0.01
+    ) -> None:
+        """
+        Initializes an advisory lock based on a lock file, which can be held
+        shared by several readers or exclusively by a single writer.
+        The lock is reentrant within a thread and all locks on the same file
+        in a process share their state, so they reenter each other instead
+        of blocking. On platforms without ``fcntl``, only threads of the
+        same process are synchronized.
+
+        Upgrading a shared lock to an exclusive one is not atomic, as the
+        shared lock is released before the exclusive one is granted. If the
+        upgrade times out, the shared lock is acquired again.
+
+        Parameters
+        ----------
+
+        path : PathLike | str
+            The path to the lock file. It is created if it does not exist.
+
+        timeout : float, optional
+            The maximum time in seconds to wait for the lock.
+            Default is ``10.0``.
+
+        poll_interval : float, optional
+            The time in seconds between two attempts to acquire the lock.
+            Default is ``0.01``.
+
+        """
+        self._path: Path = Path(path)
+        self._timeout: float = timeout
+        self._poll_interval: float = poll_interval
+
+        key = self._path.resolve()
+        with _STATES_LOCK:
+            state = _STATES.get(key)
+            if state is None:
+                state = _STATES[key] = _LockState()
+
+        self._state: _LockState = state
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        self.acquire(exclusive=False)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        self.acquire(exclusive=True)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def is_locked(self) -> bool:
+        return self._state.depth > 0
+
+    def acquire(self, exclusive: bool) -> None:
+        deadline = time.monotonic() + self._timeout
+
+        if not self._state.thread_lock.acquire(timeout=self._timeout):
+            raise ConfigLockTimeoutError(
+                f"Could not acquire the lock '{self._path}' within {self._timeout}s!"
+            )
+
+        try:
+            # Nested acquisitions only need to upgrade a shared lock
+            if self._state.depth == 0 or (exclusive and not self._state.exclusive):
+                self._lock_file(exclusive=exclusive, deadline=deadline)
+                self._state.exclusive = exclusive
+        except BaseException:
+            self._state.thread_lock.release()
+            raise
+
+        self._state.depth += 1
+
+    def release(self) -> None:
+        self._state.depth -= 1
+
+        if self._state.depth == 0 and self._state.fd is not None:
+            fcntl.flock(self._state.fd, fcntl.LOCK_UN)
+            os.close(self._state.fd)
+            self._state.fd = None
+            self._state.exclusive = False
+
+        self._state.thread_lock.release()
+
+    def _lock_file(self, exclusive: bool, deadline: float) -> None:
+        if fcntl is None:
+            return
+
+        if self._state.fd is None:
+            self._state.fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+
+        operation = (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB
+
+        while True:
+            try:
+                fcntl.flock(self._state.fd, operation)
+                return
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    if self._state.depth == 0:
+                        os.close(self._state.fd)
+                        self._state.fd = None
+                    else:
+                        # A failed upgrade may have released the shared lock
+                        fcntl.flock(self._state.fd, fcntl.LOCK_SH)
+                    raise ConfigLockTimeoutError(
+                        f"Could not acquire the lock '{self._path}' "
+                        f"within {self._timeout}s!"
+                    )
+                time.sleep(self._poll_interval)
@@ -1,14 +1,64 @@
+import asyncio
+import copy
+import os
+import tempfile
+import threading
 import tomllib
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager, nullcontext
 from enum import Enum
 from os import PathLike
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, ContextManager, Iterator, NamedTuple
 
 import tomli_w
 
-from nexus.core.exceptions.generic import InvalidConfigurationError
+from nexus.core.config.index import ConfigIndex
+from nexus.core.config.lock import FileLock
+from nexus.core.exceptions.generic import (
+    ConfigLockTimeoutError,
+    InvalidConfigurationError,
+)
 
-__all__ = ["TOMLConfiguration", "MissingKeyPolicy"]
+__all__ = ["TOMLConfiguration", "MissingKeyPolicy", "CacheInfo"]
+
+
+# Event loop -> resolved path -> lock serializing the asynchronous writes
+# to the file. asyncio locks can only be used in a single event loop.
+_ASYNC_LOCKS: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Path, asyncio.Lock]]"
+) = weakref.WeakKeyDictionary()
+
+# Marks a key for deletion, including tables, in ``_set_value``
+_DELETED = object()
+
+# The thread and, if any, the task running a transaction
+_Owner = tuple[int, "asyncio.Task | None"]
+
+
+def _read_umask() -> int:
+    # Setting the umask is the only portable way to read it, which changes
+    # it for all threads for a moment, so it is only done once on import
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+def _get_umask() -> int:
+    # Linux reports the current umask of the process without changing it
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except OSError:
+        pass
+
+    return _UMASK
 
 
 class MissingKeyPolicy(Enum):
@@ -16,12 +66,20 @@ class MissingKeyPolicy(Enum):
     RETURN_NONE = 2
 
 
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+
+
 class TOMLConfiguration:
     def __init__(
         self,
         path: PathLike | str,
         create_if_not_exists: bool = False,
         missing_key_policy: MissingKeyPolicy = MissingKeyPolicy.ERROR,
+        cached: bool = False,
+        locking: bool = False,
+        lock_timeout: float = 10.0,
     ):
         """
         Initializes a new TOML configuration.
@@ -40,6 +98,23 @@ class TOMLConfiguration:
             The policy to react to missing keys.
             Default is ``MissingKeyPolicy.ERROR`` meaning that an error will be raised.
 
+        cached : bool, optional
+            Whether to keep the parsed content of the file in memory. The file is
+            only parsed again if its stat signature (modification time, size and
+            inode) changes.
+            Default is ``False``.
+
+        locking : bool, optional
+            Whether to synchronize the access to the file with other processes
+            using an advisory lock on a ``<name>.toml.lock`` file next to it.
+            Readers hold a shared lock, writers and transactions an exclusive one.
+            Default is ``False``.
+
+        lock_timeout : float, optional
+            The maximum time in seconds to wait for the lock before a
+            ``ConfigLockTimeoutError`` is raised.
+            Default is ``10.0``.
+
         """
 
         self._path: Path = Path(path)
@@ -59,6 +134,64 @@ class TOMLConfiguration:
             else MissingKeyPolicy[missing_key_policy]
         )
 
+        self._cached: bool = cached
+        self._cache: dict[str, Any] | None = None
+        self._cache_signature: tuple[int, int, int] | None = None
+        self._cache_hits: int = 0
+        self._cache_misses: int = 0
+
+        self._index: ConfigIndex | None = None
+        self._index_source: dict[str, Any] | None = None
+
+        self._lock: FileLock | None = (
+            FileLock(
+                self._path.with_name(f"{self._path.name}.lock"), timeout=lock_timeout
+            )
+            if locking
+            else None
+        )
+
+        # Transactions are owned by the thread or task which began them.
+        # Others wait for the transaction to finish instead of joining it.
+        self._transaction_content: dict[str, Any] | None = None
+        self._transaction_depth: int = 0
+        self._transaction_dirty: bool = False
+        self._transaction_owner: _Owner | None = None
+        self._transaction_lock: threading.Lock = threading.Lock()
+        self._lock_timeout: float = lock_timeout
+
+    @property
+    def cached(self) -> bool:
+        """
+        Whether the parsed content of the file is kept in memory.
+        """
+        return self._cached
+
+    @cached.setter
+    def cached(self, value: bool) -> None:
+        self._cached = value
+        self.invalidate_cache()
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Provides the statistics of the content cache.
+
+        Returns
+        -------
+
+        CacheInfo : The number of cache hits and misses.
+        """
+        return CacheInfo(hits=self._cache_hits, misses=self._cache_misses)
+
+    def invalidate_cache(self) -> None:
+        """
+        Drops the cached content, forcing the next read to parse the file again.
+        """
+        self._cache = None
+        self._cache_signature = None
+        self._index = None
+        self._index_source = None
+
     def create(self) -> None:
         """
         Creates an empty TOML file at the config path.
@@ -79,7 +212,15 @@ class TOMLConfiguration:
         return self._path.exists() and self._path.is_file()
 
     def __getitem__(self, key: str) -> Any:
-        content = self.asdict()
+        if self._cached and not self._owns_transaction():
+            index = self._get_index()
+
+            if key not in index:
+                return self._handle_missing_key(key=key)
+
+            return self._detach(index[key])
+
+        content = self._read()
 
         keys = key.split(".")
 
@@ -89,7 +230,7 @@ class TOMLConfiguration:
 
             content = content[key]
 
-        return content
+        return self._detach(content)
 
     def _handle_missing_key(self, key: str) -> None:
         match self._missing_key_policy:
@@ -99,8 +240,23 @@ class TOMLConfiguration:
                 return None
 
     def __setitem__(self, key: str, value: Any) -> None:
-        content = self.asdict()
-
+        if not self._owns_transaction():
+            # A single modification is a transaction on its own, so the
+            # read-modify-write cycle happens under one exclusive lock.
+            with self.transaction():
+                self[key] = value
+            return
+
+        self._set_value(self._transaction_content, key=key, value=value)
+        self._transaction_dirty = True
+        self._index = None
+
+    def __delitem__(self, key: str) -> None:
+        # Unlike setting a key to None, this also deletes tables
+        self[key] = _DELETED
+
+    @staticmethod
+    def _set_value(content: dict[str, Any], key: str, value: Any) -> None:
         keys = key.split(".")
 
         content_dict = content
@@ -109,7 +265,7 @@ class TOMLConfiguration:
                 raise KeyError(f"Invalid key: '{key}'")
 
             if kidx == len(keys) - 1:
-                if key in content_dict:
+                if key in content_dict and value is not _DELETED:
                     if (
                         isinstance(content_dict[key], dict)
                         and not isinstance(value, dict)
@@ -122,32 +278,34 @@ class TOMLConfiguration:
                             "same of the current value!"
                         )
 
-                if value is not None:
-                    content_dict[key] = value
-                else:
+                if value is None or value is _DELETED:
                     del content_dict[key]
+                else:
+                    content_dict[key] = value
             else:
                 content_dict = content_dict[key]
 
-        with open(self._path, "wb") as tomlf:
-            tomli_w.dump(content, tomlf)
-
     def __contains__(self, key: str) -> bool:
         if not self.exists():
             return False
 
-        content = self.asdict()
+        if self._cached and not self._owns_transaction():
+            return key in self._get_index()
+
+        content = self._read()
         keys = key.split(".")
 
         for key in keys:
-            if key not in content:
+            if not isinstance(content, dict) or key not in content:
                 return False
 
             content = content[key]
 
         return True
 
-    def get_keys(self, non_dict_only: bool = False) -> list[str]:
+    def get_keys(
+        self, non_dict_only: bool = False, prefix: str | None = None
+    ) -> list[str]:
         """
         Provides a list of all keys in the configuration file.
 
@@ -157,28 +315,31 @@ class TOMLConfiguration:
         non_dict_only : bool, optional
             Whether only to show the keys for variables and not for
             sections of the configuration file.
-            Default is ``True``.
+            Default is ``False``.
+
+        prefix : str | None, optional
+            A section (e.g. ``cli.rich``) whose descendant keys to list.
+            If ``None``, all keys of the file are listed.
+            Default is ``None``.
 
         Returns
         -------
 
-        list[str] : A list of keys in the file.
+        list[str] : A list of dotted keys in the file.
 
         """
+        return self._get_index().keys(prefix=prefix, non_dict_only=non_dict_only)
 
-        def recursive_keys(dictionary: dict, parent: str | None = None) -> list[str]:
-            keys = []
-            for key, value in dictionary.items():
-                parent_key = f"{parent}.{key}" if parent is not None else key
-                if isinstance(value, dict):
-                    if not non_dict_only:
-                        keys.append(key)
-                    keys.extend(recursive_keys(dictionary=value, parent=parent_key))
-                else:
-                    keys.append(parent_key)
-            return keys
+    def _get_index(self) -> ConfigIndex:
+        content = self._read()
+
+        # The index is built once per parsed content. In cached mode, the
+        # content object stays the same until the file changes.
+        if self._index is None or self._index_source is not content:
+            self._index = ConfigIndex(content)
+            self._index_source = content
 
-        return recursive_keys(dictionary=self.asdict())
+        return self._index
 
     def asdict(self) -> dict[str, Any]:
         """
@@ -189,14 +350,62 @@ class TOMLConfiguration:
 
         dict : The content of the TOML file.
         """
-        with open(self._path, "rb") as tomlf:
-            content = tomllib.load(tomlf)
+        return self._detach(self._read())
+
+    def _read(self) -> dict[str, Any]:
+        """
+        Provides the parsed content of the file. In cached mode and during
+        transactions the returned dictionary is shared and must not be modified.
+        """
+        if self._owns_transaction():
+            return self._transaction_content
+
+        if not self._cached:
+            return self._parse()
+
+        signature = self._stat_signature()
+
+        if self._cache is not None and signature == self._cache_signature:
+            self._cache_hits += 1
+            return self._cache
+
+        self._cache_misses += 1
+        self._cache = self._parse()
+        self._cache_signature = signature
+
+        return self._cache
+
+    def _parse(self) -> dict[str, Any]:
+        with self._locked(exclusive=False):
+            with open(self._path, "rb") as tomlf:
+                content = tomllib.load(tomlf)
 
         return content
 
+    def _locked(self, exclusive: bool) -> ContextManager[None]:
+        if self._lock is None:
+            return nullcontext()
+
+        return self._lock.exclusive() if exclusive else self._lock.shared()
+
+    def _stat_signature(self) -> tuple[int, int, int]:
+        stat = os.stat(self._path)
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _detach(self, value: Any) -> Any:
+        # Values taken from the cache or a pending transaction are shared,
+        # so mutable containers are copied before they are handed out.
+        if (self._cached or self._owns_transaction()) and isinstance(
+            value, (dict, list)
+        ):
+            return copy.deepcopy(value)
+        return value
+
     def dump(self, content: dict[str, Any]) -> None:
         """
         Dumps the given dictionary as content into the TOML file.
+        Inside of a transaction, the content is only written once the
+        transaction is committed.
 
         Parameters
         ----------
@@ -204,5 +413,327 @@ class TOMLConfiguration:
         content : dict
             The content to dump into the file.
         """
-        with open(self._path, "wb") as tomlf:
-            tomli_w.dump(content, tomlf)
+        if self._owns_transaction():
+            self._transaction_content = copy.deepcopy(content)
+            self._transaction_dirty = True
+            return
+
+        with self._locked(exclusive=True):
+            self._write(content)
+
+    @contextmanager
+    def transaction(self) -> Iterator["TOMLConfiguration"]:
+        """
+        Groups several modifications of the configuration into a single write.
+        All set and delete operations inside of the context are applied to an
+        in-memory copy of the content, which is written to the file once the
+        outermost transaction exits without an exception. If an exception
+        occurs, all pending modifications are discarded. With locking enabled,
+        the exclusive lock is held for the whole transaction.
+
+        The transaction belongs to the thread or task which began it. Other
+        threads wait up to the lock timeout for it to finish. Other tasks of
+        the same thread can not wait without blocking the owner, so they
+        raise a ``ConfigLockTimeoutError`` and have to use ``aset`` or
+        ``atransaction`` instead.
+
+        Returns
+        -------
+
+        TOMLConfiguration : The configuration itself.
+
+        Examples
+        --------
+
+        >>> with config.transaction():
+        ...     config["cli.color_palette"] = "mocha"
+        ...     del config["cli.rich"]
+        """
+        self._begin_transaction()
+
+        try:
+            yield self
+        except BaseException:
+            self._rollback_transaction()
+            raise
+
+        self._commit_transaction()
+
+    def in_transaction(self) -> bool:
+        """
+        Checks whether the current thread or task is in a transaction.
+
+        Returns
+        -------
+
+        bool : Whether a transaction is active.
+        """
+        return self._owns_transaction()
+
+    async def aget(self, key: str) -> Any:
+        """
+        Asynchronous variant of ``config[key]``, which reads the file in
+        a worker thread instead of blocking the event loop.
+
+        Parameters
+        ----------
+
+        key : str
+            The key to get the value of.
+
+        Returns
+        -------
+
+        Any : The value of the key.
+        """
+        if self._owns_transaction():
+            return self[key]
+
+        return await asyncio.to_thread(self.__getitem__, key)
+
+    async def acontains(self, key: str) -> bool:
+        """
+        Asynchronous variant of ``key in config``, which reads the file in
+        a worker thread instead of blocking the event loop.
+
+        Parameters
+        ----------
+
+        key : str
+            The key to check.
+
+        Returns
+        -------
+
+        bool : Whether the key exists.
+        """
+        if self._owns_transaction():
+            return key in self
+
+        return await asyncio.to_thread(self.__contains__, key)
+
+    async def aset(self, key: str, value: Any) -> None:
+        """
+        Asynchronous variant of ``config[key] = value``, which writes the file
+        in a worker thread instead of blocking the event loop. Asynchronous
+        writes to the same file are serialized. A value of ``None`` deletes
+        the key.
+
+        Parameters
+        ----------
+
+        key : str
+            The key to set.
+
+        value : Any
+            The value to set.
+
+        """
+        if self._owns_transaction():
+            self[key] = value
+            return
+
+        async with self._get_async_lock():
+            await asyncio.to_thread(self.__setitem__, key, value)
+
+    @asynccontextmanager
+    async def atransaction(self) -> AsyncIterator["TOMLConfiguration"]:
+        """
+        Asynchronous variant of ``transaction``. The file is read and written
+        in a worker thread and the transaction waits for other asynchronous
+        writes to the same file to finish. Inside of the context, the
+        modifications are only applied in memory, so ``config[key] = value``
+        does not block the event loop.
+
+        Returns
+        -------
+
+        TOMLConfiguration : The configuration itself.
+
+        Examples
+        --------
+
+        >>> async with config.atransaction():
+        ...     config["cli.color_palette"] = "mocha"
+        ...     await config.aset("cli.rich", None)
+        """
+        if self._owns_transaction():
+            with self.transaction():
+                yield self
+            return
+
+        # The file lock belongs to the thread which acquired it, so the
+        # transaction begins and ends in the same worker thread
+        async with self._get_async_lock():
+            loop = asyncio.get_running_loop()
+            executor = ThreadPoolExecutor(max_workers=1)
+
+            begin = loop.run_in_executor(
+                executor, self._begin_transaction, self._get_owner()
+            )
+            try:
+                await asyncio.shield(begin)
+            except BaseException:
+                # The worker thread can not be interrupted, so a cancelled
+                # begin is undone once it finished
+                begin.add_done_callback(
+                    lambda future: self._undo_begin(future=future, executor=executor)
+                )
+                raise
+
+            try:
+                try:
+                    yield self
+                except BaseException:
+                    await loop.run_in_executor(executor, self._rollback_transaction)
+                    raise
+
+                await loop.run_in_executor(executor, self._commit_transaction)
+            finally:
+                # Does not block the event loop if the task was cancelled
+                # while the worker thread is still committing
+                executor.shutdown(wait=False)
+
+    def _undo_begin(self, future: asyncio.Future, executor: ThreadPoolExecutor) -> None:
+        if not future.cancelled() and future.exception() is None:
+            executor.submit(self._rollback_transaction)
+
+        executor.shutdown(wait=False)
+
+    @staticmethod
+    def _get_owner() -> _Owner:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+
+        return threading.get_ident(), task
+
+    def _owns_transaction(self) -> bool:
+        return (
+            self._transaction_owner is not None
+            and self._transaction_owner == self._get_owner()
+        )
+
+    def _get_async_lock(self) -> asyncio.Lock:
+        locks = _ASYNC_LOCKS.setdefault(asyncio.get_running_loop(), {})
+        return locks.setdefault(self._path.resolve(), asyncio.Lock())
+
+    def _begin_transaction(self, owner: _Owner | None = None) -> None:
+        owner = owner if owner is not None else self._get_owner()
+
+        if self._transaction_depth > 0 and self._transaction_owner == owner:
+            self._transaction_depth += 1
+            return
+
+        self._acquire_transaction_lock(owner=owner)
+
+        try:
+            if self._lock is not None:
+                self._lock.acquire(exclusive=True)
+
+            try:
+                self._transaction_content = self.asdict()
+            except BaseException:
+                self._release_lock()
+                raise
+        except BaseException:
+            self._transaction_lock.release()
+            raise
+
+        self._transaction_dirty = False
+        self._transaction_owner = owner
+        self._transaction_depth = 1
+        self._index = None
+
+    def _acquire_transaction_lock(self, owner: _Owner) -> None:
+        current = self._transaction_owner
+        if current is not None and current[0] == owner[0]:
+            raise ConfigLockTimeoutError(
+                f"The configuration '{self._path}' is in a transaction of "
+                "another task of this thread!"
+            )
+
+        if not self._transaction_lock.acquire(timeout=self._lock_timeout):
+            raise ConfigLockTimeoutError(
+                f"The configuration '{self._path}' is in a transaction, which "
+                f"did not finish within {self._lock_timeout}s!"
+            )
+
+    def _commit_transaction(self) -> None:
+        self._transaction_depth -= 1
+
+        if self._transaction_depth > 0:
+            return
+
+        content = self._transaction_content
+        dirty = self._transaction_dirty
+        self._end_transaction()
+
+        try:
+            if dirty:
+                self._write(content)
+        finally:
+            self._release_lock()
+            self._transaction_lock.release()
+
+    def _rollback_transaction(self) -> None:
+        self._transaction_depth -= 1
+
+        if self._transaction_depth == 0:
+            self._end_transaction()
+            self._release_lock()
+            self._transaction_lock.release()
+
+    def _end_transaction(self) -> None:
+        self._transaction_content = None
+        self._transaction_owner = None
+
+    def _release_lock(self) -> None:
+        if self._lock is not None:
+            self._lock.release()
+
+    def _write(self, content: dict[str, Any]) -> None:
+        # The content is written to a temporary file in the same directory,
+        # which is then renamed over the original file. This way, readers
+        # never observe a partially written file.
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self._path.parent, prefix=f".{self._path.name}.", suffix=".tmp"
+        )
+
+        try:
+            with os.fdopen(fd, "wb") as tomlf:
+                tomli_w.dump(content, tomlf)
+                tomlf.flush()
+                os.fsync(tomlf.fileno())
+
+            try:
+                os.chmod(tmp_path, os.stat(self._path).st_mode & 0o7777)
+            except FileNotFoundError:
+                # mkstemp creates the file with 0o600, a new file gets the
+                # permissions open() would have given it
+                os.chmod(tmp_path, 0o666 & ~_get_umask())
+
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self._fsync_directory()
+
+        if self._cached:
+            self._cache = copy.deepcopy(content)
+            self._cache_signature = self._stat_signature()
+            self._index = None
+            self._index_source = None
+
+    def _fsync_directory(self) -> None:
+        # Persists the rename itself. Directories cannot be opened on Windows.
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+
+        dir_fd = os.open(self._path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
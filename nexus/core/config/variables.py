@@ -2,13 +2,22 @@
 # Copyright (c) 2026 Tom Groß
 
 
+import copy
 from pathlib import Path
 from typing import Any
 
-from mergedeep import merge
-
 from .toml import TOMLConfiguration
 
+_DEFAULT_VARIABLES: dict[str, Any] = {
+    "cli": {
+        "color_palette": "latte",
+        "rich": {"palette": "solarized", "style": "box"},
+    },
+    "exceptions": {
+        "show_locals": False,
+    },
+}
+
 
 class VariableLibrary:
     _instance = None
@@ -23,41 +32,62 @@ class VariableLibrary:
             return
         self._initialized = True
 
+        # Nothing is written here. The defaults are merged with the content
+        # of the file in memory and only written by generate() or
+        # set_variable().
         self._path: Path = Path.home() / ".nexus/config/variables.toml"
-        self._config = TOMLConfiguration(self._path, create_if_not_exists=True)
+        self._config = TOMLConfiguration(self._path, cached=True)
 
-        self.generate(regenerate=False)
+        # The merged content is kept until the parsed content of the file,
+        # which stays the same object while the file is unchanged, changes.
+        self._merged: dict[str, Any] | None = None
+        self._merged_source: dict[str, Any] | None = None
 
     def generate(self, regenerate: bool = False) -> None:
         self._path.parent.mkdir(exist_ok=True, parents=True)
 
-        if regenerate:
-            self._path.unlink(missing_ok=True)
-
-        if not self.exists():
-            self._path.touch()
+        if regenerate or not self.exists():
+            self._config.dump(copy.deepcopy(_DEFAULT_VARIABLES))
+            return
 
         current_content = self._config.asdict()
+        content = self._merge_defaults(current_content)
+
+        if content != current_content:
+            self._config.dump(content)
+
+    def _merge_defaults(self, content: dict[str, Any]) -> dict[str, Any]:
+        from mergedeep import merge
+
+        return dict(merge({}, _DEFAULT_VARIABLES, content))
 
-        content = {
-            "cli": {
-                "color_palette": "latte",
-                "rich": {"palette": "solarized", "style": "box"},
-            },
-            "exceptions": {
-                "show_locals": False,
-            },
-        }
+    def _content(self) -> dict[str, Any]:
+        """
+        Provides the defaults merged with the content of the file. The
+        returned dictionary is shared and must not be modified.
+        """
+        try:
+            content = self._config._read()
+        except FileNotFoundError:
+            return _DEFAULT_VARIABLES
 
-        self._config.dump(
-            content if regenerate else dict(merge({}, content, current_content))
-        )
+        if self._merged is None or self._merged_source is not content:
+            self._merged = self._merge_defaults(content)
+            self._merged_source = content
+
+        return self._merged
 
     @classmethod
     def get_config(cls) -> TOMLConfiguration:
         instance = cls()
+        instance.generate(regenerate=False)
         return instance._config
 
+    @classmethod
+    def set_cached(cls, cached: bool) -> None:
+        instance = cls()
+        instance._config.cached = cached
+
     @classmethod
     def get_path(cls) -> Path:
         instance = cls()
@@ -66,11 +96,19 @@ class VariableLibrary:
     @classmethod
     def get_variable(cls, key: str) -> Any:
         instance = cls()
-        return instance._config[key]
+
+        value = instance._content()
+        for subkey in key.split("."):
+            if not isinstance(value, dict) or subkey not in value:
+                raise KeyError(f"Invalid key: '{subkey}'")
+            value = value[subkey]
+
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
 
     @classmethod
     def set_variable(cls, key: str, value: Any) -> None:
         instance = cls()
+        instance.generate(regenerate=False)
         instance._config[key] = value
 
     @classmethod
@@ -0,0 +1,306 @@
+import asyncio
+import inspect
+import logging
+import os
+import tomllib
+from dataclasses import dataclass
+from os import PathLike
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from nexus.core.config.index import ConfigIndex
+
+__all__ = ["ConfigWatcher", "ConfigSubscription"]
+
+_logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+ConfigChangeCallback = Callable[[Path, set[str]], Awaitable[None] | None]
+
+
+@dataclass(frozen=True, eq=False)
+class ConfigSubscription:
+    callback: ConfigChangeCallback
+    path: Path | None = None
+    prefix: str | None = None
+
+    def matches(self, path: Path) -> bool:
+        if self.path is None:
+            return True
+        return path == self.path or self.path in path.parents
+
+    def filter_keys(self, keys: set[str]) -> set[str]:
+        if self.prefix is None:
+            return keys
+        return {
+            key
+            for key in keys
+            if key == self.prefix or key.startswith(f"{self.prefix}.")
+        }
+
+
+class ConfigWatcher:
+    def __init__(
+        self,
+        root: PathLike | str,
+        pattern: str = "**/*.toml",
+        interval: float = 1.0,
+        debounce: float = 0.2,
+        max_wait: float = 2.0,
+    ) -> None:
+        """
+        Initializes a watcher for the TOML files in a directory tree.
+        The watcher polls the stat signatures of the files from the running
+        event loop, while all file system access happens in a worker thread.
+
+        Parameters
+        ----------
+
+        root : PathLike | str
+            The root directory of the watched tree (e.g. the service directory).
+
+        pattern : str, optional
+            The glob pattern of the watched files relative to the root.
+            Default is ``"**/*.toml"``.
+
+        interval : float, optional
+            The polling interval in seconds.
+            Default is ``1.0``.
+
+        debounce : float, optional
+            The time in seconds a changed file has to stay untouched before
+            its changes are reported. Bursts of writes are coalesced into a
+            single notification.
+            Default is ``0.2``.
+
+        max_wait : float, optional
+            The maximum time in seconds changes are coalesced. Files which are
+            written more often than the debounce time are reported after it.
+            Default is ``2.0``.
+
+        """
+        self._root: Path = Path(root).resolve()
+        self._pattern: str = pattern
+        self._interval: float = interval
+        self._debounce: float = debounce
+        self._max_wait: float = max_wait
+
+        self._signatures: dict[Path, tuple[int, int, int]] = {}
+        self._snapshots: dict[Path, ConfigIndex] = {}
+        self._subscriptions: list[ConfigSubscription] = []
+
+        self._task: asyncio.Task | None = None
+
+    def subscribe(
+        self,
+        callback: ConfigChangeCallback,
+        path: PathLike | str | None = None,
+        prefix: str | None = None,
+    ) -> ConfigSubscription:
+        """
+        Subscribes a callback to changes of the watched files.
+
+        Parameters
+        ----------
+
+        callback : Callable[[Path, set[str]], Awaitable[None] | None]
+            The function or coroutine function to call with the path of the
+            changed file and the dotted keys that changed.
+
+        path : PathLike | str | None, optional
+            The file or directory to restrict the subscription to.
+            If ``None``, changes of all watched files are reported.
+            Default is ``None``.
+
+        prefix : str | None, optional
+            The section (e.g. ``cli.rich``) to restrict the reported keys to.
+            Default is ``None``.
+
+        Returns
+        -------
+
+        ConfigSubscription : The subscription, which can be passed to ``unsubscribe``.
+        """
+        subscription = ConfigSubscription(
+            callback=callback,
+            path=Path(path).resolve() if path is not None else None,
+            prefix=prefix,
+        )
+        self._subscriptions.append(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: ConfigSubscription) -> None:
+        self._subscriptions.remove(subscription)
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """
+        Takes the initial snapshot of the watched files and starts polling
+        in the background of the running event loop.
+        """
+        if self.is_running():
+            return
+
+        await asyncio.to_thread(self._take_initial_snapshot)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+
+    async def poll(self) -> dict[Path, set[str]]:
+        """
+        Checks the watched files for changes once and notifies the subscribers.
+
+        Returns
+        -------
+
+        dict[Path, set[str]] : The changed files and their changed keys.
+        """
+        signatures = await asyncio.to_thread(self._scan)
+        changed = {
+            path
+            for path in signatures.keys() | self._signatures.keys()
+            if signatures.get(path) != self._signatures.get(path)
+        }
+
+        if not changed:
+            return {}
+
+        # Wait until the files stopped changing to coalesce bursts of writes,
+        # but not longer than the maximum wait
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._max_wait
+
+        while True:
+            await asyncio.sleep(self._debounce)
+            settled = await asyncio.to_thread(self._scan)
+
+            if all(settled.get(path) == signatures.get(path) for path in changed):
+                break
+
+            changed |= {
+                path
+                for path in settled.keys() | signatures.keys()
+                if settled.get(path) != signatures.get(path)
+            }
+            signatures = settled
+
+            if loop.time() >= deadline:
+                break
+
+        changes = await asyncio.to_thread(self._diff, changed, signatures)
+
+        for path, keys in changes.items():
+            await self._notify(path=path, keys=keys)
+
+        return changes
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+
+            try:
+                await self.poll()
+            except Exception:
+                _logger.exception("Failed to check %s for changes", self._root)
+
+    def _take_initial_snapshot(self) -> None:
+        self._signatures = self._scan()
+        self._snapshots = {}
+
+        for path in self._signatures:
+            index = self._load(path)
+            if index is not None:
+                self._snapshots[path] = index
+
+    def _scan(self) -> dict[Path, tuple[int, int, int]]:
+        signatures = {}
+
+        for path in self._root.glob(self._pattern):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+
+            signatures[path] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        return signatures
+
+    def _load(self, path: Path) -> ConfigIndex | None:
+        try:
+            with open(path, "rb") as tomlf:
+                return ConfigIndex(tomllib.load(tomlf))
+        except FileNotFoundError:
+            return ConfigIndex({})
+        except tomllib.TOMLDecodeError:
+            _logger.warning("Ignoring invalid TOML file %s", path)
+            return None
+
+    def _diff(
+        self, paths: set[Path], signatures: dict[Path, tuple[int, int, int]]
+    ) -> dict[Path, set[str]]:
+        changes = {}
+
+        for path in paths:
+            new = self._load(path)
+
+            # Invalid files keep their previous snapshot. Their signature is
+            # recorded, so they are only parsed again once they are modified.
+            if new is None:
+                if path in signatures:
+                    self._signatures[path] = signatures[path]
+                else:
+                    self._signatures.pop(path, None)
+                continue
+
+            old = self._snapshots.get(path, ConfigIndex({}))
+            keys = {
+                key
+                for key in set(old) | set(new)
+                if self._value(old, key) != self._value(new, key)
+            }
+
+            if path in signatures:
+                self._signatures[path] = signatures[path]
+                self._snapshots[path] = new
+            else:
+                self._signatures.pop(path, None)
+                self._snapshots.pop(path, None)
+
+            if keys:
+                changes[path] = keys
+
+        return changes
+
+    @staticmethod
+    def _value(index: ConfigIndex, key: str) -> Any:
+        return index[key] if key in index else _MISSING
+
+    async def _notify(self, path: Path, keys: set[str]) -> None:
+        for subscription in list(self._subscriptions):
+            if not subscription.matches(path):
+                continue
+
+            subscribed_keys = subscription.filter_keys(keys)
+            if not subscribed_keys:
+                continue
+
+            try:
+                result = subscription.callback(path, subscribed_keys)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                _logger.exception("Config change callback failed for %s", path)
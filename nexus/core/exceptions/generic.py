@@ -1,6 +1,20 @@
-__all__ = ["InvalidConfigurationError"]
+__all__ = [
+    "InvalidConfigurationError",
+    "ConfigLockTimeoutError",
+    "ShardCoordinationError",
+]
 
 
 class InvalidConfigurationError(Exception):
     def __init__(self, message: str) -> None:
         super().__init__(message)
+
+
+class ConfigLockTimeoutError(Exception):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+
+
+class ShardCoordinationError(Exception):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
@@ -1,4 +1,17 @@
-from .module import Module
+from .events import EventClassifier, EventDispatcher, EventPriority, listener
+from .lifecycle import LifecycleReport, LifecycleStatus
 from .manager import ModuleManager
+from .module import Module
+from .offload import offload
 
-__all__ = ["Module", "ModuleManager"]
+__all__ = [
+    "EventClassifier",
+    "EventDispatcher",
+    "EventPriority",
+    "LifecycleReport",
+    "LifecycleStatus",
+    "Module",
+    "ModuleManager",
+    "listener",
+    "offload",
+]
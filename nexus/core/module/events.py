@@ -0,0 +1,312 @@
+import asyncio
+import logging
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Mapping, TypeVar
+
+from nexus.core.config.toml import TOMLConfiguration
+from nexus.core.exceptions.generic import InvalidConfigurationError
+
+if TYPE_CHECKING:
+    from nexus.core.module.module import Module
+    from nexus.core.module.queue import ModuleQueue
+
+__all__ = [
+    "listener",
+    "normalize_event",
+    "EventPriority",
+    "DEFAULT_PRIORITIES",
+    "EventClassifier",
+    "EventDispatcher",
+]
+
+_logger = logging.getLogger(__name__)
+
+EventHandler = Callable[..., Awaitable[None]]
+_F = TypeVar("_F", bound=Callable[..., Awaitable[None]])
+
+
+def normalize_event(event: str) -> str:
+    """
+    Normalizes the name of a gateway event (e.g. ``message_create`` to
+    ``MESSAGE_CREATE``).
+    """
+    return event.strip().upper()
+
+
+def listener(*events: str) -> Callable[[_F], _F]:
+    """
+    Marks a coroutine method of a module as handler of one or more
+    gateway events.
+
+    Parameters
+    ----------
+
+    *events : str
+        The names of the gateway events, e.g. ``"MESSAGE_CREATE"``.
+
+    Returns
+    -------
+
+    Callable : The decorator.
+
+    Examples
+    --------
+
+    >>> class Module(module.Module):
+    ...     @listener("MESSAGE_CREATE")
+    ...     async def on_message(self, message):
+    ...         ...
+
+    """
+    if not events:
+        raise ValueError("A listener needs at least one event!")
+
+    def decorator(func: _F) -> _F:
+        # Stacked decorators add their events to the same handler
+        subscribed = [*getattr(func, "__nexus_events__", ()), *events]
+        func.__nexus_events__ = tuple(dict.fromkeys(map(normalize_event, subscribed)))
+
+        return func
+
+    return decorator
+
+
+class EventPriority(IntEnum):
+    CRITICAL = 0
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+
+# Interactions have to be acknowledged within 3 seconds, while bulk updates
+# can wait. Events which are not listed have the priority NORMAL.
+DEFAULT_PRIORITIES: dict[str, EventPriority] = {
+    "INTERACTION_CREATE": EventPriority.CRITICAL,
+    "AUTO_MODERATION_ACTION_EXECUTION": EventPriority.HIGH,
+    "PRESENCE_UPDATE": EventPriority.LOW,
+    "TYPING_START": EventPriority.LOW,
+    "GUILD_MEMBER_UPDATE": EventPriority.LOW,
+    "GUILD_MEMBERS_CHUNK": EventPriority.LOW,
+    "VOICE_STATE_UPDATE": EventPriority.LOW,
+}
+
+
+class EventClassifier:
+    def __init__(
+        self, priorities: Mapping[str, EventPriority | str] | None = None
+    ) -> None:
+        """
+        Initializes a classifier, which assigns a priority class to every
+        gateway event.
+
+        Parameters
+        ----------
+
+        priorities : Mapping[str, EventPriority | str] | None, optional
+            The priorities overriding ``DEFAULT_PRIORITIES``. Priorities can
+            be given by name (e.g. ``"critical"``).
+            Default is ``None``.
+
+        """
+        self._priorities: dict[str, EventPriority] = DEFAULT_PRIORITIES.copy()
+
+        for event, priority in (priorities or {}).items():
+            if isinstance(priority, str):
+                try:
+                    priority = EventPriority[priority.upper()]
+                except KeyError:
+                    raise ValueError(f"The event priority '{priority}' does not exist!")
+
+            self._priorities[normalize_event(event)] = priority
+
+    @classmethod
+    def from_config(cls, config: TOMLConfiguration) -> "EventClassifier":
+        """
+        Creates a classifier from the ``priorities`` table of a configuration,
+        which maps gateway events to ``"critical"``, ``"high"``, ``"normal"``
+        or ``"low"``.
+
+        Parameters
+        ----------
+
+        config : TOMLConfiguration
+            The configuration.
+
+        Returns
+        -------
+
+        EventClassifier : The classifier.
+        """
+        priorities = (
+            config["priorities"] if config.exists() and "priorities" in config else {}
+        )
+
+        try:
+            return cls(priorities=priorities)
+        except (AttributeError, ValueError) as e:
+            raise InvalidConfigurationError(
+                f"The event priorities in '{config._path}' are invalid: {e}"
+            )
+
+    def classify(self, event: str) -> EventPriority:
+        priority = self._priorities.get(event)
+
+        if priority is None:
+            priority = self._priorities.get(
+                normalize_event(event), EventPriority.NORMAL
+            )
+
+        return priority
+
+
+class EventDispatcher:
+    def __init__(self, classifier: EventClassifier | None = None) -> None:
+        """
+        Initializes a dispatcher, which routes gateway events to the handlers
+        of the modules subscribing to them. The handlers are looked up in a
+        table, which is only rebuilt if the set of modules changes.
+
+        Parameters
+        ----------
+
+        classifier : EventClassifier | None, optional
+            The classifier assigning the priority with which events are
+            queued. If ``None``, the default priorities are used.
+            Default is ``None``.
+
+        """
+        self._classifier: EventClassifier = classifier or EventClassifier()
+        # Event -> (handler, queue of its module)
+        self._table: dict[
+            str, tuple[tuple[EventHandler, "ModuleQueue | None"], ...]
+        ] = {}
+        # Handlers called by dispatch_nowait, which must not be collected
+        self._tasks: set[asyncio.Task] = set()
+
+    def rebuild(self, modules: Iterable["Module"]) -> None:
+        """
+        Rebuilds the dispatch table from the listeners of the given modules.
+        Events of modules with a queue are put into it instead of being
+        handled directly.
+
+        Parameters
+        ----------
+
+        modules : Iterable[Module]
+            The enabled modules in the order their handlers are called.
+
+        """
+        table: dict[str, list[tuple[EventHandler, "ModuleQueue | None"]]] = {}
+
+        for module in modules:
+            queue = module.get_queue()
+            for event, handlers in module.get_listeners().items():
+                table.setdefault(event, []).extend(
+                    (handler, queue) for handler in handlers
+                )
+
+        # The table is swapped as a whole, so dispatching events never
+        # sees a partially built table
+        self._table = {event: tuple(routes) for event, routes in table.items()}
+
+    def set_classifier(self, classifier: EventClassifier) -> None:
+        self._classifier = classifier
+
+    def get_classifier(self) -> EventClassifier:
+        return self._classifier
+
+    def get_events(self) -> set[str]:
+        """
+        Provides the events with at least one handler.
+
+        Returns
+        -------
+
+        set[str] : The names of the events.
+        """
+        return set(self._table)
+
+    def get_handlers(self, event: str) -> tuple[EventHandler, ...]:
+        return tuple(
+            handler for handler, _ in self._table.get(normalize_event(event), ())
+        )
+
+    async def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
+        """
+        Puts an event into the queues of the modules handling it and calls
+        the handlers of modules without a queue. An exception in a handler is
+        logged and does not prevent the other handlers from being called.
+        Putting an event into a queue never waits, so a full queue only holds
+        back the events of its own module (see ``ModuleQueue.put_nowait``).
+
+        Parameters
+        ----------
+
+        event : str
+            The name of the gateway event.
+
+        *args : Any
+            The positional arguments passed to the handlers.
+
+        **kwargs : Any
+            The keyword arguments passed to the handlers.
+
+        """
+        for handler in self._route(event=event, args=args, kwargs=kwargs):
+            await self._call(handler, event, *args, **kwargs)
+
+    def dispatch_nowait(self, event: str, *args: Any, **kwargs: Any) -> None:
+        """
+        Dispatches an event like ``dispatch`` from synchronous code, e.g.
+        the gateway parser of a bot. The handlers of modules without a queue
+        are called in tasks of their own.
+
+        Parameters
+        ----------
+
+        event : str
+            The name of the gateway event.
+
+        *args : Any
+            The positional arguments passed to the handlers.
+
+        **kwargs : Any
+            The keyword arguments passed to the handlers.
+
+        """
+        for handler in self._route(event=event, args=args, kwargs=kwargs):
+            task = asyncio.create_task(self._call(handler, event, *args, **kwargs))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _route(
+        self, event: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> list[EventHandler]:
+        # Queues the event and returns the handlers to call directly
+        routes = self._table.get(event) or self._table.get(normalize_event(event), ())
+        if not routes:
+            return []
+
+        priority = self._classifier.classify(event)
+        direct = []
+
+        for handler, queue in routes:
+            if queue is None:
+                direct.append(handler)
+            else:
+                queue.put_nowait(handler, args=args, kwargs=kwargs, priority=priority)
+
+        return direct
+
+    @staticmethod
+    async def _call(
+        handler: EventHandler, event: str, *args: Any, **kwargs: Any
+    ) -> None:
+        try:
+            await handler(*args, **kwargs)
+        except Exception:
+            _logger.exception(
+                "The handler '%s' of the event '%s' failed.",
+                handler.__qualname__,
+                event,
+            )
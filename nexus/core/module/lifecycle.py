@@ -0,0 +1,124 @@
+import graphlib
+from dataclasses import dataclass, field
+from enum import Enum
+
+__all__ = ["LifecycleStatus", "ModuleTiming", "LifecycleReport", "get_levels"]
+
+
+class LifecycleStatus(Enum):
+    OK = "ok"
+    FAILED = "failed"
+    TIMEOUT = "timeout"
+    SKIPPED = "skipped"
+
+
+@dataclass(frozen=True)
+class ModuleTiming:
+    """
+    The outcome of the ``setup`` or ``teardown`` of a module.
+
+    Attributes
+    ----------
+
+    name : str
+        The name of the module.
+
+    level : int
+        The dependency level the module was run in.
+
+    duration : float
+        The time in seconds the hook took.
+
+    status : LifecycleStatus
+        Whether the hook succeeded, failed, timed out or was skipped because
+        a dependency failed.
+
+    error : str | None
+        The error raised by the hook.
+
+    """
+
+    name: str
+    level: int
+    duration: float
+    status: LifecycleStatus
+    error: str | None = None
+
+
+@dataclass
+class LifecycleReport:
+    """
+    The timing breakdown of starting or stopping modules.
+
+    Attributes
+    ----------
+
+    timings : list[ModuleTiming]
+        The outcome of every module in the order the hooks finished.
+
+    duration : float
+        The total time in seconds.
+
+    """
+
+    timings: list[ModuleTiming] = field(default_factory=list)
+    duration: float = 0.0
+
+    def get_failed(self) -> list[str]:
+        return [
+            timing.name
+            for timing in self.timings
+            if timing.status is not LifecycleStatus.OK
+        ]
+
+    def format(self) -> str:
+        """
+        Formats the breakdown as a table with the slowest modules first.
+
+        Returns
+        -------
+
+        str : The formatted breakdown.
+        """
+        width = max([len(timing.name) for timing in self.timings] + [6])
+
+        lines = [f"{'Module':<{width}}  Level  Duration  Status"]
+        for timing in sorted(self.timings, key=lambda timing: -timing.duration):
+            line = (
+                f"{timing.name:<{width}}  {timing.level:>5}  "
+                f"{timing.duration * 1e3:>6.1f}ms  {timing.status.value}"
+            )
+            if timing.error is not None:
+                line += f" ({timing.error})"
+            lines.append(line)
+
+        lines.append(f"{'Total':<{width}}  {'':>5}  {self.duration * 1e3:>6.1f}ms")
+        return "\n".join(lines)
+
+
+def get_levels(graph: dict[str, set[str]]) -> list[list[str]]:
+    """
+    Groups the nodes of a dependency graph into levels. The nodes of a level
+    only depend on nodes of earlier levels.
+
+    Parameters
+    ----------
+
+    graph : dict[str, set[str]]
+        The dependencies of every node.
+
+    Returns
+    -------
+
+    list[list[str]] : The levels.
+    """
+    sorter = graphlib.TopologicalSorter(graph)
+    sorter.prepare()
+
+    levels = []
+    while sorter.is_active():
+        level = sorted(sorter.get_ready())
+        sorter.done(*level)
+        levels.append(level)
+
+    return levels
@@ -1,16 +1,113 @@
+import asyncio
+import graphlib
 import importlib
+import importlib.util
+import logging
+import sys
+import time
 import warnings
+from dataclasses import dataclass
 from pathlib import Path
 
-from nexus import modules
+from nexus.core.bot.intents import get_event_intents
 from nexus.core.config.toml import TOMLConfiguration
+from nexus.core.config.watcher import ConfigWatcher
+from nexus.core.module.events import EventClassifier, EventDispatcher
+from nexus.core.module.lifecycle import (
+    LifecycleReport,
+    LifecycleStatus,
+    ModuleTiming,
+    get_levels,
+)
+from nexus.core.module.manifest import (
+    ManifestEntry,
+    ManifestKey,
+    ModuleManifest,
+    get_source_files,
+)
 from nexus.core.module.module import Module
+from nexus.core.module.offload import ExecutorPool, Offloader, OffloadStats
+from nexus.core.module.queue import ModuleQueue, QueueStats
+
+_logger = logging.getLogger(__name__)
+
+
+def _fingerprint(path: Path) -> int:
+    # Changes if a source file of the module is modified, added or removed
+    signatures = []
+    for file in get_source_files(path):
+        stat = file.stat()
+        signatures.append((str(file), stat.st_mtime_ns, stat.st_size))
+
+    return hash(tuple(sorted(signatures)))
+
+
+def _clear_bytecode(path: Path) -> None:
+    # The bytecode cache is only invalidated by the modification time in
+    # seconds and the size of a source file, which may both stay the same
+    for file in get_source_files(path):
+        try:
+            Path(importlib.util.cache_from_source(str(file))).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+@dataclass
+class _ReloadPlan:
+    # What reload_modules found out before the affected modules are stopped
+    found: dict[str, tuple[Path, ManifestKey]]
+    manifest: dict[str, ManifestEntry]
+    previous_manifest: dict[str, ManifestEntry]
+    known: set[str]
+    imported: dict[str, Module]
+    wanted: set[str]
+    fingerprints: dict[str, int]
+    changed: set[str]
+    affected: set[str]
+    unloaded: list[str]
 
 
 class ModuleManager:
-    def __init__(self, module_config: TOMLConfiguration) -> None:
+    def __init__(
+        self,
+        module_config: TOMLConfiguration,
+        cached_configs: bool = False,
+        package: str = "nexus.modules",
+    ) -> None:
+        """
+        Initializes a manager, which loads the modules of a package and routes
+        gateway events to them.
+
+        Parameters
+        ----------
+
+        module_config : TOMLConfiguration
+            The module configuration of the service.
+
+        cached_configs : bool, optional
+            Whether the configurations of the modules are cached.
+            Default is ``False``.
+
+        package : str, optional
+            The package containing the modules. Every module is a subpackage
+            with a ``module`` submodule defining a ``Module`` class.
+            Default is ``"nexus.modules"``.
+
+        """
         self._modules: dict[str, Module] = {}
         self._module_config: TOMLConfiguration = module_config
+        self._cached_configs: bool = cached_configs
+        self._package: str = package
+
+        # Subpackage -> name of the loaded module
+        self._packages: dict[str, str] = {}
+        # Subpackage -> fingerprint of its source files when it was imported
+        self._fingerprints: dict[str, int] = {}
+        self._manifest: dict[str, ManifestEntry] | None = None
+
+        self._enabled: list[str] = []
+        self._dispatcher: EventDispatcher = EventDispatcher()
+        self._executor_pool: ExecutorPool | None = None
 
     def reset_config(self) -> None:
         self._module_config.dump({"modules": []})
@@ -19,43 +116,702 @@ class ModuleManager:
         for module in self._modules.values():
             module.reset_config()
 
-    def reload_modules(self) -> None:
-        for module in self._modules.values():
-            module.disable()
+    async def reload_modules(self) -> None:
+        """
+        Loads the modules of the module package. Which modules are loaded is
+        decided from a manifest cached in the service directory, so optional
+        modules which are not listed in the module configuration are not
+        imported. Modules whose source files changed since the last call are
+        reloaded with ``importlib.reload``, together with all modules
+        depending on them, with dependencies before their dependents.
+        All other modules keep their state. Reloaded modules which were
+        enabled are stopped with ``stop_modules`` before and started again
+        with ``start_modules`` after the reload.
+
+        The code of the modules is imported in a worker thread, so the event
+        loop keeps dispatching events to the other modules.
+        """
+        plan = await asyncio.to_thread(self._plan_reload)
+
+        reenable = {
+            package
+            for package in plan.unloaded
+            if self.is_enabled(self._packages[package])
+        }
+        if reenable:
+            await self.stop_modules(
+                names=[self._packages[package] for package in reenable]
+            )
 
-        self._modules.clear()
+        restart = await asyncio.to_thread(
+            self._apply_reload, plan=plan, reenable=reenable
+        )
+        if restart:
+            await self.start_modules(names=restart)
 
+    def _plan_reload(self) -> _ReloadPlan:
+        self.load_priorities()
         load_modules = self._module_config["modules"]
-        for module_path in Path(modules.__file__).parent.glob("*"):
-            if not module_path.is_dir() and not module_path.name.startswith("_"):
+
+        found = ModuleManifest.discover(package_dir=self._get_package_dir())
+        manifest = self.get_manifest()
+        previous_manifest = manifest.copy()
+        known = set(self._fingerprints)
+
+        # Only modules without an up-to-date manifest entry are imported
+        # to find out their name, optional flag and dependencies
+        imported: dict[str, Module] = {}
+        for package, (path, key) in sorted(found.items()):
+            if package in self._packages or (
+                package in manifest and manifest[package].key == key
+            ):
                 continue
 
-            module_name = module_path.name
+            if package in known:
+                _clear_bytecode(path)
 
-            try:
-                module = importlib.import_module(
-                    f".{module_name}.module", "nexus.modules"
-                )
+            module = self._load_package(package=package, reload=package in known)
+            self._fingerprints[package] = _fingerprint(path)
 
-                try:
-                    module_obj = getattr(module, "Module")
-                except AttributeError:
-                    warnings.warn(
-                        f"An error occurred while loading module '{module_name}'!"
-                    )
-                    continue
+            if module is None:
+                manifest.pop(package, None)
+                continue
 
-                module_obj = module_obj(
-                    config=TOMLConfiguration(
-                        path=self._module_config._path.parent
-                        / f"config/modules/{module_name}.toml"
-                    )
+            imported[package] = module
+            manifest[package] = ManifestEntry.from_module(
+                package=package, module=module, key=key
+            )
+
+        for package in set(manifest) - set(found):
+            del manifest[package]
+
+        wanted = self._get_wanted_packages(manifest=manifest, load_modules=load_modules)
+        fingerprints = {package: _fingerprint(found[package][0]) for package in wanted}
+
+        changed = {
+            package
+            for package in wanted
+            if fingerprints[package] != self._fingerprints.get(package)
+        }
+
+        # Modules depending on a changed module are reloaded as well,
+        # as they may hold references to its old code
+        affected = self._get_dependents(
+            packages=changed | (set(self._packages) - wanted)
+        )
+        unloaded = self._sort_packages(
+            graph=self._get_graph(packages=affected & set(self._packages))
+        )
+
+        return _ReloadPlan(
+            found=found,
+            manifest=manifest,
+            previous_manifest=previous_manifest,
+            known=known,
+            imported=imported,
+            wanted=wanted,
+            fingerprints=fingerprints,
+            changed=changed,
+            affected=affected,
+            unloaded=unloaded,
+        )
+
+    def _apply_reload(self, plan: _ReloadPlan, reenable: set[str]) -> list[str]:
+        found, manifest, imported = plan.found, plan.manifest, plan.imported
+
+        for package in reversed(plan.unloaded):
+            del self._modules[self._packages.pop(package)]
+
+        for package in plan.changed & plan.known:
+            if package not in imported:
+                _clear_bytecode(found[package][0])
+
+        restart = []
+        graph = {
+            package: set(manifest[package].dependencies) for package in plan.wanted
+        }
+        for package in self._sort_packages(graph=graph):
+            if package not in plan.wanted or package in self._packages:
+                continue
+
+            module = imported.get(package)
+            if module is None or graph[package] & plan.affected:
+                module = self._load_package(
+                    package=package,
+                    reload=package in imported
+                    or (
+                        package in plan.known
+                        and package in plan.affected | plan.changed
+                    ),
                 )
 
-                if not module_obj.is_optional() or module_name in load_modules:
-                    self._modules[module_obj._name] = module_obj
-            except ImportError:
+            self._fingerprints[package] = plan.fingerprints[package]
+            if module is None:
                 continue
 
+            manifest[package] = ManifestEntry.from_module(
+                package=package, module=module, key=found[package][1]
+            )
+
+            missing = [
+                dependency
+                for dependency in module.dependencies
+                if dependency not in self._packages
+            ]
+            if missing:
+                warnings.warn(
+                    f"The module '{package}' is not loaded, as its dependencies "
+                    f"{missing} are not loaded!"
+                )
+                continue
+
+            self._packages[package] = module._name
+            self._modules[module._name] = module
+
+            if package in reenable:
+                restart.append(module._name)
+
+        for package in set(self._fingerprints) - set(found):
+            del self._fingerprints[package]
+
+        self._manifest = manifest
+        if manifest != plan.previous_manifest:
+            self._get_manifest_file().save(entries=manifest)
+
+        return restart
+
+    def get_manifest(self) -> dict[str, ManifestEntry]:
+        """
+        Provides the manifest of the modules of the module package as of the
+        last reload, or as cached in the service directory before the first
+        reload.
+
+        Returns
+        -------
+
+        dict[str, ManifestEntry] : The manifest entries by subpackage.
+        """
+        if self._manifest is None:
+            self._manifest = self._get_manifest_file().load()
+
+        return self._manifest.copy()
+
+    def _get_manifest_file(self) -> ModuleManifest:
+        return ModuleManifest(
+            path=self._module_config._path.parent / ".cache/module_manifest.json",
+            package=self._package,
+        )
+
+    def _get_package_dir(self) -> Path:
+        return Path(importlib.import_module(self._package).__file__).parent
+
+    @staticmethod
+    def _get_wanted_packages(
+        manifest: dict[str, ManifestEntry], load_modules: list[str]
+    ) -> set[str]:
+        # Optional modules are loaded if they are listed in the module
+        # configuration or another loaded module depends on them
+        wanted = {
+            package
+            for package, entry in manifest.items()
+            if not entry.optional or package in load_modules
+        }
+
+        pending = list(wanted)
+        while pending:
+            for dependency in manifest[pending.pop()].dependencies:
+                if dependency in manifest and dependency not in wanted:
+                    wanted.add(dependency)
+                    pending.append(dependency)
+
+        return wanted
+
+    def _load_package(self, package: str, reload: bool) -> Module | None:
+        module_name = f"{self._package}.{package}.module"
+
+        try:
+            if reload and module_name in sys.modules:
+                # Submodules are reloaded first, so the module itself
+                # imports their new code
+                prefix = f"{self._package}.{package}."
+                for name in sorted(sys.modules):
+                    if name.startswith(prefix) and name != module_name:
+                        importlib.reload(sys.modules[name])
+
+                module = importlib.reload(sys.modules[module_name])
+                importlib.reload(sys.modules[f"{self._package}.{package}"])
+            else:
+                module = importlib.import_module(module_name)
+        except ImportError:
+            return None
+        except Exception as e:
+            warnings.warn(f"An error occurred while loading module '{package}': {e}")
+            return None
+
+        try:
+            module_obj = getattr(module, "Module")
+        except AttributeError:
+            warnings.warn(f"An error occurred while loading module '{package}'!")
+            return None
+
+        return module_obj(
+            config=TOMLConfiguration(
+                path=self._module_config._path.parent
+                / f"config/modules/{package}.toml",
+                cached=self._cached_configs,
+            )
+        )
+
+    def _get_graph(self, packages: set[str]) -> dict[str, set[str]]:
+        return {
+            package: set(self._modules[self._packages[package]].dependencies) & packages
+            for package in packages
+        }
+
+    def _get_dependents(self, packages: set[str]) -> set[str]:
+        dependents: dict[str, set[str]] = {}
+        for package, name in self._packages.items():
+            for dependency in self._modules[name].dependencies:
+                dependents.setdefault(dependency, set()).add(package)
+
+        result = set(packages)
+        pending = list(packages)
+        while pending:
+            for dependent in dependents.get(pending.pop(), ()):
+                if dependent not in result:
+                    result.add(dependent)
+                    pending.append(dependent)
+
+        return result
+
+    @staticmethod
+    def _sort_packages(graph: dict[str, set[str]]) -> list[str]:
+        # Sorts the packages with dependencies before their dependents.
+        # Packages in a dependency cycle are left out.
+        graph = {package: set(dependencies) for package, dependencies in graph.items()}
+
+        while True:
+            try:
+                return list(graphlib.TopologicalSorter(graph).static_order())
+            except graphlib.CycleError as e:
+                cycle = set(e.args[1])
+                warnings.warn(f"The modules {sorted(cycle)} depend on each other!")
+
+                graph = {
+                    package: dependencies - cycle
+                    for package, dependencies in graph.items()
+                    if package not in cycle
+                }
+
+    def load_priorities(self) -> None:
+        """
+        Loads the priorities with which events are queued from the
+        ``priorities`` table of the module configuration, e.g.
+        ``INTERACTION_CREATE = "critical"`` or ``PRESENCE_UPDATE = "low"``.
+        """
+        self._dispatcher.set_classifier(
+            EventClassifier.from_config(config=self._module_config)
+        )
+
     def get_module(self, name: str) -> Module:
         return self._modules[name]
+
+    async def enable_module(self, name: str) -> bool:
+        """
+        Enables a loaded module and routes the events it listens to into
+        a queue, which is configured in the ``queue`` table of the module's
+        configuration (see ``ModuleQueue.from_config``). Blocking calls of the
+        module are run in the executors shared by all modules
+        (see ``Offloader.from_config``). The module and the disabled modules
+        it depends on are started with ``start_modules``, so it only receives
+        events once its ``setup`` finished.
+
+        Parameters
+        ----------
+
+        name : str
+            The name of the module.
+
+        Returns
+        -------
+
+        bool : Whether the module is enabled.
+        """
+        await self.start_modules(names=[name])
+        return self.is_enabled(name)
+
+    async def disable_module(self, name: str) -> None:
+        """
+        Disables a module and the enabled modules depending on it, stops
+        routing events to them and runs their ``teardown`` with
+        ``stop_modules``. Events waiting in their queues are dropped and
+        their offloaded calls are cancelled.
+
+        Parameters
+        ----------
+
+        name : str
+            The name of the module.
+
+        """
+        await self.stop_modules(names=[name])
+
+    def is_enabled(self, name: str) -> bool:
+        return name in self._enabled
+
+    async def start_modules(self, names: list[str] | None = None) -> LifecycleReport:
+        """
+        Enables modules and runs their ``setup`` hooks. The modules of a
+        dependency level are set up concurrently, after all of their
+        dependencies. A module only receives events once its setup finished.
+        If a setup fails or exceeds the ``timeout`` of the ``lifecycle``
+        table of the module's configuration (default 30 seconds), the module
+        and the modules depending on it stay disabled.
+
+        Parameters
+        ----------
+
+        names : list[str] | None, optional
+            The modules to start, which are started together with the
+            disabled modules they depend on. If ``None``, all loaded modules
+            are started.
+            Default is ``None``.
+
+        Returns
+        -------
+
+        LifecycleReport : The timing breakdown per module.
+        """
+        if names is not None:
+            names = self._get_closure(names=names, dependents=False)
+
+        names = [
+            name
+            for name in (names if names is not None else self._modules)
+            if name not in self._enabled
+        ]
+
+        report = LifecycleReport()
+        start = time.perf_counter()
+        failed: set[str] = set()
+
+        for level, level_names in enumerate(self._get_levels(names=names)):
+            runnable = []
+            for name in level_names:
+                if self._get_dependency_names(name=name) & failed:
+                    failed.add(name)
+                    report.timings.append(
+                        ModuleTiming(
+                            name=name,
+                            level=level,
+                            duration=0.0,
+                            status=LifecycleStatus.SKIPPED,
+                        )
+                    )
+                else:
+                    runnable.append(name)
+
+            timings = await asyncio.gather(
+                *(
+                    self._run_hook(name=name, level=level, setup=True)
+                    for name in runnable
+                )
+            )
+
+            for timing in timings:
+                report.timings.append(timing)
+
+                if timing.status is LifecycleStatus.OK:
+                    self._enabled.append(timing.name)
+                else:
+                    failed.add(timing.name)
+
+            self._rebuild_dispatcher()
+
+        report.duration = time.perf_counter() - start
+        _logger.info("Started modules:\n%s", report.format())
+
+        return report
+
+    async def stop_modules(self, names: list[str] | None = None) -> LifecycleReport:
+        """
+        Disables modules and runs their ``teardown`` hooks. Modules are torn
+        down before their dependencies and the modules of a dependency level
+        concurrently. Each teardown is limited by the ``timeout`` of the
+        ``lifecycle`` table of the module's configuration.
+
+        Parameters
+        ----------
+
+        names : list[str] | None, optional
+            The modules to stop, which are stopped together with the enabled
+            modules depending on them. If ``None``, all enabled modules are
+            stopped.
+            Default is ``None``.
+
+        Returns
+        -------
+
+        LifecycleReport : The timing breakdown per module.
+        """
+        if names is not None:
+            names = self._get_closure(names=names, dependents=True)
+
+        names = [
+            name
+            for name in (names if names is not None else self._enabled)
+            if name in self._enabled
+        ]
+
+        report = LifecycleReport()
+        start = time.perf_counter()
+
+        levels = self._get_levels(names=names)
+        for level, level_names in reversed(list(enumerate(levels))):
+            for name in level_names:
+                self._enabled.remove(name)
+            self._rebuild_dispatcher()
+
+            report.timings.extend(
+                await asyncio.gather(
+                    *(
+                        self._run_hook(name=name, level=level, setup=False)
+                        for name in level_names
+                    )
+                )
+            )
+
+        report.duration = time.perf_counter() - start
+        _logger.info("Stopped modules:\n%s", report.format())
+
+        return report
+
+    async def _run_hook(self, name: str, level: int, setup: bool) -> ModuleTiming:
+        module = self._modules[name]
+        settings = (
+            module._config["lifecycle"]
+            if module._config.exists() and "lifecycle" in module._config
+            else {}
+        )
+        timeout = settings.get("timeout", 30.0)
+
+        status, error = LifecycleStatus.OK, None
+        start = time.perf_counter()
+
+        try:
+            if setup:
+                # An invalid queue or offload configuration fails the module
+                self._activate_module(name=name)
+
+            hook = module.setup() if setup else module.teardown()
+            await asyncio.wait_for(hook, timeout=timeout)
+        except asyncio.TimeoutError:
+            status, error = LifecycleStatus.TIMEOUT, f"exceeded {timeout}s"
+        except Exception as e:
+            status, error = LifecycleStatus.FAILED, repr(e)
+            _logger.exception(
+                "The %s of the module '%s' failed.",
+                "setup" if setup else "teardown",
+                name,
+            )
+
+        duration = time.perf_counter() - start
+
+        if not setup or status is not LifecycleStatus.OK:
+            self._deactivate_module(name=name)
+
+        return ModuleTiming(
+            name=name, level=level, duration=duration, status=status, error=error
+        )
+
+    def _activate_module(self, name: str) -> None:
+        module = self._modules[name]
+
+        queue = ModuleQueue.from_config(name=name, config=module._config)
+        offloader = Offloader.from_config(
+            name=name, pool=self.get_executor_pool(), config=module._config
+        )
+
+        module.enable()
+        module._queue = queue
+        module._offloader = offloader
+
+    def _deactivate_module(self, name: str) -> None:
+        module = self._modules[name]
+
+        self._close_queue(module=module)
+        self._close_offloader(module=module)
+        module.disable()
+
+    def _get_dependency_names(self, name: str) -> set[str]:
+        return {
+            self._packages[dependency]
+            for dependency in self._modules[name].dependencies
+            if dependency in self._packages
+        }
+
+    def _get_closure(self, names: list[str], dependents: bool) -> list[str]:
+        # Adds the loaded modules the given ones depend on or the enabled
+        # modules depending on them
+        if dependents:
+            edges: dict[str, set[str]] = {}
+            for name in self._enabled:
+                for dependency in self._get_dependency_names(name=name):
+                    edges.setdefault(dependency, set()).add(name)
+        else:
+            edges = {
+                name: self._get_dependency_names(name=name) for name in self._modules
+            }
+
+        result = list(dict.fromkeys(names))
+        pending = list(result)
+        while pending:
+            for name in edges.get(pending.pop(), ()):
+                if name not in result:
+                    result.append(name)
+                    pending.append(name)
+
+        return result
+
+    def _get_levels(self, names: list[str]) -> list[list[str]]:
+        selected = set(names)
+        return get_levels(
+            graph={
+                name: self._get_dependency_names(name=name) & selected for name in names
+            }
+        )
+
+    def get_queue_stats(self) -> dict[str, QueueStats]:
+        """
+        Provides the state of the queues of the enabled modules.
+
+        Returns
+        -------
+
+        dict[str, QueueStats] : The queue statistics by module name.
+        """
+        return {
+            name: self._modules[name].get_queue().get_stats()
+            for name in self._enabled
+            if self._modules[name].get_queue() is not None
+        }
+
+    def get_offload_stats(self) -> dict[str, OffloadStats]:
+        """
+        Provides the work the enabled modules offloaded to the executors.
+
+        Returns
+        -------
+
+        dict[str, OffloadStats] : The offload statistics by module name.
+        """
+        return {
+            name: self._modules[name].get_offloader().get_stats()
+            for name in self._enabled
+            if self._modules[name].get_offloader() is not None
+        }
+
+    def get_executor_pool(self) -> ExecutorPool:
+        """
+        Provides the executors shared by all modules, configured in the
+        ``executors`` table of the module configuration.
+        """
+        if self._executor_pool is None:
+            self._executor_pool = ExecutorPool.from_config(config=self._module_config)
+
+        return self._executor_pool
+
+    async def shutdown(self) -> None:
+        """
+        Stops all modules with ``stop_modules`` and shuts the shared executors
+        down.
+        """
+        await self.stop_modules()
+
+        if self._executor_pool is not None:
+            self._executor_pool.shutdown()
+            self._executor_pool = None
+
+    def get_dispatcher(self) -> EventDispatcher:
+        return self._dispatcher
+
+    async def dispatch(self, event: str, *args, **kwargs) -> None:
+        """
+        Dispatches a gateway event to the enabled modules listening to it.
+        See ``EventDispatcher.dispatch``.
+        """
+        await self._dispatcher.dispatch(event, *args, **kwargs)
+
+    def dispatch_nowait(self, event: str, *args, **kwargs) -> None:
+        """
+        Dispatches a gateway event from synchronous code, e.g. as the event
+        sink of a bot. See ``EventDispatcher.dispatch_nowait``.
+        """
+        self._dispatcher.dispatch_nowait(event, *args, **kwargs)
+
+    def get_intent_requirements(self) -> dict[str, set[str]]:
+        """
+        Provides the intents needed by the enabled modules, derived from the
+        events they listen to and their ``required_intents``.
+
+        Returns
+        -------
+
+        dict[str, set[str]] : The required intents with the handlers
+        (or modules) needing them.
+        """
+        requirements: dict[str, set[str]] = {}
+
+        for name in self._enabled:
+            module = self._modules[name]
+
+            for event, handlers in module.get_listeners().items():
+                for intent in get_event_intents(event):
+                    requirements.setdefault(intent, set()).update(
+                        f"{name}.{handler.__name__} ({event})" for handler in handlers
+                    )
+
+            for intent in module.required_intents:
+                requirements.setdefault(intent, set()).add(name)
+
+        return requirements
+
+    @staticmethod
+    def _close_queue(module: Module) -> None:
+        if module.get_queue() is not None:
+            module.get_queue().close()
+            module._queue = None
+
+    @staticmethod
+    def _close_offloader(module: Module) -> None:
+        if module.get_offloader() is not None:
+            module.get_offloader().close()
+            module._offloader = None
+
+    def _rebuild_dispatcher(self) -> None:
+        self._dispatcher.rebuild(
+            modules=[self._modules[name] for name in self._enabled]
+        )
+
+    def watch(self, watcher: ConfigWatcher) -> None:
+        watcher.subscribe(
+            callback=self._on_manager_config_change, path=self._module_config._path
+        )
+        watcher.subscribe(
+            callback=self._on_module_config_change,
+            path=self._module_config._path.parent / "config/modules",
+        )
+
+    async def on_config_change(self, keys: set[str]) -> None:
+        if "modules" in keys:
+            await self.reload_modules()
+        elif any(key.split(".")[0] == "priorities" for key in keys):
+            self.load_priorities()
+
+    async def _on_manager_config_change(self, path: Path, keys: set[str]) -> None:
+        await self.on_config_change(keys=keys)
+
+    def _on_module_config_change(self, path: Path, keys: set[str]) -> None:
+        for module in self._modules.values():
+            if module._config._path.resolve() == path:
+                module.on_config_change(keys=keys)
@@ -0,0 +1,237 @@
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nexus.core.module.module import Module
+
+__all__ = ["ManifestEntry", "ModuleManifest", "get_source_files"]
+
+# Increased if the format of the manifest changes
+_MANIFEST_VERSION = 2
+
+# A hash of the paths, modification times and sizes of all source files of
+# a module, so editing, adding or removing any of them invalidates the entry
+ManifestKey = str
+
+
+def get_source_files(path: Path) -> list[Path]:
+    """
+    Finds the Python source files of a module package, including those of
+    its subpackages.
+
+    Parameters
+    ----------
+
+    path : Path
+        The directory of the module package.
+
+    Returns
+    -------
+
+    list[Path] : The source files.
+    """
+    files = []
+    for root, dirs, names in os.walk(path):
+        dirs[:] = [name for name in dirs if name != "__pycache__"]
+        files.extend(Path(root) / name for name in names if name.endswith(".py"))
+
+    return files
+
+
+def _get_key(path: Path) -> ManifestKey:
+    signatures = []
+    for file in get_source_files(path):
+        stat = file.stat()
+        signatures.append(
+            f"{file.relative_to(path).as_posix()}:{stat.st_mtime_ns}:{stat.st_size}"
+        )
+
+    return hashlib.blake2b(
+        "\n".join(sorted(signatures)).encode(), digest_size=16
+    ).hexdigest()
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """
+    What is known about a module without importing it.
+
+    Attributes
+    ----------
+
+    package : str
+        The subpackage of the module.
+
+    name : str
+        The name of the module.
+
+    optional : bool
+        Whether the module is only loaded if it is listed in the module
+        configuration.
+
+    dependencies : tuple[str, ...]
+        The subpackages of the modules it depends on.
+
+    events : tuple[str, ...]
+        The gateway events it listens to.
+
+    key : str
+        The hash of the signatures of its source files the entry is valid for.
+
+    """
+
+    package: str
+    name: str
+    optional: bool
+    dependencies: tuple[str, ...]
+    events: tuple[str, ...]
+    key: ManifestKey
+
+    @classmethod
+    def from_module(
+        cls, package: str, module: "Module", key: ManifestKey
+    ) -> "ManifestEntry":
+        return cls(
+            package=package,
+            name=module._name,
+            optional=module.is_optional(),
+            dependencies=tuple(module.dependencies),
+            events=tuple(sorted(module._listeners)),
+            key=key,
+        )
+
+
+class ModuleManifest:
+    def __init__(self, path: Path, package: str) -> None:
+        """
+        Initializes the manifest of the modules of a package, which is cached
+        in a JSON file.
+
+        Parameters
+        ----------
+
+        path : Path
+            The path to the cache file.
+
+        package : str
+            The package containing the modules.
+
+        """
+        self._path: Path = path
+        self._package: str = package
+
+    @staticmethod
+    def discover(package_dir: Path) -> dict[str, tuple[Path, ManifestKey]]:
+        """
+        Finds the modules in a package directory. A module is a directory,
+        whose name does not start with ``_`` or ``.``, containing a
+        ``module.py``.
+
+        Parameters
+        ----------
+
+        package_dir : Path
+            The directory of the package.
+
+        Returns
+        -------
+
+        dict[str, tuple[Path, ManifestKey]] : The directory and key of every
+        module by its subpackage.
+        """
+        packages = {}
+
+        with os.scandir(package_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(("_", ".")) or not entry.is_dir():
+                    continue
+
+                if not os.path.isfile(os.path.join(entry.path, "module.py")):
+                    continue
+
+                path = Path(entry.path)
+                packages[entry.name] = (path, _get_key(path))
+
+        return packages
+
+    def load(self) -> dict[str, ManifestEntry]:
+        """
+        Reads the cached entries. If the cache does not exist or belongs to
+        another package, no entries are returned.
+
+        Returns
+        -------
+
+        dict[str, ManifestEntry] : The entries by subpackage.
+        """
+        try:
+            content = json.loads(self._path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+        if (
+            content.get("version") != _MANIFEST_VERSION
+            or content.get("package") != self._package
+        ):
+            return {}
+
+        try:
+            return {
+                package: ManifestEntry(
+                    package=package,
+                    name=entry["name"],
+                    optional=entry["optional"],
+                    dependencies=tuple(entry["dependencies"]),
+                    events=tuple(entry["events"]),
+                    key=entry["key"],
+                )
+                for package, entry in content["modules"].items()
+            }
+        except (KeyError, TypeError):
+            return {}
+
+    def save(self, entries: dict[str, ManifestEntry]) -> None:
+        """
+        Writes the entries to the cache. Failing to write the cache is not
+        an error, as it is only used to speed up the discovery.
+
+        Parameters
+        ----------
+
+        entries : dict[str, ManifestEntry]
+            The entries by subpackage.
+
+        """
+        content = {
+            "version": _MANIFEST_VERSION,
+            "package": self._package,
+            "modules": {
+                package: {
+                    key: value
+                    for key, value in asdict(entry).items()
+                    if key != "package"
+                }
+                for package, entry in sorted(entries.items())
+            },
+        }
+
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._path.parent, prefix=f".{self._path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as file:
+                    json.dump(content, file, indent=2)
+
+                os.replace(tmp_path, self._path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError:
+            pass
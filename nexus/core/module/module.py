@@ -1,8 +1,36 @@
+from typing import Any, Callable, TypeVar
+
 from nexus.core.bot import Bot
 from nexus.core.config.toml import TOMLConfiguration
+from nexus.core.module.events import EventHandler
+from nexus.core.module.offload import ExecutorKind, Offloader
+from nexus.core.module.queue import ModuleQueue
+
+_T = TypeVar("_T")
 
 
 class Module:
+    # Intents a module needs beyond the events it listens to,
+    # e.g. ``message_content``
+    required_intents: tuple[str, ...] = ()
+
+    # Packages of the modules this module depends on. They are loaded and
+    # enabled before this module and reloading them reloads this module.
+    dependencies: tuple[str, ...] = ()
+
+    # Event name -> names of the methods handling it
+    _listeners: dict[str, tuple[str, ...]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        listeners: dict[str, list[str]] = {}
+        for attribute in dir(cls):
+            for event in getattr(getattr(cls, attribute), "__nexus_events__", ()):
+                listeners.setdefault(event, []).append(attribute)
+
+        cls._listeners = {event: tuple(names) for event, names in listeners.items()}
+
     def __init__(self, name: str, optional: bool, config: TOMLConfiguration) -> None:
         self._name: str = name
         self._optional: bool = optional
@@ -10,6 +38,8 @@ class Module:
 
         self._config: TOMLConfiguration = config
         self._bots: list[Bot] = []
+        self._queue: ModuleQueue | None = None
+        self._offloader: Offloader | None = None
 
     def reset_config(self) -> None:
         self._config.create()
@@ -24,6 +54,58 @@ class Module:
     def disable(self) -> None:
         self._enabled = False
 
+    async def setup(self) -> None:
+        """
+        Prepares the module (e.g. warms caches or opens connections) once it
+        is enabled by ``ModuleManager.start_modules``. The module only
+        receives events after the setup finished.
+        """
+
+    async def teardown(self) -> None:
+        """
+        Releases the resources of the module once it is disabled by
+        ``ModuleManager.stop_modules``.
+        """
+
+    def on_config_change(self, keys: set[str]) -> None:
+        pass
+
+    def get_queue(self) -> ModuleQueue | None:
+        return self._queue
+
+    def get_offloader(self) -> Offloader | None:
+        return self._offloader
+
+    async def run_offloaded(
+        self,
+        func: Callable[..., _T],
+        *args: Any,
+        kind: ExecutorKind | str = ExecutorKind.THREAD,
+        **kwargs: Any,
+    ) -> _T:
+        """
+        Runs a blocking function in the executors shared by the service,
+        so it does not block the event loop. See ``Offloader.run``.
+        """
+        if self._offloader is None:
+            raise RuntimeError(f"The module '{self._name}' is not enabled!")
+
+        return await self._offloader.run(func, *args, kind=kind, **kwargs)
+
+    def get_listeners(self) -> dict[str, list[EventHandler]]:
+        """
+        Provides the handlers of this module marked with ``listener``.
+
+        Returns
+        -------
+
+        dict[str, list[EventHandler]] : The bound handlers by event name.
+        """
+        return {
+            event: [getattr(self, name) for name in names]
+            for event, names in self._listeners.items()
+        }
+
     def add_bot(self, bot: Bot) -> None:
         self._bots.append(bot)
 
@@ -0,0 +1,404 @@
+import asyncio
+import importlib
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial, wraps
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+from nexus.core.config.toml import TOMLConfiguration
+from nexus.core.exceptions.generic import InvalidConfigurationError
+
+if TYPE_CHECKING:
+    from nexus.core.module.module import Module
+
+__all__ = [
+    "ExecutorKind",
+    "OffloadStats",
+    "ExecutorPool",
+    "Offloader",
+    "offload",
+]
+
+_T = TypeVar("_T")
+
+# The modification time and size of the source of a Python module
+_SourceSignature = tuple[int, int] | None
+
+# The source signatures of the modules imported by this worker process
+_IMPORTED: dict[str, _SourceSignature] = {}
+
+
+class ExecutorKind(Enum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+@dataclass(frozen=True)
+class OffloadStats:
+    """
+    A snapshot of the work a module offloaded to the executors.
+
+    Attributes
+    ----------
+
+    submitted : int
+        The number of calls submitted.
+
+    running : int
+        The number of calls running in an executor.
+
+    completed : int
+        The number of calls which returned.
+
+    failed : int
+        The number of calls which raised an exception.
+
+    cancelled : int
+        The number of calls which were cancelled.
+
+    busy_time : float
+        The total time in seconds calls were running in an executor.
+
+    """
+
+    submitted: int
+    running: int
+    completed: int
+    failed: int
+    cancelled: int
+    busy_time: float
+
+
+class ExecutorPool:
+    def __init__(
+        self, max_threads: int | None = None, max_processes: int | None = None
+    ) -> None:
+        """
+        Initializes the executors shared by all modules of a service.
+        The executors are only created when the first call is offloaded.
+
+        Parameters
+        ----------
+
+        max_threads : int | None, optional
+            The number of worker threads. If ``None``, the default of
+            ``ThreadPoolExecutor`` is used.
+            Default is ``None``.
+
+        max_processes : int | None, optional
+            The number of worker processes. If ``None``, the number of CPUs
+            is used.
+            Default is ``None``.
+
+        """
+        self._max_threads: int | None = max_threads
+        self._max_processes: int | None = max_processes
+        self._executors: dict[ExecutorKind, Executor] = {}
+
+    @classmethod
+    def from_config(cls, config: TOMLConfiguration) -> "ExecutorPool":
+        """
+        Creates the executors from the ``executors`` table of a configuration
+        with the keys ``threads`` and ``processes``.
+        """
+        settings = (
+            config["executors"] if config.exists() and "executors" in config else {}
+        )
+
+        return cls(
+            max_threads=settings.get("threads"), max_processes=settings.get("processes")
+        )
+
+    def get_executor(self, kind: ExecutorKind) -> Executor:
+        if kind not in self._executors:
+            match kind:
+                case ExecutorKind.THREAD:
+                    self._executors[kind] = ThreadPoolExecutor(
+                        max_workers=self._max_threads,
+                        thread_name_prefix="nexus-offload",
+                    )
+                case ExecutorKind.PROCESS:
+                    # Forking a process running an event loop is unsafe
+                    self._executors[kind] = ProcessPoolExecutor(
+                        max_workers=self._max_processes,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+
+        return self._executors[kind]
+
+    def shutdown(self, wait: bool = True) -> None:
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+        self._executors.clear()
+
+
+class Offloader:
+    def __init__(self, name: str, pool: ExecutorPool, max_concurrency: int = 4) -> None:
+        """
+        Initializes the offloader of a module, which runs its blocking calls
+        in the shared executors.
+
+        Parameters
+        ----------
+
+        name : str
+            The name of the module.
+
+        pool : ExecutorPool
+            The shared executors.
+
+        max_concurrency : int, optional
+            The maximum number of calls of the module running at the same time.
+            Further calls wait, so one module can not occupy all workers.
+            Default is ``4``.
+
+        """
+        if max_concurrency < 1:
+            raise ValueError("The maximum concurrency has to be positive!")
+
+        self._name: str = name
+        self._pool: ExecutorPool = pool
+        self._max_concurrency: int = max_concurrency
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        self._futures: set[asyncio.Future] = set()
+        self._closed: bool = False
+
+        self._submitted: int = 0
+        self._running: int = 0
+        self._completed: int = 0
+        self._failed: int = 0
+        self._cancelled: int = 0
+        self._busy_time: float = 0.0
+
+    @classmethod
+    def from_config(
+        cls, name: str, pool: ExecutorPool, config: TOMLConfiguration
+    ) -> "Offloader":
+        """
+        Creates the offloader of a module from the ``offload`` table of its
+        configuration with the key ``max_concurrency``.
+        """
+        settings = config["offload"] if config.exists() and "offload" in config else {}
+
+        try:
+            return cls(
+                name=name,
+                pool=pool,
+                max_concurrency=settings.get("max_concurrency", 4),
+            )
+        except (TypeError, ValueError) as e:
+            raise InvalidConfigurationError(
+                f"The offload configuration of the module '{name}' is invalid: {e}"
+            )
+
+    def get_stats(self) -> OffloadStats:
+        return OffloadStats(
+            submitted=self._submitted,
+            running=self._running,
+            completed=self._completed,
+            failed=self._failed,
+            cancelled=self._cancelled,
+            busy_time=self._busy_time,
+        )
+
+    async def run(
+        self,
+        func: Callable[..., _T],
+        *args: Any,
+        kind: ExecutorKind | str = ExecutorKind.THREAD,
+        **kwargs: Any,
+    ) -> _T:
+        """
+        Runs a blocking function in an executor and waits for its result.
+
+        Parameters
+        ----------
+
+        func : Callable[..., T]
+            The function. It has to be picklable for ``ExecutorKind.PROCESS``.
+
+        *args : Any
+            The positional arguments passed to the function.
+
+        kind : ExecutorKind | str, optional
+            The executor to run the function in.
+            Default is ``ExecutorKind.THREAD``.
+
+        **kwargs : Any
+            The keyword arguments passed to the function.
+
+        Returns
+        -------
+
+        T : The result of the function.
+        """
+        kind = ExecutorKind(kind)
+        self._submitted += 1
+
+        async with self._semaphore:
+            if self._closed:
+                self._cancelled += 1
+                raise asyncio.CancelledError(f"The module '{self._name}' is disabled.")
+
+            future = asyncio.get_running_loop().run_in_executor(
+                self._pool.get_executor(kind), partial(func, *args, **kwargs)
+            )
+            self._futures.add(future)
+            self._running += 1
+            start = time.perf_counter()
+
+            try:
+                result = await future
+            except asyncio.CancelledError:
+                self._cancelled += 1
+                raise
+            except Exception:
+                self._failed += 1
+                raise
+            finally:
+                self._running -= 1
+                self._busy_time += time.perf_counter() - start
+                self._futures.discard(future)
+
+            self._completed += 1
+            return result
+
+    def close(self) -> None:
+        """
+        Cancels all calls of the module. Calls which did not start yet are
+        dropped. Calls which are already running in a thread or process finish
+        in the background, but their callers are cancelled.
+        """
+        self._closed = True
+
+        for future in self._futures:
+            future.cancel()
+
+
+def _get_source_signature(path: str) -> _SourceSignature:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _resolve_offloaded(module: Any, qualname: str) -> Callable[..., Any] | None:
+    target = module
+    for name in qualname.split("."):
+        target = getattr(target, name, None)
+
+    return getattr(target, "__nexus_offloaded__", None)
+
+
+def _call_offloaded(
+    module_name: str,
+    qualname: str,
+    signature: _SourceSignature,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    # Runs in the worker process, which looks up the decorated function by
+    # name, as the decorated function itself can not be pickled. Modules
+    # which changed since the worker imported them are imported again, so
+    # the worker runs the same code as the service after a reload.
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    elif _IMPORTED.get(module_name, signature) != signature:
+        module = importlib.reload(module)
+
+    _IMPORTED[module_name] = signature
+
+    func = _resolve_offloaded(module, qualname)
+    if func is None:
+        raise TypeError(f"The offloaded method '{qualname}' could not be resolved.")
+
+    return func(*args, **kwargs)
+
+
+def offload(
+    kind: ExecutorKind | str = ExecutorKind.THREAD,
+) -> Callable[[Callable[..., _T]], Callable[..., Any]]:
+    """
+    Turns a blocking method of a module into a coroutine method, which runs
+    in the executors shared by the service.
+
+    Methods offloaded to a process do not receive ``self``, as the module can
+    not be sent to another process. The worker process imports them by name,
+    so they have to be defined in a class which is reachable from the top
+    level of its module. Their arguments and results have to be picklable.
+
+    Parameters
+    ----------
+
+    kind : ExecutorKind | str, optional
+        The executor to run the method in.
+        Default is ``ExecutorKind.THREAD``.
+
+    Returns
+    -------
+
+    Callable : The decorator.
+
+    Raises
+    ------
+
+    TypeError
+        If a method offloaded to a process is defined in a function.
+
+    Examples
+    --------
+
+    >>> class Module(module.Module):
+    ...     @offload("process")
+    ...     def render(data: bytes) -> bytes:
+    ...         ...
+    ...
+    ...     @listener("MESSAGE_CREATE")
+    ...     async def on_message(self, message):
+    ...         image = await self.render(message.data)
+
+    """
+    kind = ExecutorKind(kind)
+
+    def decorator(func: Callable[..., _T]) -> Callable[..., Any]:
+        if kind is ExecutorKind.PROCESS and "<locals>" in func.__qualname__:
+            raise TypeError(
+                f"The method '{func.__qualname__}' can not be offloaded to a "
+                "process, as it is defined in a function."
+            )
+
+        signature = _get_source_signature(func.__code__.co_filename)
+
+        @wraps(func)
+        async def wrapper(self: "Module", *args: Any, **kwargs: Any) -> _T:
+            if kind is ExecutorKind.PROCESS:
+                # Checked here, as the class does not exist yet when the
+                # method is decorated
+                module = sys.modules.get(func.__module__)
+                if _resolve_offloaded(module, func.__qualname__) is None:
+                    raise TypeError(
+                        f"The method '{func.__qualname__}' can not be offloaded to "
+                        "a process, as it is not reachable from its module."
+                    )
+
+                call = partial(
+                    _call_offloaded, func.__module__, func.__qualname__, signature
+                )
+            else:
+                call = partial(func, self)
+
+            return await self.run_offloaded(call, *args, kind=kind, **kwargs)
+
+        wrapper.__nexus_offloaded__ = func
+        return wrapper
+
+    return decorator
@@ -0,0 +1,396 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from nexus.core.config.toml import TOMLConfiguration
+from nexus.core.exceptions.generic import InvalidConfigurationError
+from nexus.core.module.events import EventHandler, EventPriority
+
+__all__ = ["OverflowPolicy", "QueueStats", "ModuleQueue"]
+
+_logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    """
+    A snapshot of the state of a module queue.
+
+    Attributes
+    ----------
+
+    depth : int
+        The number of events waiting to be handled.
+
+    max_size : int
+        The maximum number of waiting events per priority class.
+
+    concurrency : int
+        The number of workers handling events.
+
+    enqueued : int
+        The number of events put into the queue.
+
+    processed : int
+        The number of events handled.
+
+    dropped : int
+        The number of events dropped because the queue was full.
+
+    failed : int
+        The number of events whose handler raised an exception.
+
+    blocked : int
+        The number of events waiting for space in a full queue with the
+        overflow policy ``BLOCK``.
+
+    """
+
+    depth: int
+    max_size: int
+    concurrency: int
+    enqueued: int
+    processed: int
+    dropped: int
+    failed: int
+    blocked: int = 0
+
+
+class ModuleQueue:
+    def __init__(
+        self,
+        name: str,
+        max_size: int = 1000,
+        concurrency: int = 1,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        max_blocked: int | None = None,
+    ) -> None:
+        """
+        Initializes a bounded queue, whose workers handle the events of
+        a single module. A slow module only fills its own queue instead of
+        stalling the other modules.
+
+        Parameters
+        ----------
+
+        name : str
+            The name of the module.
+
+        max_size : int, optional
+            The maximum number of waiting events per priority class.
+            Default is ``1000``.
+
+        concurrency : int, optional
+            The number of workers handling events concurrently.
+            Default is ``1``.
+
+        overflow : OverflowPolicy, optional
+            What happens to a new event if the queue is full. ``BLOCK`` waits
+            for free space, ``DROP_OLDEST`` drops the longest waiting event and
+            ``DROP_NEWEST`` drops the new event. Waiting for free space only
+            holds back the events of this module.
+            Default is ``OverflowPolicy.BLOCK``.
+
+        max_blocked : int | None, optional
+            The maximum number of events waiting for free space per priority
+            class with the overflow policy ``BLOCK``. Further events are
+            dropped. If ``None``, the maximum size is used.
+            Default is ``None``.
+
+        """
+        if max_blocked is None:
+            max_blocked = max_size
+
+        if max_size < 1 or concurrency < 1 or max_blocked < 1:
+            raise ValueError(
+                "The maximum size, the maximum number of blocked events and the "
+                "concurrency of a queue have to be positive!"
+            )
+
+        self._name: str = name
+        self._max_size: int = max_size
+        self._concurrency: int = concurrency
+        self._overflow: OverflowPolicy = overflow
+        self._max_blocked: int = max_blocked
+
+        # One queue per priority class, with the highest priority first
+        self._queues: list[asyncio.Queue] | None = None
+        self._available: asyncio.Semaphore | None = None
+        self._idle: asyncio.Event | None = None
+        self._unfinished: int = 0
+        self._workers: list[asyncio.Task] = []
+
+        # Puts waiting for free space per priority class. New events of
+        # a class wait behind them to keep their order.
+        self._blocked: set[asyncio.Task] = set()
+        self._blocked_counts: list[int] = [0] * len(EventPriority)
+
+        self._enqueued: int = 0
+        self._processed: int = 0
+        self._dropped: int = 0
+        self._failed: int = 0
+
+    @classmethod
+    def from_config(cls, name: str, config: TOMLConfiguration) -> "ModuleQueue":
+        """
+        Creates the queue of a module from the ``queue`` table of its
+        configuration with the keys ``max_size``, ``concurrency``,
+        ``overflow`` (``"block"``, ``"drop_oldest"`` or ``"drop_newest"``) and
+        ``max_blocked``.
+
+        Parameters
+        ----------
+
+        name : str
+            The name of the module.
+
+        config : TOMLConfiguration
+            The configuration of the module.
+
+        Returns
+        -------
+
+        ModuleQueue : The queue.
+        """
+        settings = config["queue"] if config.exists() and "queue" in config else {}
+
+        try:
+            return cls(
+                name=name,
+                max_size=settings.get("max_size", 1000),
+                concurrency=settings.get("concurrency", 1),
+                overflow=OverflowPolicy(settings.get("overflow", "block")),
+                max_blocked=settings.get("max_blocked"),
+            )
+        except (TypeError, ValueError) as e:
+            raise InvalidConfigurationError(
+                f"The queue configuration of the module '{name}' is invalid: {e}"
+            )
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def overflow(self) -> OverflowPolicy:
+        return self._overflow
+
+    def get_stats(self) -> QueueStats:
+        return QueueStats(
+            depth=(
+                sum(queue.qsize() for queue in self._queues)
+                if self._queues is not None
+                else 0
+            ),
+            max_size=self._max_size,
+            concurrency=self._concurrency,
+            enqueued=self._enqueued,
+            processed=self._processed,
+            dropped=self._dropped,
+            failed=self._failed,
+            blocked=sum(self._blocked_counts),
+        )
+
+    def put_nowait(
+        self,
+        handler: EventHandler,
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+        priority: EventPriority = EventPriority.NORMAL,
+    ) -> bool:
+        """
+        Puts an event into the queue without waiting. The workers are started
+        on the first event and always handle the events of the highest
+        priority first. Every priority class has its own bound, so a flood of
+        events of one class neither blocks nor drops the events of another.
+        If the queue is full and the overflow policy is ``BLOCK``, the event
+        waits for free space in a task of its own, so the caller is never
+        held back by this module. Once the maximum number of blocked events
+        is reached, further events are dropped.
+
+        Parameters
+        ----------
+
+        handler : EventHandler
+            The handler to call with the event.
+
+        args : tuple[Any, ...], optional
+            The positional arguments passed to the handler.
+            Default is ``()``.
+
+        kwargs : dict[str, Any] | None, optional
+            The keyword arguments passed to the handler.
+            Default is ``None``.
+
+        priority : EventPriority, optional
+            The priority class of the event.
+            Default is ``EventPriority.NORMAL``.
+
+        Returns
+        -------
+
+        bool : Whether the event was accepted. If ``False``, it was dropped.
+        """
+        queued = self._put(handler=handler, args=args, kwargs=kwargs, priority=priority)
+        return queued is not False
+
+    async def put(
+        self,
+        handler: EventHandler,
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+        priority: EventPriority = EventPriority.NORMAL,
+    ) -> bool:
+        """
+        Puts an event into the queue like ``put_nowait``, but waits until a
+        blocked event was queued.
+
+        Returns
+        -------
+
+        bool : Whether the event was queued. If ``False``, it was dropped
+        or the queue was closed while waiting.
+        """
+        queued = self._put(handler=handler, args=args, kwargs=kwargs, priority=priority)
+        if not isinstance(queued, asyncio.Task):
+            return queued
+
+        await asyncio.wait({queued})
+        return not queued.cancelled()
+
+    def _put(
+        self,
+        handler: EventHandler,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any] | None,
+        priority: EventPriority,
+    ) -> bool | asyncio.Task:
+        # Returns whether the event was queued or the task waiting for space
+        if self._queues is None:
+            self._start()
+
+        queue = self._queues[priority]
+        item = (handler, args, kwargs or {})
+
+        if queue.full() or self._blocked_counts[priority]:
+            match self._overflow:
+                case OverflowPolicy.DROP_NEWEST:
+                    self._dropped += 1
+                    return False
+                case OverflowPolicy.DROP_OLDEST:
+                    # Replaces the oldest event, so the number of
+                    # available events does not change
+                    queue.get_nowait()
+                    queue.put_nowait(item)
+                    self._dropped += 1
+                    self._enqueued += 1
+                    return True
+                case OverflowPolicy.BLOCK:
+                    if self._blocked_counts[priority] >= self._max_blocked:
+                        self._dropped += 1
+                        return False
+
+                    self._blocked_counts[priority] += 1
+                    task = asyncio.create_task(
+                        self._put_blocked(
+                            queue=queue,
+                            item=item,
+                            counts=self._blocked_counts,
+                            priority=priority,
+                        )
+                    )
+                    self._blocked.add(task)
+                    task.add_done_callback(self._blocked.discard)
+                    return task
+
+        queue.put_nowait(item)
+        self._on_queued()
+        return True
+
+    async def _put_blocked(
+        self,
+        queue: asyncio.Queue,
+        item: tuple,
+        counts: list[int],
+        priority: EventPriority,
+    ) -> None:
+        # The counts are those of the queues the event waits for, which
+        # are replaced when the queue is closed
+        try:
+            await queue.put(item)
+        finally:
+            counts[priority] -= 1
+
+        self._on_queued()
+
+    def _on_queued(self) -> None:
+        self._enqueued += 1
+        self._unfinished += 1
+        self._idle.clear()
+        self._available.release()
+
+    async def join(self) -> None:
+        """
+        Waits until all queued events are handled.
+        """
+        if self._queues is not None:
+            await self._idle.wait()
+
+    def close(self) -> None:
+        """
+        Stops the workers and drops all waiting events. Handlers which are
+        running and events waiting for free space are cancelled.
+        """
+        for task in [*self._workers, *self._blocked]:
+            task.cancel()
+
+        self._workers = []
+        self._blocked = set()
+        self._blocked_counts = [0] * len(EventPriority)
+        self._queues = None
+
+    def _start(self) -> None:
+        self._queues = [
+            asyncio.Queue(maxsize=self._max_size) for _ in range(len(EventPriority))
+        ]
+        self._available = asyncio.Semaphore(0)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._unfinished = 0
+
+        self._workers = [
+            asyncio.create_task(self._work(queues=self._queues))
+            for _ in range(self._concurrency)
+        ]
+
+    async def _work(self, queues: list[asyncio.Queue]) -> None:
+        while True:
+            await self._available.acquire()
+
+            # Every release of the semaphore belongs to a waiting event
+            queue = next(queue for queue in queues if not queue.empty())
+            handler, args, kwargs = queue.get_nowait()
+
+            try:
+                await handler(*args, **kwargs)
+            except Exception:
+                self._failed += 1
+                _logger.exception(
+                    "The handler '%s' of the module '%s' failed.",
+                    handler.__qualname__,
+                    self._name,
+                )
+            finally:
+                self._unfinished -= 1
+                if self._unfinished == 0:
+                    self._idle.set()
+
+            self._processed += 1
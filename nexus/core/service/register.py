@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import uuid
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Iterator
 
 from nexus.core.config.toml import TOMLConfiguration
 from nexus.core.exceptions.services import InvalidServiceError
@@ -12,51 +14,130 @@ if TYPE_CHECKING:
 
 
 class ServiceRegister:
+    # Services loaded in this process by their UUID, so that repeated lookups
+    # return the same object as long as it is referenced somewhere.
+    _identity_map: weakref.WeakValueDictionary[str, Service] = (
+        weakref.WeakValueDictionary()
+    )
+
     def __init__(self) -> None:
+        # The registry file is only created once the first service is
+        # registered. Until then, it is treated as empty.
         self._config: TOMLConfiguration = TOMLConfiguration(
-            Path.home() / ".nexus/config/services.toml", create_if_not_exists=True
+            Path.home() / ".nexus/config/services.toml",
+            cached=True,
+            locking=True,
         )
-        if "services" not in self._config:
-            self._config.dump({"services": {}})
 
-    def get_services(self) -> list[Service]:
-        from nexus.core.service.service import Service
+    @contextmanager
+    def _transaction(self) -> Iterator[TOMLConfiguration]:
+        if not self._config.exists():
+            self._config.create()
+
+        with self._config.transaction():
+            for table in ["services", "names"]:
+                if table not in self._config:
+                    self._config[table] = {}
+            yield self._config
 
+    def _get_table(self, table: str) -> dict[str, Any]:
+        return self._lookup(table) or {}
+
+    def _lookup(self, key: str) -> Any:
+        if not self._config.exists() or key not in self._config:
+            return None
+        return self._config[key]
+
+    def get_services(self) -> list[Service]:
         services = []
-        for unique_id, path in self._config["services"].items():
+        for unique_id, path in self._get_table("services").items():
             if not Path(path).exists():
                 self.unregister(unique_id=unique_id)
                 continue
-            services.append(Service.from_path(path=Path(path)))
+            services.append(self._load(unique_id=unique_id, path=path))
         return services
 
     def clear(self) -> None:
-        self._config.dump({})
+        with self._transaction() as config:
+            config.dump({"services": {}, "names": {}})
+        self._identity_map.clear()
 
     def register(self, service: Service) -> None:
-        self._config[f"services.{str(service._uuid)}"] = str(
-            service._root_dir.resolve()
-        )
+        unique_id = str(service._uuid)
+
+        with self._transaction() as config:
+            config[f"services.{unique_id}"] = str(service._root_dir.resolve())
+            self._set_name(name=service._name, unique_id=unique_id)
+
+        self._identity_map[unique_id] = service
 
     def unregister(self, unique_id: uuid.UUID | str) -> None:
-        self._config[f"services.{str(unique_id)}"] = None
+        unique_id = str(unique_id)
 
-    def get_service_by_uuid(self, unique_id: uuid.UUID | str) -> Service:
-        from nexus.core.service.service import Service
+        with self._transaction() as config:
+            config["names"] = {
+                name: name_id
+                for name, name_id in config["names"].items()
+                if name_id != unique_id
+            }
+            if unique_id in config["services"]:
+                del config[f"services.{unique_id}"]
 
+        self._identity_map.pop(unique_id, None)
+
+    def get_service_by_uuid(self, unique_id: uuid.UUID | str) -> Service:
         unique_id = uuid.UUID(unique_id) if isinstance(unique_id, str) else unique_id
 
-        try:
-            service = Service.from_path(self._config["services"][str(unique_id)])
-        except KeyError:
+        path = self._lookup(f"services.{unique_id}")
+
+        if path is None:
             raise InvalidServiceError(
                 f"There is no service registered with UUID {unique_id}"
             )
 
-        return service
+        return self._load(unique_id=str(unique_id), path=path)
 
     def get_service_by_name(self, name: str) -> Service:
-        for service in self.get_services():
-            if service._name == name:
-                return service
-        raise InvalidServiceError(f"There is no service registered with name {name}!")
+        # Service names may contain dots, which the flattened index of the
+        # cached configuration resolves as a single key.
+        unique_id = self._lookup(f"names.{name}")
+
+        if unique_id is None:
+            unique_id = self._find_unindexed(name=name)
+
+        if unique_id is None or self._lookup(f"services.{unique_id}") is None:
+            raise InvalidServiceError(
+                f"There is no service registered with name {name}!"
+            )
+
+        return self.get_service_by_uuid(unique_id=unique_id)
+
+    def _find_unindexed(self, name: str) -> str | None:
+        # Registries written before the name index existed only contain
+        # UUID -> path entries. The name of a service is the name of its
+        # root directory, so the index can be filled without loading services.
+        indexed = set(self._get_table("names").values())
+
+        for unique_id, path in self._get_table("services").items():
+            if unique_id not in indexed and Path(path).name == name:
+                self._set_name(name=name, unique_id=unique_id)
+                return unique_id
+
+        return None
+
+    def _set_name(self, name: str, unique_id: str) -> None:
+        with self._transaction() as config:
+            names = config["names"]
+            names[name] = unique_id
+            config["names"] = names
+
+    def _load(self, unique_id: str, path: str) -> Service:
+        from nexus.core.service.service import Service
+
+        service = self._identity_map.get(unique_id)
+
+        if service is None or service._root_dir.resolve() != Path(path):
+            service = Service.from_path(path=path)
+            self._identity_map[unique_id] = service
+
+        return service
@@ -1,50 +1,106 @@
+import os
 import uuid
+from functools import cached_property
 from os import PathLike
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from nexus.core.bot.manager import BotManager
 from nexus.core.config import TOMLConfiguration
 from nexus.core.exceptions.services import InvalidServiceError, ServiceExistsError
-from nexus.core.module.manager import ModuleManager
 from nexus.core.plugin.manager import PluginManager
 from nexus.core.service.register import ServiceRegister
 
+if TYPE_CHECKING:
+    from nexus.core.bot.manager import BotManager
+    from nexus.core.config.watcher import ConfigWatcher
+    from nexus.core.module.manager import ModuleManager
+
+_REQUIRED_FILES = frozenset({"nexus.toml", "bots.toml", "modules.toml", "plugins.toml"})
+_REQUIRED_DIRS = frozenset({"plugins", "config"})
+_REQUIRED_CONFIG_DIRS = frozenset({"modules", "plugins"})
+
+
+def _scan_dir(path: Path) -> tuple[set[str], set[str]]:
+    files, dirs = set(), set()
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                dirs.add(entry.name)
+            elif entry.is_file():
+                files.add(entry.name)
+
+    return files, dirs
+
 
 class Service:
     def __init__(
         self,
         name: str,
         parent_dir: PathLike | str,
+        cached_configs: bool = False,
     ) -> None:
         self._name: str = name
         self._root_dir: Path = Path(parent_dir) / self._name
-        self._uuid: uuid.UUID | None = None
+        self._cached_configs: bool = cached_configs
 
-        self._main_config: TOMLConfiguration = TOMLConfiguration(
-            self._root_dir / "nexus.toml"
-        )
+    # The configurations and managers are only created on first access,
+    # so that enumerating services does not touch their files. The managers
+    # are also imported on first access, as the bot manager depends on
+    # discord.py.
+
+    @cached_property
+    def _uuid(self) -> uuid.UUID | None:
+        if not self._main_config.exists():
+            return None
+
+        unique_id = self._main_config.asdict().get("uuid")
+        return uuid.UUID(str(unique_id)) if unique_id is not None else None
 
-        if "uuid" in self._main_config:
-            self._uuid = uuid.UUID(str(self._main_config["uuid"]))
+    @cached_property
+    def _main_config(self) -> TOMLConfiguration:
+        return TOMLConfiguration(
+            self._root_dir / "nexus.toml", cached=self._cached_configs
+        )
 
-        self._bot_config: TOMLConfiguration = TOMLConfiguration(
-            self._root_dir / "bots.toml"
+    @cached_property
+    def _bot_config(self) -> TOMLConfiguration:
+        return TOMLConfiguration(
+            self._root_dir / "bots.toml", cached=self._cached_configs
         )
-        self._module_config: TOMLConfiguration = TOMLConfiguration(
-            self._root_dir / "modules.toml"
+
+    @cached_property
+    def _module_config(self) -> TOMLConfiguration:
+        return TOMLConfiguration(
+            self._root_dir / "modules.toml", cached=self._cached_configs
         )
-        self._plugin_config: TOMLConfiguration = TOMLConfiguration(
-            self._root_dir / "plugins.toml"
+
+    @cached_property
+    def _plugin_config(self) -> TOMLConfiguration:
+        return TOMLConfiguration(
+            self._root_dir / "plugins.toml", cached=self._cached_configs
         )
 
-        self._bot_manager: BotManager = BotManager(bot_config=self._bot_config)
-        self._module_manager: ModuleManager = ModuleManager(
-            module_config=self._module_config
+    @cached_property
+    def _bot_manager(self) -> "BotManager":
+        from nexus.core.bot.manager import BotManager
+
+        return BotManager(
+            bot_config=self._bot_config, module_manager=self._module_manager
         )
-        self._plugin_manager: PluginManager = PluginManager(
-            plugin_config=self._plugin_config
+
+    @cached_property
+    def _module_manager(self) -> "ModuleManager":
+        from nexus.core.module.manager import ModuleManager
+
+        return ModuleManager(
+            module_config=self._module_config, cached_configs=self._cached_configs
         )
 
+    @cached_property
+    def _plugin_manager(self) -> PluginManager:
+        return PluginManager(plugin_config=self._plugin_config)
+
     def reset_config(self) -> None:
         self._main_config.dump({"uuid": str(self._uuid)})
 
@@ -52,17 +108,24 @@ class Service:
         return self._root_dir.exists() and self._root_dir.is_dir()
 
     def is_valid(self) -> bool:
-        return (
-            self.exists()
-            and self._main_config.exists()
-            and self._bot_config.exists()
-            and self._module_config.exists()
-            and self._plugin_config.exists()
-            and (self._root_dir / "plugins").exists()
-            and (self._root_dir / "config").exists()
-            and (self._root_dir / "config/modules").exists()
-            and (self._root_dir / "config/plugins").exists()
-        )
+        try:
+            files, dirs = _scan_dir(self._root_dir)
+
+            if not (_REQUIRED_FILES <= files and _REQUIRED_DIRS <= dirs):
+                return False
+
+            _, config_dirs = _scan_dir(self._root_dir / "config")
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+
+        return _REQUIRED_CONFIG_DIRS <= config_dirs
+
+    def create_watcher(self, interval: float = 1.0) -> "ConfigWatcher":
+        from nexus.core.config.watcher import ConfigWatcher
+
+        watcher = ConfigWatcher(root=self._root_dir, interval=interval)
+        self._module_manager.watch(watcher)
+        return watcher
 
     def initialize(self) -> None:
 
@@ -97,9 +160,11 @@ class Service:
         ServiceRegister().register(self)
 
     @classmethod
-    def from_path(cls, path: PathLike | str) -> "Service":
+    def from_path(cls, path: PathLike | str, cached_configs: bool = False) -> "Service":
         path = Path(path)
-        instance = cls(name=path.name, parent_dir=path.parent)
+        instance = cls(
+            name=path.name, parent_dir=path.parent, cached_configs=cached_configs
+        )
 
         if not instance.is_valid():
             raise InvalidServiceError(f"There is no valid service at path {path}!")
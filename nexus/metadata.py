@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2026 Tom Groß
+
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+
+__all__ = ["PackageMetadata", "get_metadata"]
+
+
+@dataclass(frozen=True)
+class PackageMetadata:
+    authors: list[str] = field(default_factory=list)
+    license: str = "unknown"
+    urls: dict[str, str] = field(default_factory=dict)
+
+
+@cache
+def get_metadata() -> PackageMetadata:
+    """
+    Provides the metadata of the package (authors, license and project URLs).
+    The metadata is taken from the installed distribution. For a source
+    checkout that has not been installed, the ``pyproject.toml`` next to the
+    package is used instead.
+
+    Returns
+    -------
+
+    PackageMetadata : The metadata of the package.
+    """
+    # importlib.metadata is expensive to import, so it is only imported
+    # once the metadata is needed (e.g. for the help of the CLI).
+    from importlib import metadata as importlib_metadata
+
+    try:
+        dist_metadata = importlib_metadata.metadata("nexus")
+    except importlib_metadata.PackageNotFoundError:
+        return _metadata_from_pyproject()
+
+    # Authors with email addresses are only listed in 'Author-email' in the
+    # form 'Name <email>, Name <email>'.
+    authors = [
+        author.split("<")[0].strip()
+        for author in (dist_metadata.get("Author-email") or "").split(",")
+        if author.strip()
+    ] or [dist_metadata.get("Author") or "unknown"]
+
+    urls = {}
+    for entry in dist_metadata.get_all("Project-URL") or []:
+        label, _, url = entry.partition(",")
+        urls[label.strip()] = url.strip()
+
+    return PackageMetadata(
+        authors=authors,
+        license=dist_metadata.get("License-Expression")
+        or dist_metadata.get("License")
+        or "unknown",
+        urls=urls,
+    )
+
+
+def _metadata_from_pyproject() -> PackageMetadata:
+    import tomllib
+
+    pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
+
+    try:
+        with open(pyproject_path, "rb") as tomlf:
+            project = tomllib.load(tomlf)["project"]
+    except (FileNotFoundError, KeyError):
+        return PackageMetadata()
+
+    lic = project.get("license", {})
+
+    return PackageMetadata(
+        authors=[author["name"] for author in project.get("authors", [])],
+        license=lic.get("text", "unknown") if isinstance(lic, dict) else lic,
+        urls=project.get("urls", {}),
+    )
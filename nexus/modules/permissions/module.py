@@ -1,13 +1,151 @@
+from collections.abc import Iterable
+from typing import Any
+
 from nexus.core.config.toml import TOMLConfiguration
-from nexus.core.module import module
+from nexus.core.module import listener, module
+from nexus.modules.permissions.nodes import CacheStats, NodeResolver
+from nexus.modules.permissions.resolver import PermissionResolver
+
+
+def _parse_id(value: str) -> int | str:
+    return int(value) if value.isdigit() else value
 
 
 class Module(module.Module):
     def __init__(self, config: TOMLConfiguration) -> None:
         super().__init__(name="Permissions", optional=True, config=config)
+        self._resolver: PermissionResolver = PermissionResolver()
+        self._nodes: NodeResolver = NodeResolver()
 
     def enable(self) -> None:
-        pass
+        super().enable()
+
+        # The resolver is kept, as the members' roles are only sent by
+        # the gateway when they change
+        settings = self._get_table("cache")
+        self._nodes.set_max_size(settings.get("max_size", 10000))
+
+        self._load_roles()
+        self._load_nodes()
+
+    def on_config_change(self, keys: set[str]) -> None:
+        tables = {key.split(".")[0] for key in keys}
+
+        if "roles" in tables:
+            self._load_roles()
+        if "nodes" in tables:
+            self._load_nodes()
+
+    def get_resolver(self) -> PermissionResolver:
+        return self._resolver
+
+    def get_node_resolver(self) -> NodeResolver:
+        return self._nodes
+
+    def get_cache_stats(self) -> CacheStats:
+        return self._nodes.get_stats()
+
+    def has_permissions(self, roles: Iterable[int], *permissions: str) -> bool:
+        return self._resolver.has_permissions(roles, *permissions)
+
+    def has_node(
+        self, guild: int, member: int, permission: str, channel: int | None = None
+    ) -> bool:
+        return self._nodes.has_permission(guild, member, permission, channel)
+
+    @listener("GUILD_CREATE")
+    async def on_guild_create(self, payload: dict[str, Any]) -> None:
+        self._set_members(int(payload["id"]), payload.get("members", []))
+
+    @listener("GUILD_MEMBERS_CHUNK")
+    async def on_members_chunk(self, payload: dict[str, Any]) -> None:
+        self._set_members(int(payload["guild_id"]), payload["members"])
+
+    @listener("GUILD_DELETE")
+    async def on_guild_delete(self, payload: dict[str, Any]) -> None:
+        # Unavailable guilds are only affected by an outage
+        if not payload.get("unavailable", False):
+            self._nodes.remove_guild(int(payload["id"]))
+
+    @listener("GUILD_MEMBER_ADD", "GUILD_MEMBER_UPDATE")
+    async def on_member_update(self, payload: dict[str, Any]) -> None:
+        self._set_members(int(payload["guild_id"]), [payload])
+
+    @listener("GUILD_MEMBER_REMOVE")
+    async def on_member_remove(self, payload: dict[str, Any]) -> None:
+        self._nodes.remove_member(int(payload["guild_id"]), int(payload["user"]["id"]))
+
+    @listener("GUILD_ROLE_UPDATE")
+    async def on_role_update(self, payload: dict[str, Any]) -> None:
+        self._nodes.invalidate_role(int(payload["role"]["id"]))
+
+    @listener("GUILD_ROLE_DELETE")
+    async def on_role_delete(self, payload: dict[str, Any]) -> None:
+        self._nodes.delete_role(int(payload["role_id"]))
+
+    @listener("CHANNEL_UPDATE", "CHANNEL_DELETE")
+    async def on_channel_update(self, payload: dict[str, Any]) -> None:
+        self._nodes.invalidate_channel(int(payload["id"]))
+
+    def _get_table(self, name: str) -> dict[str, Any]:
+        return (
+            self._config[name] if self._config.exists() and name in self._config else {}
+        )
+
+    def _set_members(self, guild: int, members: Iterable[dict[str, Any]]) -> None:
+        for member in members:
+            self._nodes.set_member(
+                guild,
+                int(member["user"]["id"]),
+                [int(role) for role in member["roles"]],
+            )
+
+    def _load_roles(self) -> None:
+        # The roles table maps role IDs to the permissions granted, e.g.
+        # ``123456789 = ["music.play", "music.skip"]``
+        resolver = PermissionResolver(registry=self._resolver.get_registry())
+        for role, permissions in self._get_table("roles").items():
+            resolver.set_role(_parse_id(role), permissions)
+
+        self._resolver = resolver
+
+    def _load_nodes(self) -> None:
+        # The nodes table maps role IDs to permission nodes and may override
+        # them per channel, e.g.
+        #
+        #   [nodes.roles]
+        #   123456789 = ["moderation.*", "-moderation.ban.permanent"]
+        #
+        #   [nodes.channels.987654321.members]
+        #   555555555 = ["-moderation.*"]
+        #
+        # Only the changed roles and overrides invalidate cached entries.
+        nodes = self._get_table("nodes")
+
+        roles = {
+            _parse_id(role): value for role, value in nodes.get("roles", {}).items()
+        }
+        for role in set(self._nodes.get_roles()) - set(roles):
+            self._nodes.remove_role(role)
+        for role, value in roles.items():
+            self._nodes.set_role(role, value)
+
+        channels = nodes.get("channels", {})
+        for kind, overrides, set_override in (
+            ("roles", self._nodes.get_role_overrides(), self._nodes.set_role_override),
+            (
+                "members",
+                self._nodes.get_member_overrides(),
+                self._nodes.set_member_override,
+            ),
+        ):
+            configured = {
+                (_parse_id(channel), _parse_id(target)): value
+                for channel, table in channels.items()
+                for target, value in table.get(kind, {}).items()
+            }
 
-    def disable(self) -> None:
-        pass
+            for channel, target in set(overrides) - set(configured):
+                set_override(channel, target, ())
+            for (channel, target), value in configured.items():
+                set_override(channel, target, value)
@@ -0,0 +1,548 @@
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+
+from nexus.core.exceptions.generic import InvalidConfigurationError
+
+__all__ = ["NodeTrie", "EffectivePermissions", "CacheStats", "NodeResolver"]
+
+_WILDCARD = "*"
+_NEGATION = "-"
+
+_CacheKey = tuple[Hashable, Hashable, Hashable | None]
+
+
+class _TrieNode:
+    __slots__ = ("children", "value", "wildcard")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+
+        # The decision for the node itself and for all of its descendants
+        # (``<node>.*``). None if the node does not decide.
+        self.value: bool | None = None
+        self.wildcard: bool | None = None
+
+
+def _merge(current: bool | None, allow: bool) -> bool:
+    # Within a layer, a negated node wins over a granted one
+    return allow if current is None else current and allow
+
+
+class NodeTrie:
+    """
+    Compiled permission nodes. A node is a dotted name like
+    ``moderation.ban``, which may end with a wildcard (``moderation.*``,
+    matching all descendants of ``moderation``) and may be negated with a
+    leading ``-``. The most specific matching node decides; if the same node
+    is granted and negated, the negation wins.
+
+    Parameters
+    ----------
+
+    nodes : Iterable[str], optional
+        The nodes to insert. Default is no nodes.
+
+    """
+
+    def __init__(self, nodes: Iterable[str] = ()) -> None:
+        self._root = _TrieNode()
+        self._size = 0
+
+        for node in nodes:
+            self.insert(node)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, node: str) -> None:
+        """
+        Inserts a permission node.
+
+        Parameters
+        ----------
+
+        node : str
+            The node, e.g. ``"moderation.ban.*"`` or ``"-moderation.ban"``.
+
+        Raises
+        ------
+
+        InvalidConfigurationError
+            If the node is malformed.
+        """
+        allow = not node.startswith(_NEGATION)
+        segments = node.removeprefix(_NEGATION).split(".")
+
+        if any(not segment for segment in segments) or _WILDCARD in segments[:-1]:
+            raise InvalidConfigurationError(f"Invalid permission node '{node}'!")
+
+        wildcard = segments[-1] == _WILDCARD
+        if wildcard:
+            segments = segments[:-1]
+
+        current = self._root
+        for segment in segments:
+            current = current.children.setdefault(segment, _TrieNode())
+
+        if wildcard:
+            current.wildcard = _merge(current.wildcard, allow)
+        else:
+            current.value = _merge(current.value, allow)
+
+        self._size += 1
+
+    def match(self, permission: str) -> bool | None:
+        """
+        Matches a permission against the nodes.
+
+        Parameters
+        ----------
+
+        permission : str
+            The dotted name of the permission, e.g. ``"moderation.ban"``.
+
+        Returns
+        -------
+
+        bool | None : Whether the permission is granted, or ``None`` if no
+        node matches.
+        """
+        segments = permission.split(".")
+
+        current = self._root
+        decision = current.wildcard
+
+        for i, segment in enumerate(segments):
+            current = current.children.get(segment)
+            if current is None:
+                return decision
+
+            # The wildcard of a node only covers its descendants
+            if i < len(segments) - 1 and current.wildcard is not None:
+                decision = current.wildcard
+
+        return current.value if current.value is not None else decision
+
+
+class EffectivePermissions:
+    """
+    The effective permissions of a member in a channel. The layers are
+    matched from the most specific (the member's channel override) to the
+    least specific (the member's roles) and the first layer with a matching
+    node decides. Permissions no node matches are denied.
+
+    Parameters
+    ----------
+
+    layers : tuple[NodeTrie, ...]
+        The compiled layers, most specific first.
+
+    """
+
+    def __init__(self, layers: tuple[NodeTrie, ...]) -> None:
+        self._layers = tuple(layer for layer in layers if len(layer))
+        self._checked: dict[str, bool] = {}
+
+    def has_permission(self, permission: str) -> bool:
+        allowed = self._checked.get(permission)
+        if allowed is None:
+            allowed = self._checked[permission] = self._resolve(permission)
+
+        return allowed
+
+    def _resolve(self, permission: str) -> bool:
+        for layer in self._layers:
+            decision = layer.match(permission)
+            if decision is not None:
+                return decision
+
+        return False
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    A snapshot of the cache of effective permissions.
+
+    Attributes
+    ----------
+
+    size : int
+        The number of cached entries.
+
+    max_size : int
+        The maximum number of cached entries.
+
+    hits : int
+        The number of lookups answered from the cache.
+
+    misses : int
+        The number of lookups which compiled the effective permissions.
+
+    hit_rate : float
+        The share of lookups answered from the cache.
+
+    evictions : int
+        The number of entries evicted because the cache was full.
+
+    invalidations : int
+        The number of entries removed because a role, member or override
+        changed.
+
+    """
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    invalidations: int
+
+
+class NodeResolver:
+    """
+    Resolves permission nodes of members per guild and channel. The nodes
+    granted to roles, channel overrides for roles and channel overrides for
+    members are compiled into one trie per layer. The effective permissions
+    per (guild, member, channel) are kept in an LRU cache, whose entries are
+    invalidated precisely when a role, member or override they depend on
+    changes.
+
+    Parameters
+    ----------
+
+    max_size : int, optional
+        The maximum number of cached effective permissions. Default is
+        ``10000``.
+
+    """
+
+    def __init__(self, max_size: int = 10000) -> None:
+        if max_size < 1:
+            raise InvalidConfigurationError("The cache size must be at least 1!")
+
+        self._max_size = max_size
+
+        self._roles: dict[Hashable, tuple[str, ...]] = {}
+        self._members: dict[tuple[Hashable, Hashable], tuple[Hashable, ...]] = {}
+        self._role_overrides: dict[tuple[Hashable, Hashable], tuple[str, ...]] = {}
+        self._member_overrides: dict[tuple[Hashable, Hashable], tuple[str, ...]] = {}
+
+        self._cache: OrderedDict[_CacheKey, EffectivePermissions] = OrderedDict()
+
+        # Role, member and channel -> cache keys depending on them
+        self._by_role: dict[Hashable, set[_CacheKey]] = {}
+        self._by_member: dict[tuple[Hashable, Hashable], set[_CacheKey]] = {}
+        self._by_channel: dict[Hashable, set[_CacheKey]] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def set_max_size(self, max_size: int) -> None:
+        """
+        Sets the maximum number of cached effective permissions and evicts
+        the least recently used entries exceeding it.
+
+        Parameters
+        ----------
+
+        max_size : int
+            The maximum number of cached effective permissions.
+        """
+        if max_size < 1:
+            raise InvalidConfigurationError("The cache size must be at least 1!")
+
+        self._max_size = max_size
+        while len(self._cache) > self._max_size:
+            self._discard(next(iter(self._cache)))
+            self._evictions += 1
+
+    def set_role(self, role: Hashable, nodes: Iterable[str]) -> None:
+        """
+        Sets the nodes granted to a role.
+
+        Parameters
+        ----------
+
+        role : Hashable
+            The ID of the role.
+
+        nodes : Iterable[str]
+            The permission nodes.
+        """
+        nodes = tuple(nodes)
+        if self._roles.get(role) != nodes:
+            # Raises for malformed nodes before anything is changed
+            NodeTrie(nodes)
+
+            self._roles[role] = nodes
+            self.invalidate_role(role)
+
+    def remove_role(self, role: Hashable) -> None:
+        self._roles.pop(role, None)
+        self.invalidate_role(role)
+
+    def delete_role(self, role: Hashable) -> None:
+        """
+        Removes a role, which was deleted from its guild, from all members.
+        The nodes granted to the role are kept, as they are configured.
+
+        Parameters
+        ----------
+
+        role : Hashable
+            The ID of the role.
+        """
+        for (guild, member), roles in list(self._members.items()):
+            if role in roles:
+                self.set_member(guild, member, (r for r in roles if r != role))
+
+    def get_roles(self) -> dict[Hashable, tuple[str, ...]]:
+        return dict(self._roles)
+
+    def get_role_overrides(self) -> dict[tuple[Hashable, Hashable], tuple[str, ...]]:
+        return dict(self._role_overrides)
+
+    def get_member_overrides(
+        self,
+    ) -> dict[tuple[Hashable, Hashable], tuple[str, ...]]:
+        return dict(self._member_overrides)
+
+    def set_member(
+        self, guild: Hashable, member: Hashable, roles: Iterable[Hashable]
+    ) -> None:
+        """
+        Sets the roles of a member.
+
+        Parameters
+        ----------
+
+        guild : Hashable
+            The ID of the guild.
+
+        member : Hashable
+            The ID of the member.
+
+        roles : Iterable[Hashable]
+            The IDs of the member's roles.
+        """
+        roles = tuple(roles)
+        if self._members.get((guild, member)) != roles:
+            # The cached entries are indexed by the previous roles
+            self.invalidate_member(guild, member)
+            self._members[guild, member] = roles
+
+    def remove_member(self, guild: Hashable, member: Hashable) -> None:
+        self.invalidate_member(guild, member)
+        self._members.pop((guild, member), None)
+
+    def remove_guild(self, guild: Hashable) -> None:
+        for key in [key for key in self._members if key[0] == guild]:
+            self.remove_member(*key)
+
+    def set_role_override(
+        self, channel: Hashable, role: Hashable, nodes: Iterable[str]
+    ) -> None:
+        """
+        Sets the nodes of a role in a channel. They take precedence over the
+        nodes granted to the role.
+
+        Parameters
+        ----------
+
+        channel : Hashable
+            The ID of the channel.
+
+        role : Hashable
+            The ID of the role.
+
+        nodes : Iterable[str]
+            The permission nodes. If empty, the override is removed.
+        """
+        if self._set_override(self._role_overrides, channel, role, nodes):
+            self._invalidate(
+                self._by_channel.get(channel, set()) & self._by_role.get(role, set())
+            )
+
+    def set_member_override(
+        self, channel: Hashable, member: Hashable, nodes: Iterable[str]
+    ) -> None:
+        """
+        Sets the nodes of a member in a channel. They take precedence over
+        all other nodes.
+
+        Parameters
+        ----------
+
+        channel : Hashable
+            The ID of the channel.
+
+        member : Hashable
+            The ID of the member.
+
+        nodes : Iterable[str]
+            The permission nodes. If empty, the override is removed.
+        """
+        if self._set_override(self._member_overrides, channel, member, nodes):
+            self._invalidate(
+                key for key in self._by_channel.get(channel, ()) if key[1] == member
+            )
+
+    def clear_overrides(self, channel: Hashable) -> None:
+        for overrides in (self._role_overrides, self._member_overrides):
+            for key in [key for key in overrides if key[0] == channel]:
+                del overrides[key]
+
+        self.invalidate_channel(channel)
+
+    def get_effective(
+        self, guild: Hashable, member: Hashable, channel: Hashable | None = None
+    ) -> EffectivePermissions:
+        """
+        Returns the effective permissions of a member.
+
+        Parameters
+        ----------
+
+        guild : Hashable
+            The ID of the guild.
+
+        member : Hashable
+            The ID of the member.
+
+        channel : Hashable | None, optional
+            The ID of the channel. If ``None``, channel overrides are not
+            applied. Default is ``None``.
+
+        Returns
+        -------
+
+        EffectivePermissions : The effective permissions.
+        """
+        key = (guild, member, channel)
+
+        effective = self._cache.get(key)
+        if effective is not None:
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return effective
+
+        self._misses += 1
+        effective = self._compile(key)
+
+        self._cache[key] = effective
+        if len(self._cache) > self._max_size:
+            self._discard(next(iter(self._cache)))
+            self._evictions += 1
+
+        return effective
+
+    def has_permission(
+        self,
+        guild: Hashable,
+        member: Hashable,
+        permission: str,
+        channel: Hashable | None = None,
+    ) -> bool:
+        return self.get_effective(guild, member, channel).has_permission(permission)
+
+    def invalidate_role(self, role: Hashable) -> None:
+        self._invalidate(self._by_role.get(role, ()))
+
+    def invalidate_member(self, guild: Hashable, member: Hashable) -> None:
+        self._invalidate(self._by_member.get((guild, member), ()))
+
+    def invalidate_channel(self, channel: Hashable) -> None:
+        self._invalidate(self._by_channel.get(channel, ()))
+
+    def get_stats(self) -> CacheStats:
+        lookups = self._hits + self._misses
+
+        return CacheStats(
+            size=len(self._cache),
+            max_size=self._max_size,
+            hits=self._hits,
+            misses=self._misses,
+            hit_rate=self._hits / lookups if lookups else 0.0,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+        )
+
+    def _set_override(
+        self,
+        overrides: dict[tuple[Hashable, Hashable], tuple[str, ...]],
+        channel: Hashable,
+        target: Hashable,
+        nodes: Iterable[str],
+    ) -> bool:
+        nodes = tuple(nodes)
+        if overrides.get((channel, target), ()) == nodes:
+            return False
+
+        # Raises for malformed nodes before anything is changed
+        NodeTrie(nodes)
+
+        if nodes:
+            overrides[channel, target] = nodes
+        else:
+            del overrides[channel, target]
+
+        return True
+
+    def _compile(self, key: _CacheKey) -> EffectivePermissions:
+        guild, member, channel = key
+        roles = self._members.get((guild, member), ())
+
+        layers = []
+        if channel is not None:
+            layers.append(NodeTrie(self._member_overrides.get((channel, member), ())))
+            layers.append(
+                NodeTrie(
+                    node
+                    for role in roles
+                    for node in self._role_overrides.get((channel, role), ())
+                )
+            )
+        layers.append(
+            NodeTrie(node for role in roles for node in self._roles.get(role, ()))
+        )
+
+        for role in roles:
+            self._by_role.setdefault(role, set()).add(key)
+        self._by_member.setdefault((guild, member), set()).add(key)
+        if channel is not None:
+            self._by_channel.setdefault(channel, set()).add(key)
+
+        return EffectivePermissions(layers=tuple(layers))
+
+    def _invalidate(self, keys: Iterable[_CacheKey]) -> None:
+        for key in list(keys):
+            if self._discard(key):
+                self._invalidations += 1
+
+    def _discard(self, key: _CacheKey) -> bool:
+        if self._cache.pop(key, None) is None:
+            return False
+
+        guild, member, channel = key
+        for role in self._members.get((guild, member), ()):
+            self._remove_index(self._by_role, role, key)
+        self._remove_index(self._by_member, (guild, member), key)
+        if channel is not None:
+            self._remove_index(self._by_channel, channel, key)
+
+        return True
+
+    @staticmethod
+    def _remove_index(
+        index: dict[Hashable, set[_CacheKey]], value: Hashable, key: _CacheKey
+    ) -> None:
+        keys = index.get(value)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[value]
@@ -0,0 +1,278 @@
+from collections.abc import Collection, Hashable, Iterable, Sequence
+
+import numpy as np
+
+__all__ = ["PermissionRegistry", "PermissionResolver"]
+
+_WORD_BITS = 64
+
+
+class PermissionRegistry:
+    """
+    Interns permission names to bit positions, so that sets of permissions
+    can be stored as integers.
+    """
+
+    def __init__(self) -> None:
+        self._bits: dict[str, int] = {}
+        self._names: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._bits
+
+    def intern(self, name: str) -> int:
+        """
+        Returns the bit position of a permission and assigns the next free
+        position to unknown permissions.
+
+        Parameters
+        ----------
+
+        name : str
+            The name of the permission.
+
+        Returns
+        -------
+
+        int : The bit position.
+        """
+        bit = self._bits.get(name)
+        if bit is None:
+            bit = self._bits[name] = len(self._names)
+            self._names.append(name)
+
+        return bit
+
+    def get_mask(self, names: Iterable[str]) -> int:
+        """
+        Compiles permission names into a bitset.
+
+        Parameters
+        ----------
+
+        names : Iterable[str]
+            The names of the permissions.
+
+        Returns
+        -------
+
+        int : The bitset.
+        """
+        mask = 0
+        for name in names:
+            mask |= 1 << self.intern(name)
+
+        return mask
+
+    def get_names(self, mask: int) -> list[str]:
+        """
+        Decompiles a bitset into permission names.
+
+        Parameters
+        ----------
+
+        mask : int
+            The bitset.
+
+        Returns
+        -------
+
+        list[str] : The names of the permissions in the order they were
+        interned.
+        """
+        return [name for bit, name in enumerate(self._names) if mask >> bit & 1]
+
+
+class PermissionResolver:
+    """
+    Resolves the effective permissions of members from the permissions
+    granted to their roles. The grants of every role are compiled into a
+    bitset, so resolving a member takes one OR per role. ``resolve_many``
+    resolves many members at once from a NumPy matrix of all role bitsets.
+
+    Roles which are unknown to the resolver (e.g. deleted roles) grant no
+    permissions.
+
+    Parameters
+    ----------
+
+    registry : PermissionRegistry | None, optional
+        The registry the permission names are interned in. If ``None``, a new
+        registry is created. Default is ``None``.
+
+    """
+
+    def __init__(self, registry: PermissionRegistry | None = None) -> None:
+        self._registry = registry if registry is not None else PermissionRegistry()
+        self._roles: dict[Hashable, int] = {}
+
+        # Compiled lazily by resolve_many and reset on every role change
+        self._indices: dict[Hashable, int] | None = None
+        self._matrix: np.ndarray | None = None
+
+    def get_registry(self) -> PermissionRegistry:
+        return self._registry
+
+    def set_role(self, role: Hashable, permissions: Iterable[str]) -> None:
+        """
+        Sets the permissions granted to a role.
+
+        Parameters
+        ----------
+
+        role : Hashable
+            The ID of the role.
+
+        permissions : Iterable[str]
+            The names of the permissions.
+        """
+        self._roles[role] = self._registry.get_mask(permissions)
+        self._indices = self._matrix = None
+
+    def remove_role(self, role: Hashable) -> None:
+        if self._roles.pop(role, None) is not None:
+            self._indices = self._matrix = None
+
+    def get_role_mask(self, role: Hashable) -> int:
+        return self._roles.get(role, 0)
+
+    def resolve(self, roles: Iterable[Hashable]) -> int:
+        """
+        Resolves the effective permissions of a member.
+
+        Parameters
+        ----------
+
+        roles : Iterable[Hashable]
+            The IDs of the member's roles.
+
+        Returns
+        -------
+
+        int : The bitset of the effective permissions.
+        """
+        grants = self._roles
+        mask = 0
+        for role in roles:
+            mask |= grants.get(role, 0)
+
+        return mask
+
+    def has_permissions(self, roles: Iterable[Hashable], *permissions: str) -> bool:
+        """
+        Checks whether a member has all the given permissions.
+
+        Parameters
+        ----------
+
+        roles : Iterable[Hashable]
+            The IDs of the member's roles.
+
+        *permissions : str
+            The names of the permissions.
+
+        Returns
+        -------
+
+        bool : Whether the member has all the permissions.
+        """
+        if any(permission not in self._registry for permission in permissions):
+            return False
+
+        required = self._registry.get_mask(permissions)
+        return self.resolve(roles) & required == required
+
+    def resolve_many(self, members: Sequence[Collection[Hashable]]) -> np.ndarray:
+        """
+        Resolves the effective permissions of many members at once.
+
+        Parameters
+        ----------
+
+        members : Sequence[Collection[Hashable]]
+            The IDs of the roles of every member.
+
+        Returns
+        -------
+
+        np.ndarray : A ``uint64`` array of shape ``(members, words)``. The
+        permission with bit position ``b`` is stored in bit ``b % 64`` of
+        word ``b // 64``.
+        """
+        indices, matrix = self._compile()
+
+        # Unknown roles point to the last row of the matrix, which is empty
+        unknown = len(matrix) - 1
+        counts = np.fromiter(map(len, members), dtype=np.int64, count=len(members))
+        flat = np.fromiter(
+            (indices.get(role, unknown) for roles in members for role in roles),
+            dtype=np.int64,
+            count=int(counts.sum()),
+        )
+
+        result = np.zeros((len(members), matrix.shape[1]), dtype=np.uint64)
+        if not len(flat):
+            return result
+
+        # reduceat needs an offset per segment, which is only meaningful for
+        # members with at least one role
+        nonempty = counts > 0
+        offsets = (np.cumsum(counts) - counts)[nonempty]
+        result[nonempty] = np.bitwise_or.reduceat(matrix[flat], offsets, axis=0)
+
+        return result
+
+    def check_many(
+        self, members: Sequence[Collection[Hashable]], *permissions: str
+    ) -> np.ndarray:
+        """
+        Checks for many members at once whether they have all the given
+        permissions.
+
+        Parameters
+        ----------
+
+        members : Sequence[Collection[Hashable]]
+            The IDs of the roles of every member.
+
+        *permissions : str
+            The names of the permissions.
+
+        Returns
+        -------
+
+        np.ndarray : A boolean array with one entry per member.
+        """
+        if any(permission not in self._registry for permission in permissions):
+            return np.zeros(len(members), dtype=bool)
+
+        resolved = self.resolve_many(members)
+        required = self._to_words(
+            self._registry.get_mask(permissions), resolved.shape[1]
+        )
+
+        return np.all(resolved & required == required, axis=1)
+
+    def _compile(self) -> tuple[dict[Hashable, int], np.ndarray]:
+        if self._indices is None or self._matrix is None:
+            words = max(1, -(-len(self._registry) // _WORD_BITS))
+
+            self._indices = {role: i for i, role in enumerate(self._roles)}
+            self._matrix = np.zeros((len(self._roles) + 1, words), dtype=np.uint64)
+            for role, i in self._indices.items():
+                self._matrix[i] = self._to_words(self._roles[role], words)
+
+        return self._indices, self._matrix
+
+    @staticmethod
+    def _to_words(mask: int, words: int) -> np.ndarray:
+        return np.array(
+            [
+                mask >> (word * _WORD_BITS) & (2**_WORD_BITS - 1)
+                for word in range(words)
+            ],
+            dtype=np.uint64,
+        )
@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from nexus.cli.cli import entry_point
+
+_HEAVY_MODULES = {"aiohttp", "discord", "numpy"}
+
+
+def test_config_get(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    result = CliRunner().invoke(entry_point, ["config", "get", "cli.rich.style"])
+
+    assert result.exit_code == 0
+    assert "box" in result.output
+
+
+def test_config_get_imports(tmp_path: Path) -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "from nexus.cli.cli import entry_point; "
+            "entry_point(['config', 'get', 'cli.color_palette'])",
+        ],
+        env=os.environ | {"HOME": str(tmp_path), "USERPROFILE": str(tmp_path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imported = {
+        line.rsplit("|", 1)[1].strip().split(".")[0]
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+    assert "latte" in result.stdout
+    assert "nexus" in imported
+    assert imported & _HEAVY_MODULES == set()
+
+
+def test_coordinator(monkeypatch) -> None:
+    calls = []
+    monkeypatch.setattr(
+        "nexus.core.bot.coordination.run_coordinator",
+        lambda **kwargs: calls.append(kwargs),
+    )
+
+    result = CliRunner().invoke(
+        entry_point, ["coordinator", "8", "--port", "9000", "--shards-per-lease", "2"]
+    )
+
+    assert result.exit_code == 0
+    assert calls == [
+        {
+            "host": "127.0.0.1",
+            "port": 9000,
+            "shard_count": 8,
+            "shards_per_lease": 2,
+            "max_concurrency": 1,
+            "identify_interval": 5.0,
+            "lease_ttl": 30.0,
+            "token": None,
+        }
+    ]
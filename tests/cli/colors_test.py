@@ -0,0 +1,34 @@
+import pytest
+
+from nexus.cli import colors
+
+
+def test_palette_lookup(monkeypatch) -> None:
+    monkeypatch.setattr(colors, "_COLORS_ENABLED", True)
+    colors.get_palette.cache_clear()
+
+    latte = colors.get_palette("latte")
+
+    assert latte.blue == "\x1b[38;2;30;102;245m"
+    assert latte["blue"] == latte.blue
+    assert colors.PALETTE.mocha.base == colors.rgb_to_ansi(30, 30, 46)
+    assert colors.get_palette("latte") is latte
+    assert set(colors.PALETTE) == {"latte", "frappe", "macchiato", "mocha"}
+
+    with pytest.raises(AttributeError):
+        colors.PALETTE.espresso
+
+    colors.get_palette.cache_clear()
+
+
+def test_colors_disabled(monkeypatch) -> None:
+    monkeypatch.setenv("NO_COLOR", "1")
+    assert not colors.colors_enabled()
+
+    monkeypatch.setattr(colors, "_COLORS_ENABLED", False)
+    colors.get_palette.cache_clear()
+
+    assert colors.get_palette("latte").blue == ""
+    assert colors._Effects(enabled=False).bold.on == ""
+
+    colors.get_palette.cache_clear()
@@ -0,0 +1,34 @@
+import rich_click as click
+from click.testing import CliRunner
+
+from nexus.cli.lazy import LazyGroup
+
+
+@click.command("hello")
+def hello() -> None:
+    print("Hello")
+
+
+def test_lazy_group() -> None:
+    created = []
+
+    def create_epilog() -> str:
+        created.append(True)
+        return "Epilog"
+
+    @click.group(
+        cls=LazyGroup,
+        lazy_subcommands={"hello": f"{__name__}.hello"},
+        epilog_factory=create_epilog,
+    )
+    def group() -> None:
+        pass
+
+    result = CliRunner().invoke(group, ["hello"])
+    assert result.output == "Hello\n"
+    assert created == []
+
+    result = CliRunner().invoke(group, ["--help"])
+    assert "hello" in result.output
+    assert "Epilog" in result.output
+    assert created == [True]
@@ -0,0 +1,73 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+from discord.gateway import DiscordWebSocket
+
+from nexus.core.bot import Bot
+from nexus.core.config import TOMLConfiguration
+from nexus.core.module import Module, ModuleManager, listener
+
+
+class _MemberModule(Module):
+    def __init__(self, path: Path) -> None:
+        super().__init__(
+            name="members", optional=False, config=TOMLConfiguration(path / "m.toml")
+        )
+        self.removed: list[dict[str, Any]] = []
+
+    @listener("GUILD_MEMBER_REMOVE")
+    async def on_member_remove(self, payload: dict[str, Any]) -> None:
+        self.removed.append(payload)
+
+
+def _connect(bot: Bot) -> DiscordWebSocket:
+    # Attaches a gateway connection without a socket to the bot,
+    # like DiscordWebSocket.from_client does
+    ws = DiscordWebSocket(socket=None, loop=asyncio.get_running_loop())
+    ws.token = None
+    ws.shard_id = None
+    ws._connection = bot._connection
+    ws._discord_parsers = bot._connection.parsers
+    ws._dispatch = bot.dispatch
+
+    return ws
+
+
+def test_gateway_events_reach_modules(tmp_path: Path) -> None:
+    manager = ModuleManager(module_config=TOMLConfiguration(tmp_path / "modules.toml"))
+    manager._modules = {"members": _MemberModule(path=tmp_path)}
+    asyncio.run(manager.enable_module("members"))
+
+    payload = {
+        "guild_id": "1",
+        "user": {"id": "2", "username": "member", "discriminator": "0", "avatar": None},
+    }
+
+    async def main() -> None:
+        bot = Bot(
+            name="test",
+            intents=["members"],
+            default_intents=True,
+            event_sink=manager.dispatch_nowait,
+        )
+        ws = _connect(bot)
+
+        # Only the event with a listener is dispatched
+        for sequence, (event, data) in enumerate(
+            [
+                ("GUILD_ROLE_DELETE", {"guild_id": "1", "role_id": "3"}),
+                ("GUILD_MEMBER_REMOVE", payload),
+            ]
+        ):
+            await ws.received_message(
+                json.dumps({"op": 0, "s": sequence, "t": event, "d": data})
+            )
+
+        await manager.get_module("members").get_queue().join()
+        await manager.shutdown()
+
+    asyncio.run(main())
+
+    assert manager.get_module("members").removed == [payload]
@@ -0,0 +1,220 @@
+import asyncio
+import multiprocessing
+import time
+from queue import Queue
+
+import pytest
+
+from nexus.core.bot.coordination import (
+    CoordinatorServer,
+    LocalShardCoordinator,
+    RemoteShardCoordinator,
+    ShardNode,
+)
+from nexus.core.bot.spec import BotSpec
+from nexus.core.exceptions.generic import ShardCoordinationError
+
+
+class _RecordingNode(ShardNode):
+    def __init__(self, queue: Queue, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._queue: Queue = queue
+
+    async def _run_bot(self, bot) -> None:
+        # Stands in for the gateway connection, which asks the bot for an
+        # IDENTIFY slot before every shard connects.
+        for shard_id in bot.shard_ids:
+            await bot.before_identify_hook(shard_id, initial=True)
+            self._queue.put((self.node, shard_id, time.time()))
+
+        await asyncio.Event().wait()
+
+
+class _LeaseNode(ShardNode):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.shard_ids: list[int] = []
+
+    async def _run_bot(self, bot) -> None:
+        self.shard_ids.extend(bot.shard_ids)
+        await asyncio.Event().wait()
+
+
+def _run_node(host: str, port: int, node: str, queue: Queue) -> None:
+    asyncio.run(
+        _RecordingNode(
+            queue=queue,
+            spec=BotSpec(name="bot", token="token"),
+            coordinator=RemoteShardCoordinator(host=host, port=port),
+            node=node,
+        ).run()
+    )
+
+
+def test_local_leases() -> None:
+    async def main() -> None:
+        coordinator = LocalShardCoordinator(
+            shard_count=4, shards_per_lease=2, lease_ttl=0.2
+        )
+
+        a = await coordinator.acquire_shards(node="a")
+        b = await coordinator.acquire_shards(node="b")
+        assert [a.shard_ids, b.shard_ids] == [[0, 1], [2, 3]]
+        assert await coordinator.acquire_shards(node="c") is None
+
+        await coordinator.release(lease_id=b.lease_id)
+        assert (await coordinator.acquire_shards(node="c")).shard_ids == [2, 3]
+
+        # Leases which are not renewed expire
+        await asyncio.sleep(0.25)
+        assert not await coordinator.renew(lease_id=a.lease_id)
+        assert (await coordinator.acquire_shards(node="d")).shard_ids == [0, 1]
+
+        with pytest.raises(ShardCoordinationError):
+            await coordinator.acquire_identify(shard_id=4)
+
+    asyncio.run(main())
+
+
+def test_remote_coordinator_errors() -> None:
+    async def main() -> None:
+        server = CoordinatorServer(coordinator=LocalShardCoordinator(shard_count=1))
+        await server.start()
+        host, port = server.address
+
+        coordinator = RemoteShardCoordinator.from_address(f"{host}:{port}")
+        with pytest.raises(ShardCoordinationError):
+            await coordinator.acquire_identify(shard_id=1)
+
+        await server.close()
+        with pytest.raises(ShardCoordinationError):
+            await coordinator.acquire_shards(node="a")
+
+    asyncio.run(main())
+
+
+def test_remote_coordinator_token_and_timeout() -> None:
+    async def main() -> None:
+        server = CoordinatorServer(
+            coordinator=LocalShardCoordinator(shard_count=1), token="secret"
+        )
+        await server.start()
+        host, port = server.address
+
+        # Requests without the token of the server are rejected
+        for token in [None, "wrong"]:
+            coordinator = RemoteShardCoordinator(host=host, port=port, token=token)
+            with pytest.raises(ShardCoordinationError, match="not authorized"):
+                await coordinator.acquire_shards(node="a")
+
+        coordinator = RemoteShardCoordinator.from_address(
+            f"{host}:{port}", token="secret"
+        )
+        assert (await coordinator.acquire_shards(node="a")).shard_ids == [0]
+        await server.close()
+
+        # A server which never responds does not hold back the node
+        async def ignore(reader, writer) -> None:
+            await asyncio.sleep(10)
+
+        silent = await asyncio.start_server(ignore, host="127.0.0.1", port=0)
+        host, port = silent.sockets[0].getsockname()[:2]
+
+        coordinator = RemoteShardCoordinator(host=host, port=port, timeout=0.1)
+        with pytest.raises(ShardCoordinationError, match="did not respond"):
+            await asyncio.wait_for(coordinator.acquire_shards(node="a"), timeout=1)
+
+        silent.close()
+
+    asyncio.run(main())
+
+
+def test_node_holds_several_leases() -> None:
+    async def main() -> None:
+        coordinator = LocalShardCoordinator(shard_count=6, shards_per_lease=2)
+        spec = BotSpec(name="bot", token="token")
+
+        a = _LeaseNode(
+            spec=spec, coordinator=coordinator, retry_interval=0.01, max_leases=2
+        )
+        b = _LeaseNode(spec=spec, coordinator=coordinator, retry_interval=0.01)
+        tasks = [asyncio.create_task(node.run()) for node in [a, b]]
+
+        while len(coordinator.get_leases()) < 3:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+
+        # The shards are shared, but no node holds more leases than allowed
+        assert 0 < len(a.shard_ids) <= 4
+        assert sorted(a.shard_ids + b.shard_ids) == list(range(6))
+
+        a.request_shutdown()
+        await tasks[0]
+        assert len(coordinator.get_leases()) == 3 - len(a.shard_ids) // 2
+
+        # The remaining node takes over the released shards
+        while len(coordinator.get_leases()) < 3:
+            await asyncio.sleep(0.01)
+        assert sorted(b.shard_ids) == list(range(6))
+
+        b.request_shutdown()
+        await tasks[1]
+        assert coordinator.get_leases() == []
+
+    asyncio.run(main())
+
+
+def test_nodes_share_shards() -> None:
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    interval = 0.5
+
+    async def main() -> list[tuple[str, int, float]]:
+        server = CoordinatorServer(
+            coordinator=LocalShardCoordinator(
+                shard_count=8,
+                shards_per_lease=2,
+                max_concurrency=2,
+                identify_interval=interval,
+            )
+        )
+        await server.start()
+        host, port = server.address
+
+        processes = [
+            context.Process(
+                target=_run_node, args=(host, port, f"node-{i}", queue), daemon=True
+            )
+            for i in range(5)
+        ]
+        for process in processes:
+            process.start()
+
+        try:
+            return [await asyncio.to_thread(queue.get, timeout=60) for _ in range(8)]
+        finally:
+            for process in processes:
+                process.kill()
+                process.join()
+
+            await server.close()
+
+    identifies = asyncio.run(main())
+
+    shards_by_node: dict[str, list[int]] = {}
+    for node, shard_id, _ in identifies:
+        shards_by_node.setdefault(node, []).append(shard_id)
+
+    # Every shard is leased by exactly one node and one node is left idle
+    assert len(shards_by_node) == 4
+    assert sorted(map(sorted, shards_by_node.values())) == [
+        [0, 1],
+        [2, 3],
+        [4, 5],
+        [6, 7],
+    ]
+
+    # Shards in the same bucket IDENTIFY at most once per interval
+    for bucket in range(2):
+        times = sorted(t for _, shard_id, t in identifies if shard_id % 2 == bucket)
+        assert all(b - a >= interval * 0.8 for a, b in zip(times, times[1:]))
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from pathlib import Path
+
+import pytest
+from discord import Intents
+
+from nexus.core.bot.intents import analyze_intents, intents_from_requirements
+from nexus.core.bot.manager import BotManager
+from nexus.core.config import TOMLConfiguration
+from nexus.core.exceptions.generic import InvalidConfigurationError
+from nexus.core.module import Module, ModuleManager, listener
+
+
+class _ModerationModule(Module):
+    required_intents = ("message_content",)
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(
+            name="moderation", optional=False, config=TOMLConfiguration(path / "m.toml")
+        )
+
+    @listener("MESSAGE_CREATE")
+    async def on_message(self, message: object) -> None:
+        pass
+
+    @listener("GUILD_MEMBER_ADD", "INTERACTION_CREATE")
+    async def on_member(self, member: object) -> None:
+        pass
+
+
+def _get_module_manager(tmp_path: Path) -> ModuleManager:
+    manager = ModuleManager(module_config=TOMLConfiguration(tmp_path / "modules.toml"))
+    manager._modules = {"moderation": _ModerationModule(path=tmp_path)}
+    asyncio.run(manager.enable_module("moderation"))
+
+    return manager
+
+
+def _get_requirements(tmp_path: Path) -> dict[str, set[str]]:
+    return _get_module_manager(tmp_path).get_intent_requirements()
+
+
+def test_requirements(tmp_path: Path) -> None:
+    requirements = _get_requirements(tmp_path)
+
+    assert set(requirements) == {
+        "guild_messages",
+        "dm_messages",
+        "members",
+        "message_content",
+    }
+    assert requirements["members"] == {"moderation.on_member (GUILD_MEMBER_ADD)"}
+
+    intents = intents_from_requirements(requirements)
+    assert intents == Intents(
+        guilds=True, messages=True, members=True, message_content=True
+    )
+
+
+def test_report(tmp_path: Path) -> None:
+    report = analyze_intents(
+        configured=Intents.default(), requirements=_get_requirements(tmp_path)
+    )
+
+    assert list(report.missing) == ["members", "message_content"]
+    assert "presences" not in report.unused
+    assert {"guild_typing", "voice_states"} <= set(report.unused)
+
+
+def test_auto_intents(tmp_path: Path, caplog) -> None:
+    config = TOMLConfiguration(tmp_path / "bots.toml", create_if_not_exists=True)
+    config.dump(
+        {
+            "bots": [
+                {"name": "auto", "token": "x", "auto_intents": True},
+                {"name": "manual", "token": "y", "intents": ["!typing"]},
+            ]
+        }
+    )
+
+    # Without modules, the intents of the bot are unknown
+    with pytest.raises(InvalidConfigurationError, match="auto_intents"):
+        BotManager(bot_config=config).create_bots()
+
+    manager = BotManager(
+        bot_config=config, module_manager=_get_module_manager(tmp_path)
+    )
+    auto, manual = manager.create_bots()
+
+    assert auto.intents == intents_from_requirements(["messages", "members"]) | (
+        Intents(message_content=True)
+    )
+    assert not manual.intents.typing
+
+    reports = manager.get_intent_reports()
+    assert reports["auto"].missing == {} and reports["auto"].unused == []
+
+    with caplog.at_level(logging.INFO, logger="nexus.core.bot.manager"):
+        manager._report_intents(specs=manager.get_bot_specs())
+
+    assert "'manual' does not have the intent 'members'" in caplog.text
+    assert "'manual' subscribes to intents no module needs" in caplog.text
+
+
+def test_start_enables_modules(tmp_path: Path, monkeypatch) -> None:
+    config = TOMLConfiguration(tmp_path / "bots.toml", create_if_not_exists=True)
+    config.dump({"bots": [{"name": "auto", "token": "x", "auto_intents": True}]})
+
+    module_manager = ModuleManager(
+        module_config=TOMLConfiguration(tmp_path / "modules.toml")
+    )
+    module_manager._modules = {"moderation": _ModerationModule(path=tmp_path)}
+    manager = BotManager(bot_config=config, module_manager=module_manager)
+
+    specs = []
+
+    async def run_bots(settings: dict) -> None:
+        specs.extend(manager.get_bot_specs())
+        assert module_manager.is_enabled("moderation")
+
+    monkeypatch.setattr(manager, "_run_bots", run_bots)
+    asyncio.run(manager.start())
+
+    # The bots subscribe to the intents of the modules started with them
+    assert "members" in specs[0].intent_requirements
+    assert not module_manager.is_enabled("moderation")
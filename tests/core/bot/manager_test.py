@@ -0,0 +1,115 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from nexus.core.bot.manager import BotManager
+from nexus.core.config import TOMLConfiguration
+from nexus.core.exceptions.generic import InvalidConfigurationError
+
+
+def test_create_bots(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("NEXUS_TEST_TOKEN", "env-token")
+    (tmp_path / "secrets").mkdir()
+    (tmp_path / "secrets/token").write_text("file-token\n")
+
+    config = TOMLConfiguration(tmp_path / "bots.toml", create_if_not_exists=True)
+    config.dump(
+        {
+            "bots": [
+                {"name": "a", "token": "plain-token"},
+                {
+                    "name": "b",
+                    "intents": ["message_content", "!typing"],
+                    "token_env": "NEXUS_TEST_TOKEN",
+                },
+                {
+                    "name": "c",
+                    "default_intents": False,
+                    "token_file": "secrets/token",
+                },
+            ]
+        }
+    )
+
+    a, b, c = BotManager(bot_config=config).create_bots()
+
+    assert [a.token, b.token, c.token] == ["plain-token", "env-token", "file-token"]
+    assert b.intents.message_content and not b.intents.typing
+    assert c.intents.value == 0
+
+
+def test_invalid_token_sources(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "bots.toml", create_if_not_exists=True)
+    manager = BotManager(bot_config=config)
+
+    for entry in [
+        {"name": "a"},
+        {"name": "a", "token": "x", "token_env": "Y"},
+        {"name": "a", "token_env": "NEXUS_UNSET_TOKEN"},
+        {"name": "a", "token_file": "missing"},
+    ]:
+        config.dump({"bots": [entry]})
+
+        with pytest.raises(InvalidConfigurationError):
+            manager.create_bots()
+
+
+def test_invalid_supervisor_settings(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "bots.toml", create_if_not_exists=True)
+    manager = BotManager(bot_config=config)
+
+    for settings in [
+        {"login_dely": 1.0},
+        {"backoff_max": "5m"},
+        {"backoff_base": True},
+        {"login_delay": -1},
+    ]:
+        config.dump({"bots": [], "supervisor": settings})
+
+        # The settings are checked before any bot is started
+        with pytest.raises(InvalidConfigurationError):
+            asyncio.run(manager.start())
+
+
+def test_sharded_bots(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "bots.toml", create_if_not_exists=True)
+    config.dump(
+        {
+            "bots": [
+                {"name": "a", "token": "x", "shard_count": 4},
+                {"name": "b", "token": "y", "shard_count": 4, "shards_per_process": 2},
+            ]
+        }
+    )
+    manager = BotManager(bot_config=config)
+
+    a, b = manager.get_bot_specs()
+    assert not a.is_multiprocess() and b.is_multiprocess()
+    assert manager.create_bots()[0].shard_count == 4
+
+    config.dump(
+        {
+            "bots": [
+                {
+                    "name": "a",
+                    "token": "x",
+                    "shards_per_process": 2,
+                    "coordinator": "127.0.0.1:7420",
+                    "max_leases": 3,
+                }
+            ]
+        }
+    )
+    (spec,) = manager.get_bot_specs()
+    assert spec.is_multiprocess() and spec.is_coordinated()
+    assert spec.max_leases == 3
+
+    for entry in [
+        {"name": "a", "token": "x", "shards_per_process": 2},
+        {"name": "a", "token": "x", "shard_count": 0},
+    ]:
+        config.dump({"bots": [entry]})
+
+        with pytest.raises(InvalidConfigurationError):
+            manager.get_bot_specs()
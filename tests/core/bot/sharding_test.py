@@ -0,0 +1,215 @@
+import asyncio
+import json
+import os
+import socket
+import time
+from functools import partial
+from pathlib import Path
+
+import pytest
+import yarl
+from aiohttp import WSMsgType, web
+
+from nexus.core.bot import ShardedBot
+from nexus.core.bot.sharding import ShardLauncher, partition_shards, run_shard_group
+from nexus.core.bot.spec import BotSpec
+
+_USER = {"id": "1", "username": "bot", "discriminator": "0", "avatar": None}
+
+
+def _gateway_worker(spec: BotSpec, shard_ids: list[int], url: str) -> None:
+    # Points the bot of the worker to the fake gateway of the test
+    import discord.http
+    from discord.gateway import DiscordWebSocket
+
+    discord.http.Route.BASE = f"{url}/api/v10"
+    DiscordWebSocket.DEFAULT_GATEWAY = yarl.URL(f"{url}/gateway").with_scheme("ws")
+
+    run_shard_group(spec, shard_ids)
+
+
+def _json_response(data: dict) -> web.Response:
+    # discord.py only parses responses without a charset as JSON
+    return web.Response(body=json.dumps(data).encode(), content_type="application/json")
+
+
+async def _start_gateway(identifies: list[tuple[float, int, int]]) -> web.AppRunner:
+    async def get_user(request: web.Request) -> web.Response:
+        return _json_response(_USER)
+
+    async def get_application(request: web.Request) -> web.Response:
+        return _json_response(
+            {
+                "id": "1",
+                "name": "bot",
+                "description": "",
+                "icon": None,
+                "bot_public": False,
+                "bot_require_code_grant": False,
+                "owner": _USER,
+                "verify_key": "",
+            }
+        )
+
+    async def connect(request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_json({"op": 10, "d": {"heartbeat_interval": 45000}})
+
+        async for message in ws:
+            if message.type != WSMsgType.TEXT:
+                continue
+
+            payload = json.loads(message.data)
+            if payload["op"] == 2:
+                shard_id, shard_count = payload["d"]["shard"]
+                identifies.append((time.monotonic(), shard_id, shard_count))
+
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/api/v10/users/@me", get_user)
+    app.router.add_get("/api/v10/oauth2/applications/@me", get_application)
+    app.router.add_get("/gateway", connect)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+
+    return runner
+
+
+def _identify_worker(
+    spec: BotSpec, shard_ids: list[int], port: int, crash_dir: str
+) -> None:
+    # Stands in for the gateway connection of a shard group: sends one
+    # IDENTIFY payload per shard to a fake gateway and stays connected.
+    marker = Path(crash_dir) / f"crashed-{shard_ids[0]}"
+    crash = shard_ids[0] == 0 and not marker.exists()
+
+    with socket.create_connection(("127.0.0.1", port)) as connection:
+        for shard_id in shard_ids:
+            payload = {
+                "op": 2,
+                "d": {"token": spec.token, "shard": [shard_id, spec.shard_count]},
+                "pid": os.getpid(),
+            }
+            connection.sendall(json.dumps(payload).encode() + b"\n")
+
+        if crash:
+            marker.touch()
+            os._exit(1)
+
+        while True:
+            time.sleep(1)
+
+
+def test_partition_shards() -> None:
+    assert partition_shards(shard_count=8, shards_per_process=3) == [
+        [0, 1, 2],
+        [3, 4, 5],
+        [6, 7],
+    ]
+    assert partition_shards(shard_count=2, shards_per_process=4) == [[0, 1]]
+
+    with pytest.raises(ValueError):
+        partition_shards(shard_count=0, shards_per_process=1)
+
+
+def test_sharded_bot() -> None:
+    spec = BotSpec(name="bot", token="token", shard_count=4, shards_per_process=2)
+    bot = spec.create_bot(shard_ids=[2, 3])
+
+    assert isinstance(bot, ShardedBot)
+    assert bot.shard_count == 4
+    assert bot.shard_ids == [2, 3]
+
+
+def test_launcher_restarts_shard_groups(tmp_path: Path) -> None:
+    identifies: list[dict] = []
+
+    async def handle(reader, writer) -> None:
+        while line := await reader.readline():
+            identifies.append(json.loads(line))
+
+    async def main() -> ShardLauncher:
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        launcher = ShardLauncher(
+            spec=BotSpec(
+                name="bot", token="token", shard_count=8, shards_per_process=3
+            ),
+            target=partial(_identify_worker, port=port, crash_dir=str(tmp_path)),
+            backoff_base=0.1,
+            poll_interval=0.05,
+            shutdown_timeout=5.0,
+        )
+        task = asyncio.create_task(launcher.run())
+
+        # Wait until all shards identified, including the restarted group
+        deadline = time.monotonic() + 60
+        while len(identifies) < 11 and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+        launcher.request_shutdown()
+        await task
+
+        server.close()
+        return launcher
+
+    launcher = asyncio.run(main())
+
+    shards_by_pid: dict[int, list[int]] = {}
+    for payload in identifies:
+        assert payload["op"] == 2
+        shard_id, shard_count = payload["d"]["shard"]
+        assert shard_count == 8
+        shards_by_pid.setdefault(payload["pid"], []).append(shard_id)
+
+    groups = sorted(shards_by_pid.values())
+    assert groups == [[0, 1, 2], [0, 1, 2], [3, 4, 5], [6, 7]]
+    assert launcher.get_restarts() == {0: 1, 1: 0, 2: 0}
+    assert not any(p.is_alive() for p in launcher.get_processes().values())
+
+
+def test_launcher_serializes_identify() -> None:
+    identifies: list[tuple[float, int, int]] = []
+
+    async def main() -> None:
+        runner = await _start_gateway(identifies=identifies)
+        host, port = runner.addresses[0][:2]
+
+        launcher = ShardLauncher(
+            spec=BotSpec(
+                name="bot",
+                token="token",
+                shard_count=6,
+                shards_per_process=2,
+                max_concurrency=2,
+            ),
+            target=partial(_gateway_worker, url=f"http://{host}:{port}"),
+            poll_interval=0.05,
+            shutdown_timeout=5.0,
+            identify_interval=0.5,
+        )
+        task = asyncio.create_task(launcher.run())
+
+        deadline = time.monotonic() + 60
+        while len(identifies) < 6 and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+        launcher.request_shutdown()
+        await task
+        await runner.cleanup()
+
+    asyncio.run(main())
+
+    assert sorted(shard_id for _, shard_id, _ in identifies) == list(range(6))
+    assert all(shard_count == 6 for _, _, shard_count in identifies)
+
+    # The groups connect at the same time, but the shards of a bucket
+    # identify one after another
+    for bucket in range(2):
+        times = [t for t, shard_id, _ in identifies if shard_id % 2 == bucket]
+        assert all(b - a >= 0.45 for a, b in zip(times, times[1:]))
@@ -0,0 +1,77 @@
+import asyncio
+
+from discord import LoginFailure
+
+from nexus.core.bot.supervisor import BotSupervisor
+
+
+class _FakeBot:
+    def __init__(self, name: str, failures: int = 0, login_failure: bool = False):
+        self.name = name
+        self.token = f"{name}-token"
+        self.failures = failures
+        self.login_failure = login_failure
+
+        self.starts: list[float] = []
+        self._closed = asyncio.Event()
+
+    async def start(self, token: str) -> None:
+        assert token == self.token
+        self.starts.append(asyncio.get_running_loop().time())
+
+        if self.login_failure:
+            raise LoginFailure("Improper token has been passed.")
+
+        if len(self.starts) <= self.failures:
+            raise ConnectionError("Gateway connection lost")
+
+        await self._closed.wait()
+
+    async def close(self) -> None:
+        self._closed.set()
+
+    def is_closed(self) -> bool:
+        return self._closed.is_set()
+
+    def is_ready(self) -> bool:
+        return False
+
+    def clear(self) -> None:
+        self._closed = asyncio.Event()
+
+
+def test_staggered_login_and_backoff() -> None:
+    bots = [_FakeBot("a"), _FakeBot("b", failures=3), _FakeBot("c")]
+    supervisor = BotSupervisor(
+        bots=bots, login_delay=0.05, backoff_base=0.01, backoff_factor=2.0
+    )
+
+    async def run() -> None:
+        task = asyncio.create_task(supervisor.run())
+        await asyncio.sleep(0.3)
+
+        assert all(not bot.is_closed() for bot in bots)
+
+        supervisor.request_shutdown()
+        await asyncio.wait_for(task, timeout=1)
+
+    asyncio.run(run())
+
+    assert all(bot.is_closed() for bot in bots)
+    assert bots[1].starts[0] - bots[0].starts[0] >= 0.05
+    assert bots[2].starts[0] - bots[0].starts[0] >= 0.1
+    assert supervisor.get_restarts() == {"a": 0, "b": 3, "c": 0}
+
+    # The delays between the restarts grow exponentially
+    gaps = [end - start for start, end in zip(bots[1].starts, bots[1].starts[1:])]
+    assert gaps[0] >= 0.01 and gaps[1] >= 0.02 and gaps[2] >= 0.04
+
+
+def test_login_failure_is_not_restarted() -> None:
+    bots = [_FakeBot("a", login_failure=True), _FakeBot("b", login_failure=True)]
+    supervisor = BotSupervisor(bots=bots, login_delay=0.0)
+
+    asyncio.run(asyncio.wait_for(supervisor.run(), timeout=1))
+
+    assert [len(bot.starts) for bot in bots] == [1, 1]
+    assert supervisor.get_restarts() == {"a": 0, "b": 0}
@@ -0,0 +1,39 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from nexus.core.config.lock import FileLock
+from nexus.core.exceptions.generic import ConfigLockTimeoutError
+
+fcntl = pytest.importorskip("fcntl")
+
+
+def test_failed_upgrade_keeps_shared_lock(tmp_path: Path) -> None:
+    path = tmp_path / "test.toml.lock"
+    lock = FileLock(path, timeout=0.1)
+
+    # flock locks belong to the open file description, so these descriptors
+    # act like other processes
+    reader = os.open(path, os.O_RDWR | os.O_CREAT)
+    writer = os.open(path, os.O_RDWR)
+
+    try:
+        with lock.shared():
+            fcntl.flock(reader, fcntl.LOCK_SH)
+
+            with pytest.raises(ConfigLockTimeoutError):
+                lock.acquire(exclusive=True)
+
+            # Once the other reader is gone, the shared lock still keeps
+            # writers out
+            fcntl.flock(reader, fcntl.LOCK_UN)
+            with pytest.raises(BlockingIOError):
+                fcntl.flock(writer, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+            assert lock.is_locked() and not lock._state.exclusive
+
+        fcntl.flock(writer, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    finally:
+        os.close(reader)
+        os.close(writer)
@@ -1,11 +1,18 @@
+import asyncio
 import datetime
+import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from nexus.core.config import MissingKeyPolicy, TOMLConfiguration
-from nexus.core.exceptions.generic import InvalidConfigurationError
+from nexus.core.exceptions.generic import (
+    ConfigLockTimeoutError,
+    InvalidConfigurationError,
+)
 
 _TRUE_DATA = {
     "int": 1,
@@ -161,6 +168,35 @@ def test_write(tmp_path: Path) -> None:
         == full_data["sectionA"]["subsectionA"]["subsubsectionA"]
     )
 
+    # Tables can only be deleted explicitly
+    with pytest.raises(TypeError):
+        toml["sectionB"] = None
+
+    del toml["sectionB"]
+    assert "sectionB" not in toml
+
+
+def test_new_file_mode(tmp_path: Path) -> None:
+    umask = os.umask(0o027)
+    try:
+        TOMLConfiguration(tmp_path / "new.toml").dump({"a": 1})
+    finally:
+        os.umask(umask)
+
+    assert (tmp_path / "new.toml").stat().st_mode & 0o777 == 0o640
+
+
+def test_umask_is_not_changed(tmp_path: Path, monkeypatch) -> None:
+    # Other threads would create files with the temporary umask
+    calls = []
+    monkeypatch.setattr(os, "umask", lambda mask: calls.append(mask) or 0o022)
+
+    TOMLConfiguration(tmp_path / "new.toml").dump({"a": 1})
+
+    assert (tmp_path / "new.toml").exists()
+    if Path("/proc/self/status").exists():
+        assert calls == []
+
 
 def test_policies() -> None:
     toml = TOMLConfiguration(
@@ -176,3 +212,325 @@ def test_policies() -> None:
         missing_key_policy=MissingKeyPolicy.RETURN_NONE,
     )
     assert toml["x"] is None
+
+
+def test_cached_read(tmp_path: Path) -> None:
+    shutil.copy(src="tests/core/config/data/test.toml", dst=tmp_path / "test.toml")
+
+    toml = TOMLConfiguration(tmp_path / "test.toml", cached=True)
+
+    assert toml["int"] == 1
+    assert "sectionA.int" in toml
+    assert toml["sectionB.string"] == "test"
+    assert toml.cache_info() == (2, 1)
+
+    # Values handed out from the cache must not alter it
+    toml["sectionB"]["int"] = 5
+    assert toml["sectionB.int"] == 1
+
+
+def test_cache_invalidation(tmp_path: Path) -> None:
+    shutil.copy(src="tests/core/config/data/test.toml", dst=tmp_path / "test.toml")
+
+    toml = TOMLConfiguration(tmp_path / "test.toml", cached=True)
+    other = TOMLConfiguration(tmp_path / "test.toml")
+
+    assert toml["int"] == 1
+
+    other["int"] = 12345
+    assert toml["int"] == 12345
+    assert toml.cache_info().misses == 2
+
+    # Writes through the cached instance refresh the cache without parsing
+    toml["int"] = 2
+    assert toml["int"] == 2
+    assert toml.cache_info().misses == 2
+
+
+def test_transaction(tmp_path: Path) -> None:
+    shutil.copy(src="tests/core/config/data/test.toml", dst=tmp_path / "test.toml")
+
+    toml = TOMLConfiguration(tmp_path / "test.toml")
+    observer = TOMLConfiguration(tmp_path / "test.toml")
+
+    with toml.transaction():
+        for key, value in _ALT_DATA.items():
+            toml[f"sectionB.{key}"] = value
+        del toml["sectionA"]
+
+        # Pending changes are visible to the transaction but not to the file
+        assert toml["sectionB"] == _ALT_DATA
+        assert "sectionA" not in toml
+        assert observer["sectionB"] == _TRUE_DATA
+        assert "sectionA" in observer
+
+    assert observer["sectionB"] == _ALT_DATA
+    assert "sectionA" not in observer
+    assert list(tmp_path.iterdir()) == [tmp_path / "test.toml"]
+
+
+def test_transaction_rollback(tmp_path: Path) -> None:
+    shutil.copy(src="tests/core/config/data/test.toml", dst=tmp_path / "test.toml")
+
+    toml = TOMLConfiguration(tmp_path / "test.toml")
+
+    with pytest.raises(RuntimeError):
+        with toml.transaction():
+            toml["int"] = 2
+            with toml.transaction():
+                toml["float"] = 2.0
+            raise RuntimeError
+
+    assert not toml.in_transaction()
+    assert toml["int"] == 1
+    assert toml["float"] == 1.0
+
+
+def test_get_keys(tmp_path: Path) -> None:
+    toml = TOMLConfiguration(tmp_path / "test.toml", create_if_not_exists=True)
+    toml.dump(
+        {
+            "cli": {
+                "color_palette": "latte",
+                "rich": {"palette": "solarized", "style": "box"},
+            },
+            "exceptions": {"show_locals": False},
+        }
+    )
+
+    assert toml.get_keys() == [
+        "cli",
+        "cli.color_palette",
+        "cli.rich",
+        "cli.rich.palette",
+        "cli.rich.style",
+        "exceptions",
+        "exceptions.show_locals",
+    ]
+    assert toml.get_keys(non_dict_only=True) == [
+        "cli.color_palette",
+        "cli.rich.palette",
+        "cli.rich.style",
+        "exceptions.show_locals",
+    ]
+    assert toml.get_keys(prefix="cli.rich") == ["cli.rich.palette", "cli.rich.style"]
+    assert toml.get_keys(prefix="cli", non_dict_only=True) == [
+        "cli.color_palette",
+        "cli.rich.palette",
+        "cli.rich.style",
+    ]
+    assert toml.get_keys(prefix="cli.color_palette") == []
+    assert toml.get_keys(prefix="x") == []
+
+
+def test_cached_index(tmp_path: Path) -> None:
+    shutil.copy(src="tests/core/config/data/test.toml", dst=tmp_path / "test.toml")
+
+    toml = TOMLConfiguration(tmp_path / "test.toml", cached=True)
+
+    assert toml["sectionA.subsectionA.subsubsectionA"] == _TRUE_DATA
+    assert toml["sectionA.subsectionA.subsubsectionA.dict.a"] == 1.0
+    assert "sectionA.subsectionA.int" in toml
+    assert "sectionA.x" not in toml
+
+    with pytest.raises(KeyError):
+        toml["sectionA.x"]
+
+    with toml.transaction():
+        toml["sectionA.int"] = 2
+        assert "sectionA.int" in toml.get_keys()
+        del toml["sectionA"]
+        assert "sectionA.int" not in toml.get_keys()
+
+    assert "sectionA" not in toml
+    assert toml.get_keys(prefix="sectionB") == [f"sectionB.{k}" for k in _TRUE_DATA] + [
+        "sectionB.dict.a",
+        "sectionB.dict.b",
+    ]
+
+
+def test_lock_timeout(tmp_path: Path) -> None:
+    shutil.copy(src="tests/core/config/data/test.toml", dst=tmp_path / "test.toml")
+
+    writer = TOMLConfiguration(tmp_path / "test.toml", locking=True)
+    other = TOMLConfiguration(tmp_path / "test.toml", locking=True, lock_timeout=0.1)
+
+    def access(operation) -> Exception | None:
+        try:
+            operation()
+        except Exception as e:
+            return e
+
+    with writer.transaction():
+        writer["int"] = 2
+
+        # Instances on the same file share the lock, so other threads wait
+        # for it and the same thread reenters it
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for operation in [lambda: other["int"], lambda: other.__setitem__("b", 3)]:
+                error = executor.submit(access, operation).result()
+                assert isinstance(error, ConfigLockTimeoutError)
+
+        assert other["int"] == 1
+
+    assert other["int"] == 2
+
+
+def test_async_access(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "test.toml", create_if_not_exists=True)
+
+    async def main() -> None:
+        await config.aset("a", {"b": 0})
+        await config.aset("a.b", 1)
+        assert await config.aget("a.b") == 1
+        assert await config.acontains("a")
+        assert not await config.acontains("c")
+
+        await config.aset("a.b", None)
+        assert not await config.acontains("a.b")
+
+    asyncio.run(main())
+
+
+def test_async_transaction(tmp_path: Path) -> None:
+    config = TOMLConfiguration(
+        tmp_path / "test.toml", create_if_not_exists=True, locking=True
+    )
+    config.dump({"count": 0})
+
+    async def increment() -> None:
+        async with config.atransaction():
+            count = await config.aget("count")
+            await asyncio.sleep(0)
+            await config.aset("count", count + 1)
+
+    async def fail() -> None:
+        async with config.atransaction():
+            config["count"] = -1
+            raise ValueError
+
+    async def main() -> None:
+        # Concurrent transactions are serialized, so no increment is lost
+        await asyncio.gather(*(increment() for _ in range(20)))
+
+        with pytest.raises(ValueError):
+            await fail()
+
+    asyncio.run(main())
+
+    assert config["count"] == 20
+    assert not config.in_transaction()
+
+
+def test_async_transaction_cancelled_while_waiting(tmp_path: Path) -> None:
+    config = TOMLConfiguration(
+        tmp_path / "test.toml", create_if_not_exists=True, locking=True
+    )
+    config.dump({"count": 0})
+
+    async def main() -> float:
+        # Another thread holds the transaction, so the begin waits for it
+        holding = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def hold() -> None:
+            with config.transaction():
+                loop.call_soon_threadsafe(holding.set)
+                time.sleep(0.3)
+                config["count"] = 1
+
+        holder = asyncio.create_task(asyncio.to_thread(hold))
+        await holding.wait()
+
+        async def increment() -> None:
+            async with config.atransaction():
+                config["count"] += 1
+
+        task = asyncio.create_task(increment())
+        await asyncio.sleep(0.05)
+
+        start = time.perf_counter()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        cancelled = time.perf_counter() - start
+
+        # The begin finishes after the holder and is undone
+        await holder
+        await asyncio.sleep(0.1)
+
+        async with config.atransaction():
+            config["count"] += 1
+
+        return cancelled
+
+    assert asyncio.run(main()) < 0.1
+    assert config["count"] == 2
+    assert not config._lock.is_locked()
+
+
+def test_transaction_ownership(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "test.toml", create_if_not_exists=True)
+    config.dump({"a": 0, "b": 0})
+
+    async def main() -> None:
+        started = asyncio.Event()
+
+        async def transaction() -> None:
+            async with config.atransaction():
+                config["a"] = 1
+                started.set()
+                await asyncio.sleep(0.1)
+
+        async def other() -> None:
+            await started.wait()
+
+            # Other tasks neither see nor join the pending transaction
+            assert config["a"] == 0
+            assert not config.in_transaction()
+            with pytest.raises(ConfigLockTimeoutError):
+                config["b"] = 1
+
+            await config.aset("b", 2)
+
+        await asyncio.gather(transaction(), other())
+
+    asyncio.run(main())
+
+    assert config.asdict() == {"a": 1, "b": 2}
+
+
+def test_async_write_keeps_loop_responsive(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "large.toml", create_if_not_exists=True)
+    content = {
+        f"section_{i}": {f"key_{j}": f"value_{i}_{j}" for j in range(100)}
+        for i in range(500)
+    }
+
+    start = time.perf_counter()
+    config.dump(content)
+    blocking_time = time.perf_counter() - start
+
+    async def main() -> float:
+        lag = 0.0
+        done = asyncio.Event()
+
+        async def tick() -> None:
+            nonlocal lag
+            while not done.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(0.001)
+                lag = max(lag, time.perf_counter() - start - 0.001)
+
+        async def write() -> None:
+            async with config.atransaction():
+                config["section_0.key_0"] = "changed"
+            done.set()
+
+        await asyncio.gather(tick(), write())
+        return lag
+
+    lag = asyncio.run(main())
+
+    assert config["section_0.key_0"] == "changed"
+    assert lag < max(blocking_time / 4, 0.02)
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+
+from nexus.core.config import VariableLibrary
+
+
+@pytest.fixture
+def library(tmp_path: Path, monkeypatch) -> VariableLibrary:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(VariableLibrary, "_instance", None)
+    return VariableLibrary()
+
+
+def test_defaults_without_file(library: VariableLibrary) -> None:
+    assert VariableLibrary.get_variable("cli.color_palette") == "latte"
+    assert VariableLibrary.get_variable("cli.rich") == {
+        "palette": "solarized",
+        "style": "box",
+    }
+
+    with pytest.raises(KeyError):
+        VariableLibrary.get_variable("cli.x")
+
+    assert not library.get_path().exists()
+
+
+def test_generate_writes_only_changes(library: VariableLibrary) -> None:
+    VariableLibrary.set_variable("cli.color_palette", "mocha")
+    assert VariableLibrary.get_variable("cli.color_palette") == "mocha"
+
+    signature = library._config._stat_signature()
+    library.generate()
+    assert library._config._stat_signature() == signature
+
+    del library._config["exceptions"]
+    assert VariableLibrary.get_variable("exceptions.show_locals") is False
+
+    library.generate()
+    assert library._config["exceptions.show_locals"] is False
+    assert library._config["cli.color_palette"] == "mocha"
+
+    library.generate(regenerate=True)
+    assert VariableLibrary.get_variable("cli.color_palette") == "latte"
+
+
+def test_merged_content_cache(library: VariableLibrary) -> None:
+    library.generate()
+    content = library._content()
+
+    assert library._content() is content
+    assert VariableLibrary.get_variable("cli.rich") is not content["cli"]["rich"]
+
+    # Changes made by other processes invalidate the merged content
+    library.get_path().write_text('[cli]\ncolor_palette = "frappe"\n')
+
+    assert VariableLibrary.get_variable("cli.color_palette") == "frappe"
+    assert VariableLibrary.get_variable("cli.rich.style") == "box"
+    assert library._content() is not content
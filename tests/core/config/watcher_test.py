@@ -0,0 +1,116 @@
+import asyncio
+import time
+from pathlib import Path
+
+from nexus.core.config import TOMLConfiguration
+from nexus.core.config.watcher import ConfigWatcher
+
+
+def test_watcher_reports_changed_keys(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "bots.toml", create_if_not_exists=True)
+    config.dump({"cli": {"color_palette": "latte", "rich": {"style": "box"}}})
+
+    other = TOMLConfiguration(
+        tmp_path / "config/modules/test.toml", create_if_not_exists=True
+    )
+
+    received = []
+    rich_changes = []
+
+    async def on_rich_change(path: Path, keys: set[str]) -> None:
+        rich_changes.append(keys)
+
+    async def run() -> None:
+        watcher = ConfigWatcher(root=tmp_path, interval=3600, debounce=0.01)
+        watcher.subscribe(lambda path, keys: received.append((path, keys)))
+        watcher.subscribe(on_rich_change, path=config._path, prefix="cli.rich")
+
+        await watcher.start()
+
+        assert await watcher.poll() == {}
+
+        # A burst of writes is reported as a single change
+        config["cli.color_palette"] = "mocha"
+        config["cli.color_palette"] = "frappe"
+        config["cli.new"] = 1
+
+        changes = await watcher.poll()
+        assert changes == {
+            config._path.resolve(): {"cli", "cli.color_palette", "cli.new"}
+        }
+        assert rich_changes == []
+
+        config["cli.rich.style"] = "round"
+        other["key"] = 1
+        await watcher.poll()
+
+        await watcher.stop()
+        assert not watcher.is_running()
+
+    asyncio.run(run())
+
+    assert len(received) == 3
+    assert (other._path.resolve(), {"key"}) in received
+    assert rich_changes == [{"cli.rich", "cli.rich.style"}]
+
+
+def test_watcher_ignores_invalid_files(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "bots.toml", create_if_not_exists=True)
+    config.dump({"a": 1})
+
+    async def run() -> None:
+        watcher = ConfigWatcher(root=tmp_path, interval=3600, debounce=0.01)
+        await watcher.start()
+
+        config._path.write_text("a = ")
+        assert await watcher.poll() == {}
+
+        # The invalid file is not parsed again until it is modified
+        loads = []
+        load = watcher._load
+        watcher._load = lambda path: loads.append(path) or load(path)
+        assert await watcher.poll() == {}
+        assert loads == []
+
+        config.dump({"a": 1, "b": 2})
+        assert await watcher.poll() == {config._path.resolve(): {"b"}}
+
+        config._path.unlink()
+        assert await watcher.poll() == {config._path.resolve(): {"a", "b"}}
+
+        await watcher.stop()
+
+    asyncio.run(run())
+
+
+def test_watcher_reports_continuous_writes(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "bots.toml", create_if_not_exists=True)
+    config.dump({"count": 0})
+
+    async def run() -> None:
+        watcher = ConfigWatcher(
+            root=tmp_path, interval=3600, debounce=0.05, max_wait=0.3
+        )
+        await watcher.start()
+
+        async def write() -> None:
+            count = 0
+            while True:
+                count += 1
+                config["count"] = count
+                await asyncio.sleep(0.01)
+
+        writer = asyncio.create_task(write())
+        await asyncio.sleep(0.01)
+
+        # A file written more often than the debounce time is still reported
+        start = time.perf_counter()
+        changes = await asyncio.wait_for(watcher.poll(), timeout=2)
+
+        assert time.perf_counter() - start < 1
+        assert changes == {config._path.resolve(): {"count"}}
+
+        writer.cancel()
+        await watcher.stop()
+
+    asyncio.run(run())
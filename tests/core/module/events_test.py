@@ -0,0 +1,106 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from nexus.core.config import TOMLConfiguration
+from nexus.core.exceptions.generic import InvalidConfigurationError
+from nexus.core.module import (
+    EventClassifier,
+    EventDispatcher,
+    EventPriority,
+    Module,
+    ModuleManager,
+    listener,
+)
+
+
+class _EchoModule(Module):
+    def __init__(self, name: str, path: Path) -> None:
+        super().__init__(
+            name=name, optional=False, config=TOMLConfiguration(path / f"{name}.toml")
+        )
+        self.received: list[tuple[str, object]] = []
+
+    @listener("MESSAGE_CREATE")
+    async def on_message(self, message: object) -> None:
+        self.received.append(("MESSAGE_CREATE", message))
+
+    @listener("guild_create", "GUILD_UPDATE")
+    async def on_guild(self, guild: object) -> None:
+        self.received.append(("GUILD", guild))
+
+
+class _FailingModule(_EchoModule):
+    async def on_message(self, message: object) -> None:
+        raise RuntimeError
+
+    @listener("MESSAGE_CREATE")
+    async def on_message_failing(self, message: object) -> None:
+        raise RuntimeError
+
+
+def test_listeners(tmp_path: Path) -> None:
+    module = _EchoModule(name="echo", path=tmp_path)
+
+    assert set(module.get_listeners()) == {
+        "MESSAGE_CREATE",
+        "GUILD_CREATE",
+        "GUILD_UPDATE",
+    }
+    # Overriding a handler without the decorator unsubscribes it
+    assert _FailingModule._listeners["MESSAGE_CREATE"] == ("on_message_failing",)
+
+
+def test_dispatch(tmp_path: Path) -> None:
+    echo = _EchoModule(name="echo", path=tmp_path)
+    failing = _FailingModule(name="failing", path=tmp_path)
+
+    dispatcher = EventDispatcher()
+    dispatcher.rebuild(modules=[failing, echo])
+
+    asyncio.run(dispatcher.dispatch("MESSAGE_CREATE", "hello"))
+    asyncio.run(dispatcher.dispatch("GUILD_UPDATE", "guild"))
+    asyncio.run(dispatcher.dispatch("TYPING_START", "typing"))
+
+    assert echo.received == [("MESSAGE_CREATE", "hello"), ("GUILD", "guild")]
+    assert dispatcher.get_events() == {"MESSAGE_CREATE", "GUILD_CREATE", "GUILD_UPDATE"}
+
+
+def test_manager_rebuilds_on_enable(tmp_path: Path) -> None:
+    manager = ModuleManager(module_config=TOMLConfiguration(tmp_path / "modules.toml"))
+    manager._modules = {
+        name: _EchoModule(name=name, path=tmp_path) for name in ["a", "b"]
+    }
+
+    asyncio.run(manager.enable_module("a"))
+    asyncio.run(manager.enable_module("b"))
+    assert len(manager.get_dispatcher().get_handlers("message_create")) == 2
+
+    asyncio.run(manager.disable_module("a"))
+
+    async def dispatch() -> None:
+        await manager.dispatch("MESSAGE_CREATE", "hello")
+        await manager.get_module("b").get_queue().join()
+
+    asyncio.run(dispatch())
+
+    assert manager.get_module("a").received == []
+    assert manager.get_module("b").received == [("MESSAGE_CREATE", "hello")]
+    assert not manager.is_enabled("a")
+
+
+def test_classifier(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "modules.toml", create_if_not_exists=True)
+    config.dump({"priorities": {"message_create": "high"}})
+
+    classifier = EventClassifier.from_config(config)
+
+    assert classifier.classify("INTERACTION_CREATE") == EventPriority.CRITICAL
+    assert classifier.classify("MESSAGE_CREATE") == EventPriority.HIGH
+    assert classifier.classify("presence_update") == EventPriority.LOW
+    assert classifier.classify("GUILD_CREATE") == EventPriority.NORMAL
+
+    config.dump({"priorities": {"MESSAGE_CREATE": "urgent"}})
+    with pytest.raises(InvalidConfigurationError):
+        EventClassifier.from_config(config)
@@ -0,0 +1,353 @@
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+from nexus.core.config import TOMLConfiguration
+from nexus.core.module import ModuleManager, module
+from nexus.core.module.lifecycle import LifecycleStatus
+
+_MODULE_SOURCE = """
+from nexus.core.module import module
+{imports}
+
+VERSION = {version}
+
+
+class Module(module.Module):
+    dependencies = {dependencies!r}
+
+    def __init__(self, config):
+        super().__init__(name="{name}", optional={optional}, config=config)
+"""
+
+
+def _write_module(
+    root: Path,
+    name: str,
+    version: int = 1,
+    dependencies: tuple[str, ...] = (),
+    import_dependencies: bool = True,
+    optional: bool = False,
+) -> None:
+    imports = "\n".join(
+        f"from {root.name}.{dependency}.module import VERSION as {dependency}_version"
+        for dependency in (dependencies if import_dependencies else ())
+    )
+
+    (root / name).mkdir(exist_ok=True)
+    (root / name / "__init__.py").touch()
+    (root / name / "module.py").write_text(
+        _MODULE_SOURCE.format(
+            imports=imports,
+            version=version,
+            dependencies=dependencies,
+            name=name,
+            optional=optional,
+        )
+    )
+
+
+def _unimport(root: Path) -> None:
+    for name in [name for name in sys.modules if name.startswith(root.name)]:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def package(tmp_path: Path, monkeypatch) -> Path:
+    root = tmp_path / f"modules_{uuid.uuid4().hex}"
+    root.mkdir()
+    (root / "__init__.py").touch()
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield root
+
+    _unimport(root)
+
+
+def test_incremental_reload(tmp_path: Path, package: Path, monkeypatch) -> None:
+    events = []
+
+    async def setup(self) -> None:
+        events.append(("setup", self._name))
+
+    async def teardown(self) -> None:
+        events.append(("teardown", self._name))
+
+    monkeypatch.setattr(module.Module, "setup", setup)
+    monkeypatch.setattr(module.Module, "teardown", teardown)
+
+    _write_module(package, "a")
+    _write_module(package, "b", dependencies=("a",))
+    _write_module(package, "c")
+
+    config = TOMLConfiguration(tmp_path / "modules.toml", create_if_not_exists=True)
+    config.dump({"modules": []})
+
+    manager = ModuleManager(module_config=config, package=package.name)
+    asyncio.run(manager.reload_modules())
+
+    for name in ["a", "b", "c"]:
+        asyncio.run(manager.enable_module(name))
+
+    a, b, c = (manager.get_module(name) for name in ["a", "b", "c"])
+    asyncio.run(manager.reload_modules())
+    assert [manager.get_module(name) for name in ["a", "b", "c"]] == [a, b, c]
+
+    events.clear()
+    _write_module(package, "a", version=2)
+    asyncio.run(manager.reload_modules())
+
+    # The old instances are torn down and the new ones set up
+    assert events == [
+        ("teardown", "b"),
+        ("teardown", "a"),
+        ("setup", "a"),
+        ("setup", "b"),
+    ]
+
+    # The changed module and its dependent are reloaded, the other one is kept
+    assert manager.get_module("a") is not a
+    assert manager.get_module("b") is not b
+    assert manager.get_module("c") is c
+    assert sys.modules[f"{package.name}.a.module"].VERSION == 2
+    assert sys.modules[f"{package.name}.b.module"].a_version == 2
+    assert all(manager.is_enabled(name) for name in ["a", "b", "c"])
+
+    events.clear()
+    asyncio.run(manager.disable_module("c"))
+    asyncio.run(manager.shutdown())
+    assert events == [("teardown", "c"), ("teardown", "b"), ("teardown", "a")]
+
+
+def test_reload_keeps_loop_responsive(tmp_path: Path, package: Path) -> None:
+    _write_module(package, "slow")
+    with open(package / "slow" / "module.py", "a") as file:
+        file.write("\nimport time\n\ntime.sleep(0.3)\n")
+
+    config = TOMLConfiguration(tmp_path / "modules.toml", create_if_not_exists=True)
+    config.dump({"modules": []})
+    manager = ModuleManager(module_config=config, package=package.name)
+
+    async def main() -> float:
+        lag = 0.0
+        done = asyncio.Event()
+
+        async def tick() -> None:
+            nonlocal lag
+            while not done.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(0.01)
+                lag = max(lag, time.perf_counter() - start - 0.01)
+
+        async def reload() -> None:
+            await manager.on_config_change(keys={"modules"})
+            done.set()
+
+        await asyncio.gather(tick(), reload())
+        return lag
+
+    assert asyncio.run(main()) < 0.1
+    assert manager.get_module("slow") is not None
+
+
+def test_missing_dependency(tmp_path: Path, package: Path) -> None:
+    _write_module(package, "a", dependencies=("missing",), import_dependencies=False)
+
+    config = TOMLConfiguration(tmp_path / "modules.toml", create_if_not_exists=True)
+    config.dump({"modules": []})
+
+    manager = ModuleManager(module_config=config, package=package.name)
+
+    with pytest.warns(UserWarning, match="dependencies"):
+        asyncio.run(manager.reload_modules())
+
+    with pytest.raises(KeyError):
+        manager.get_module("a")
+
+
+def test_manifest(tmp_path: Path, package: Path) -> None:
+    _write_module(package, "a")
+    _write_module(package, "optional", optional=True)
+
+    # Entries which are not modules
+    (package / "notes.txt").touch()
+    (package / "assets").mkdir()
+    _write_module(package, "_private")
+
+    config = TOMLConfiguration(tmp_path / "modules.toml", create_if_not_exists=True)
+    config.dump({"modules": []})
+
+    asyncio.run(
+        ModuleManager(module_config=config, package=package.name).reload_modules()
+    )
+    assert (tmp_path / ".cache/module_manifest.json").exists()
+
+    # A new manager decides from the cached manifest and does not import
+    # the optional module
+    _unimport(package)
+    manager = ModuleManager(module_config=config, package=package.name)
+
+    assert set(manager.get_manifest()) == {"a", "optional"}
+    assert manager.get_manifest()["optional"].optional
+
+    asyncio.run(manager.reload_modules())
+    assert f"{package.name}.optional.module" not in sys.modules
+    assert f"{package.name}.a.module" in sys.modules
+
+    config.dump({"modules": ["optional"]})
+    asyncio.run(manager.reload_modules())
+    assert manager.get_module("optional")
+
+    # Changing a module invalidates its entry
+    _write_module(package, "a", dependencies=("optional",), import_dependencies=False)
+    asyncio.run(manager.reload_modules())
+    assert ModuleManager(module_config=config, package=package.name).get_manifest()[
+        "a"
+    ].dependencies == ("optional",)
+
+    # So does changing any other source file of its package
+    (package / "b").mkdir()
+    (package / "b" / "__init__.py").touch()
+    (package / "b" / "settings.py").write_text("OPTIONAL = True\n")
+    (package / "b" / "module.py").write_text(
+        _MODULE_SOURCE.format(
+            imports="from .settings import OPTIONAL",
+            version=1,
+            dependencies=(),
+            name="b",
+            optional="OPTIONAL",
+        )
+    )
+    asyncio.run(manager.reload_modules())
+    assert manager.get_manifest()["b"].optional
+
+    (package / "b" / "settings.py").write_text("OPTIONAL = False\n")
+    _unimport(package)
+    manager = ModuleManager(module_config=config, package=package.name)
+    asyncio.run(manager.reload_modules())
+    assert not manager.get_manifest()["b"].optional
+
+
+def test_lifecycle(tmp_path: Path, package: Path) -> None:
+    _write_module(package, "a")
+    _write_module(package, "b")
+    _write_module(package, "c", dependencies=("a", "b"))
+    _write_module(package, "slow")
+    _write_module(package, "d", dependencies=("slow",))
+
+    config = TOMLConfiguration(tmp_path / "modules.toml", create_if_not_exists=True)
+    config.dump({"modules": []})
+
+    manager = ModuleManager(module_config=config, package=package.name)
+    asyncio.run(manager.reload_modules())
+
+    events = []
+
+    def hooks(name: str, delay: float):
+        async def setup() -> None:
+            await asyncio.sleep(delay)
+            events.append(("setup", name))
+
+        async def teardown() -> None:
+            events.append(("teardown", name))
+
+        module = manager.get_module(name)
+        module.setup, module.teardown = setup, teardown
+
+    for name in ["a", "b", "c", "d"]:
+        hooks(name, delay=0.1)
+    hooks("slow", delay=10)
+
+    slow = manager.get_module("slow")
+    slow.reset_config()
+    slow._config.dump({"lifecycle": {"timeout": 0.1}})
+
+    report = asyncio.run(manager.start_modules())
+    timings = {timing.name: timing for timing in report.timings}
+
+    # Modules of a level are set up concurrently after their dependencies
+    assert report.duration < 0.35
+    assert timings["c"].level == 1
+    assert events.index(("setup", "c")) > events.index(("setup", "a"))
+    assert timings["slow"].status is LifecycleStatus.TIMEOUT
+    assert timings["d"].status is LifecycleStatus.SKIPPED
+    assert set(report.get_failed()) == {"slow", "d"}
+    assert [name for name in "abcd" if manager.is_enabled(name)] == ["a", "b", "c"]
+    assert manager.get_module("a").get_queue() is not None
+
+    events.clear()
+    report = asyncio.run(manager.stop_modules())
+
+    # Dependents are torn down before their dependencies
+    assert events[0] == ("teardown", "c")
+    assert {timing.name for timing in report.timings} == {"a", "b", "c"}
+    assert not any(manager.is_enabled(name) for name in "abc")
+    assert manager.get_module("a").get_queue() is None
+
+
+def test_dependency_closure(tmp_path: Path, package: Path) -> None:
+    _write_module(package, "a")
+    _write_module(package, "b", dependencies=("a",))
+    _write_module(package, "c", dependencies=("b",))
+    _write_module(package, "d")
+
+    config = TOMLConfiguration(tmp_path / "modules.toml", create_if_not_exists=True)
+    config.dump({"modules": []})
+
+    manager = ModuleManager(module_config=config, package=package.name)
+    asyncio.run(manager.reload_modules())
+
+    # Starting a module starts its dependencies first
+    assert asyncio.run(manager.enable_module("c"))
+    assert [name for name in "abcd" if manager.is_enabled(name)] == ["a", "b", "c"]
+
+    # Stopping a module stops its dependents first
+    events = []
+
+    def hook(name: str):
+        async def teardown() -> None:
+            events.append(name)
+
+        return teardown
+
+    for name in "abc":
+        manager.get_module(name).teardown = hook(name)
+
+    report = asyncio.run(manager.stop_modules(names=["a"]))
+    assert events == ["c", "b", "a"]
+    assert [timing.name for timing in report.timings] == ["c", "b", "a"]
+    assert not any(manager.is_enabled(name) for name in "abcd")
+    assert manager.get_dispatcher().get_events() == set()
+
+
+def test_invalid_module_config(tmp_path: Path, package: Path) -> None:
+    _write_module(package, "a")
+    _write_module(package, "b", dependencies=("a",))
+    _write_module(package, "c")
+
+    config = TOMLConfiguration(tmp_path / "modules.toml", create_if_not_exists=True)
+    config.dump({"modules": []})
+
+    manager = ModuleManager(module_config=config, package=package.name)
+    asyncio.run(manager.reload_modules())
+
+    invalid = manager.get_module("a")
+    invalid.reset_config()
+    invalid._config.dump({"queue": {"max_size": "large"}})
+
+    report = asyncio.run(manager.start_modules())
+    timings = {timing.name: timing for timing in report.timings}
+
+    # Only the module with the invalid configuration and its dependent fail
+    assert timings["a"].status is LifecycleStatus.FAILED
+    assert "InvalidConfigurationError" in timings["a"].error
+    assert timings["b"].status is LifecycleStatus.SKIPPED
+    assert timings["c"].status is LifecycleStatus.OK
+    assert [name for name in "abc" if manager.is_enabled(name)] == ["c"]
+    assert invalid.get_queue() is None and invalid.get_offloader() is None
+
+    asyncio.run(manager.shutdown())
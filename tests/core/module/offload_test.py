@@ -0,0 +1,165 @@
+import asyncio
+import importlib
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from nexus.core.config import TOMLConfiguration
+from nexus.core.module import Module, ModuleManager, offload
+
+_VERSIONED_SOURCE = """
+from nexus.core.module import Module, offload
+
+VERSION = {version}
+
+
+class VersionedModule(Module):
+    @offload("process")
+    def get_version() -> int:
+        return VERSION
+"""
+
+
+class _ComputeModule(Module):
+    def __init__(self, path: Path) -> None:
+        super().__init__(
+            name="compute",
+            optional=False,
+            config=TOMLConfiguration(path / "config/modules/compute.toml"),
+        )
+        self.release = threading.Event()
+
+    @offload("thread")
+    def block(self, seconds: float) -> int:
+        time.sleep(seconds)
+        return threading.get_ident()
+
+    @offload("thread")
+    def wait(self) -> None:
+        self.release.wait(timeout=5)
+
+    @offload("process")
+    def square_sum(n: int) -> tuple[int, int]:
+        return sum(i * i for i in range(n)), os.getpid()
+
+
+def _create_manager(tmp_path: Path, max_concurrency: int = 4) -> ModuleManager:
+    manager = ModuleManager(module_config=TOMLConfiguration(tmp_path / "modules.toml"))
+    manager._modules = {"compute": _ComputeModule(path=tmp_path)}
+
+    config = manager.get_module("compute")._config
+    config.create()
+    config.dump({"offload": {"max_concurrency": max_concurrency}})
+
+    asyncio.run(manager.enable_module("compute"))
+    return manager
+
+
+def test_event_loop_is_not_blocked(tmp_path: Path) -> None:
+    manager = _create_manager(tmp_path)
+    module = manager.get_module("compute")
+
+    async def main() -> float:
+        lag = 0.0
+
+        async def tick() -> None:
+            nonlocal lag
+            for _ in range(20):
+                start = time.perf_counter()
+                await asyncio.sleep(0.01)
+                lag = max(lag, time.perf_counter() - start - 0.01)
+
+        ident, _ = await asyncio.gather(module.block(0.2), tick())
+        assert ident != threading.get_ident()
+
+        return lag
+
+    assert asyncio.run(main()) < 0.1
+
+    asyncio.run(manager.shutdown())
+
+
+def test_process(tmp_path: Path) -> None:
+    manager = _create_manager(tmp_path)
+
+    result, pid = asyncio.run(manager.get_module("compute").square_sum(1000))
+
+    assert result == sum(i * i for i in range(1000))
+    assert pid != os.getpid()
+    assert manager.get_offload_stats()["compute"].completed == 1
+
+    asyncio.run(manager.shutdown())
+
+
+def test_concurrency_limit_and_cancellation(tmp_path: Path) -> None:
+    manager = _create_manager(tmp_path, max_concurrency=1)
+    module = manager.get_module("compute")
+
+    async def main() -> list:
+        tasks = [asyncio.create_task(module.wait()) for _ in range(3)]
+        await asyncio.sleep(0.05)
+
+        stats = manager.get_offload_stats()["compute"]
+        assert stats.submitted == 3 and stats.running == 1
+
+        await manager.disable_module("compute")
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        module.release.set()
+
+        return results
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert module.get_offloader() is None
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(module.block(0))
+
+    asyncio.run(manager.shutdown())
+
+
+def test_process_targets(tmp_path: Path, monkeypatch) -> None:
+    with pytest.raises(TypeError):
+
+        class _LocalModule(Module):
+            @offload("process")
+            def compute() -> None: ...
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / "versioned_module.py").write_text(_VERSIONED_SOURCE.format(version=1))
+    versioned = importlib.import_module("versioned_module")
+
+    manager = ModuleManager(module_config=TOMLConfiguration(tmp_path / "modules.toml"))
+    manager._module_config.create()
+    manager._module_config.dump({"executors": {"processes": 1}})
+    manager._modules = {
+        "versioned": versioned.VersionedModule(
+            name="versioned",
+            optional=False,
+            config=TOMLConfiguration(tmp_path / "config/modules/versioned.toml"),
+        )
+    }
+    asyncio.run(manager.enable_module("versioned"))
+    module = manager.get_module("versioned")
+
+    async def main() -> tuple[int, int]:
+        first = await module.get_version()
+
+        # The worker process runs the reloaded code
+        (tmp_path / "versioned_module.py").write_text(
+            _VERSIONED_SOURCE.format(version=20)
+        )
+        reloaded = importlib.reload(versioned)
+
+        return first, await reloaded.VersionedModule.get_version(module)
+
+    try:
+        assert asyncio.run(main()) == (1, 20)
+    finally:
+        asyncio.run(manager.shutdown())
+        sys.modules.pop("versioned_module", None)
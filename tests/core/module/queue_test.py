@@ -0,0 +1,350 @@
+import asyncio
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+
+from nexus.core.config import TOMLConfiguration
+from nexus.core.exceptions.generic import InvalidConfigurationError
+from nexus.core.module import (
+    EventClassifier,
+    EventDispatcher,
+    Module,
+    ModuleManager,
+    listener,
+)
+from nexus.core.module.queue import ModuleQueue, OverflowPolicy
+
+
+class _SlowModule(Module):
+    def __init__(self, name: str, path: Path) -> None:
+        super().__init__(
+            name=name,
+            optional=False,
+            config=TOMLConfiguration(path / f"config/modules/{name}.toml"),
+        )
+        self.received: list[int] = []
+        self.release = asyncio.Event()
+
+    @listener("MESSAGE_CREATE")
+    async def on_message(self, message: int) -> None:
+        await self.release.wait()
+        self.received.append(message)
+
+
+class _FloodedModule(Module):
+    def __init__(self, path: Path) -> None:
+        super().__init__(
+            name="flooded", optional=False, config=TOMLConfiguration(path / "m.toml")
+        )
+        self._queue = ModuleQueue(name="flooded", max_size=10_000, concurrency=4)
+        self.latencies: list[float] = []
+
+    @listener("PRESENCE_UPDATE")
+    async def on_presence(self, dispatched: float) -> None:
+        await asyncio.sleep(0.001)
+
+    @listener("INTERACTION_CREATE")
+    async def on_interaction(self, dispatched: float) -> None:
+        self.latencies.append(time.perf_counter() - dispatched)
+
+
+def _replay_flood(path: Path, classifier: EventClassifier) -> float:
+    module = _FloodedModule(path=path)
+    dispatcher = EventDispatcher(classifier=classifier)
+    dispatcher.rebuild(modules=[module])
+
+    async def main() -> None:
+        # 2000 presence updates with an interaction after every 40th
+        for i in range(2000):
+            await dispatcher.dispatch("PRESENCE_UPDATE", time.perf_counter())
+            if i % 40 == 0:
+                await dispatcher.dispatch("INTERACTION_CREATE", time.perf_counter())
+
+        await module.get_queue().join()
+        module.get_queue().close()
+
+    asyncio.run(main())
+
+    return statistics.quantiles(module.latencies, n=100)[98]
+
+
+def _handle(received: list[int], gate: asyncio.Event):
+    async def handler(event: int) -> None:
+        await gate.wait()
+        received.append(event)
+
+    return handler
+
+
+@pytest.mark.parametrize(
+    "overflow, expected",
+    [
+        (OverflowPolicy.DROP_OLDEST, [0, 4, 5]),
+        (OverflowPolicy.DROP_NEWEST, [0, 1, 2]),
+    ],
+)
+def test_overflow(overflow: OverflowPolicy, expected: list[int]) -> None:
+    async def main() -> ModuleQueue:
+        received: list[int] = []
+        gate = asyncio.Event()
+        handler = _handle(received, gate)
+        queue = ModuleQueue(name="test", max_size=2, overflow=overflow)
+
+        # The first event is taken by the worker, the others wait
+        await queue.put(handler, args=(0,))
+        await asyncio.sleep(0)
+        for event in range(1, 6):
+            await queue.put(handler, args=(event,))
+
+        assert queue.get_stats().depth == 2
+
+        gate.set()
+        await queue.join()
+        queue.close()
+
+        assert received == expected
+        return queue
+
+    stats = asyncio.run(main()).get_stats()
+
+    assert stats.dropped == 3
+    assert stats.processed == 3
+
+
+def test_block() -> None:
+    async def main() -> None:
+        received: list[int] = []
+        gate = asyncio.Event()
+        handler = _handle(received, gate)
+        queue = ModuleQueue(name="test", max_size=1)
+
+        await queue.put(handler, args=(0,))
+        await queue.put(handler, args=(1,))
+
+        blocked = asyncio.create_task(queue.put(handler, args=(2,)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        gate.set()
+        await blocked
+        await queue.join()
+        queue.close()
+
+        assert received == [0, 1, 2]
+
+    asyncio.run(main())
+
+
+def test_block_limit() -> None:
+    async def main() -> None:
+        gate = asyncio.Event()
+        handler = _handle([], gate)
+        queue = ModuleQueue(name="test", max_size=4)
+
+        queue.put_nowait(handler, args=(0,))
+        await asyncio.sleep(0)
+
+        # The worker holds one event, four are queued and four wait
+        accepted = [queue.put_nowait(handler, args=(event,)) for event in range(1000)]
+        await asyncio.sleep(0)
+
+        stats = queue.get_stats()
+        assert accepted.count(True) == 8
+        assert stats.blocked == 4 and len(queue._blocked) == 4
+        assert stats.dropped == 992
+
+        queue.close()
+
+    asyncio.run(main())
+
+
+def test_close_releases_blocked_puts() -> None:
+    async def main() -> None:
+        gate = asyncio.Event()
+        handler = _handle([], gate)
+        queue = ModuleQueue(name="test", max_size=1, max_blocked=2)
+
+        queue.put_nowait(handler, args=(0,))
+        await asyncio.sleep(0)
+        queue.put_nowait(handler, args=(1,))
+
+        # A full queue does not hold back the caller of put_nowait
+        assert queue.put_nowait(handler, args=(2,))
+        assert queue.get_stats().blocked == 1
+
+        blocked = asyncio.create_task(queue.put(handler, args=(3,)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        queue.close()
+        assert await asyncio.wait_for(blocked, timeout=1) is False
+        assert queue.get_stats().blocked == 0
+
+    asyncio.run(main())
+
+
+def test_slow_module_is_isolated(tmp_path: Path) -> None:
+    manager = ModuleManager(module_config=TOMLConfiguration(tmp_path / "modules.toml"))
+    manager._modules = {
+        name: _SlowModule(name=name, path=tmp_path) for name in ["slow", "fast"]
+    }
+
+    slow_config = manager.get_module("slow")._config
+    slow_config.create()
+    slow_config.dump({"queue": {"max_size": 10, "overflow": "drop_newest"}})
+
+    asyncio.run(manager.enable_module("slow"))
+    asyncio.run(manager.enable_module("fast"))
+
+    async def main() -> None:
+        manager.get_module("fast").release.set()
+
+        for event in range(100):
+            await manager.dispatch("MESSAGE_CREATE", event)
+
+        await manager.get_module("fast").get_queue().join()
+
+    asyncio.run(main())
+
+    stats = manager.get_queue_stats()
+    assert manager.get_module("fast").received == list(range(100))
+    # The slow module's worker holds one event, nine are waiting
+    assert stats["slow"].depth == 9 and stats["slow"].dropped == 90
+    assert stats["fast"].dropped == 0 and stats["fast"].processed == 100
+
+    asyncio.run(manager.disable_module("slow"))
+    assert manager.get_module("slow").get_queue() is None
+
+
+def test_blocked_module_is_isolated(tmp_path: Path) -> None:
+    manager = ModuleManager(module_config=TOMLConfiguration(tmp_path / "modules.toml"))
+    manager._modules = {
+        name: _SlowModule(name=name, path=tmp_path) for name in ["slow", "fast"]
+    }
+
+    slow_config = manager.get_module("slow")._config
+    slow_config.create()
+    slow_config.dump(
+        {"queue": {"max_size": 10, "overflow": "block", "max_blocked": 100}}
+    )
+
+    asyncio.run(manager.enable_module("slow"))
+    asyncio.run(manager.enable_module("fast"))
+
+    async def main() -> None:
+        manager.get_module("fast").release.set()
+
+        # The full queue of the slow module does not hold back dispatching
+        await asyncio.wait_for(
+            asyncio.gather(
+                *(manager.dispatch("MESSAGE_CREATE", event) for event in range(100))
+            ),
+            timeout=1,
+        )
+        await manager.get_module("fast").get_queue().join()
+
+        assert manager.get_module("fast").received == list(range(100))
+        # The worker holds one event, ten are queued and the others wait
+        assert manager.get_queue_stats()["slow"].blocked == 89
+
+        # Blocked events are handled in order once the module catches up
+        manager.get_module("slow").release.set()
+        await asyncio.sleep(0.05)
+        await manager.get_module("slow").get_queue().join()
+        assert manager.get_module("slow").received == list(range(100))
+
+        await manager.shutdown()
+
+    asyncio.run(main())
+
+
+def test_invalid_config(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "module.toml", create_if_not_exists=True)
+    config.dump({"queue": {"overflow": "discard"}})
+
+    with pytest.raises(InvalidConfigurationError):
+        ModuleQueue.from_config(name="test", config=config)
+
+    config.dump({"queue": {"max_blocked": 0}})
+
+    with pytest.raises(InvalidConfigurationError):
+        ModuleQueue.from_config(name="test", config=config)
+
+
+def test_interactions_under_flood(tmp_path: Path) -> None:
+    fifo_p99 = _replay_flood(
+        path=tmp_path,
+        classifier=EventClassifier(
+            priorities={"INTERACTION_CREATE": "normal", "PRESENCE_UPDATE": "normal"}
+        ),
+    )
+    priority_p99 = _replay_flood(path=tmp_path, classifier=EventClassifier())
+
+    assert priority_p99 < 0.05
+    assert priority_p99 < fifo_p99 / 10
+
+
+class _PriorityModule(Module):
+    def __init__(self, name: str, path: Path, release: asyncio.Event) -> None:
+        super().__init__(
+            name=name,
+            optional=False,
+            config=TOMLConfiguration(path / f"config/modules/{name}.toml"),
+        )
+        self.release = release
+        self.interactions: list[int] = []
+
+    @listener("PRESENCE_UPDATE")
+    async def on_presence(self, event: int) -> None:
+        await self.release.wait()
+
+    @listener("INTERACTION_CREATE")
+    async def on_interaction(self, event: int) -> None:
+        self.interactions.append(event)
+
+
+def test_critical_events_pass_saturated_queue(tmp_path: Path) -> None:
+    manager = ModuleManager(module_config=TOMLConfiguration(tmp_path / "modules.toml"))
+
+    async def main() -> None:
+        blocked, released = asyncio.Event(), asyncio.Event()
+        released.set()
+        manager._modules = {
+            "saturated": _PriorityModule("saturated", tmp_path, release=blocked),
+            "other": _PriorityModule("other", tmp_path, release=released),
+        }
+
+        config = manager.get_module("saturated")._config
+        config.create()
+        config.dump({"queue": {"max_size": 5, "overflow": "block"}})
+
+        await manager.enable_module("saturated")
+        await manager.enable_module("other")
+
+        # The low priority class of one module is full and has blocked events
+        for event in range(50):
+            await asyncio.wait_for(
+                manager.dispatch("PRESENCE_UPDATE", event), timeout=0.1
+            )
+        assert manager.get_queue_stats()["saturated"].blocked > 0
+
+        for event in range(5):
+            await asyncio.wait_for(
+                manager.dispatch("INTERACTION_CREATE", event), timeout=0.1
+            )
+        await asyncio.sleep(0.01)
+
+        # Critical events reach all modules, including the saturated one,
+        # whose worker only handles them once its running handler returns
+        assert manager.get_module("other").interactions == list(range(5))
+        assert manager.get_queue_stats()["saturated"].depth == 10
+
+        blocked.set()
+        await asyncio.sleep(0.05)
+        assert manager.get_module("saturated").interactions == list(range(5))
+
+        await manager.shutdown()
+
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+import multiprocessing
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+
+from nexus.core.exceptions.services import InvalidServiceError
+from nexus.core.service.register import ServiceRegister
+
+_N_PROCESSES = 8
+_N_SERVICES = 10
+
+
+class _FakeService:
+    def __init__(self, name: str, root_dir: Path) -> None:
+        self._name = name
+        self._root_dir = root_dir
+        self._uuid = uuid.uuid4()
+
+
+def _register_services(home: str, index: int) -> None:
+    os.environ["HOME"] = home
+
+    for i in range(_N_SERVICES):
+        name = f"service_{index}_{i}"
+        ServiceRegister().register(_FakeService(name=name, root_dir=Path(home) / name))
+
+
+def test_concurrent_register(tmp_path: Path, monkeypatch) -> None:
+    context = multiprocessing.get_context("spawn")
+
+    processes = [
+        context.Process(target=_register_services, args=(str(tmp_path), index))
+        for index in range(_N_PROCESSES)
+    ]
+
+    for process in processes:
+        process.start()
+
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    paths = set(ServiceRegister()._config["services"].values())
+
+    assert paths == {
+        str((tmp_path / f"service_{index}_{i}").resolve())
+        for index in range(_N_PROCESSES)
+        for i in range(_N_SERVICES)
+    }
+
+
+def test_lookup_by_name(tmp_path: Path, monkeypatch) -> None:
+    from nexus.core.service.service import Service
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    for name in ["alpha", "beta.bot", "gamma"]:
+        Service(name=name, parent_dir=tmp_path).initialize()
+
+    loaded = []
+    from_path = Service.from_path.__func__
+
+    def counting_from_path(cls, path, **kwargs):
+        loaded.append(Path(path).name)
+        return from_path(cls, path, **kwargs)
+
+    monkeypatch.setattr(Service, "from_path", classmethod(counting_from_path))
+    ServiceRegister._identity_map.clear()
+
+    service = ServiceRegister().get_service_by_name("beta.bot")
+    assert service._name == "beta.bot"
+    assert ServiceRegister().get_service_by_name("beta.bot") is service
+    assert ServiceRegister().get_service_by_uuid(service._uuid) is service
+    assert loaded == ["beta.bot"]
+
+    # Registries without the name index are indexed on the first lookup
+    register = ServiceRegister()
+    register._config["names"] = {}
+    assert register.get_service_by_name("gamma")._name == "gamma"
+    assert register._config["names"] == {
+        "gamma": str(register.get_service_by_name("gamma")._uuid)
+    }
+
+    register.unregister(service._uuid)
+    with pytest.raises(InvalidServiceError):
+        register.get_service_by_name("beta.bot")
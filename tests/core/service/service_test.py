@@ -0,0 +1,66 @@
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from nexus.core.exceptions.services import InvalidServiceError
+from nexus.core.service.service import Service
+
+
+def test_lazy_components(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    service = Service(name="test", parent_dir=tmp_path)
+    service.initialize()
+
+    loaded = Service.from_path(tmp_path / "test")
+
+    assert loaded._uuid == service._uuid
+    assert "_bot_config" not in vars(loaded)
+    assert "_module_manager" not in vars(loaded)
+
+    assert loaded._module_manager._module_config is loaded._module_config
+    assert loaded._module_config._path == tmp_path / "test/modules.toml"
+
+
+def test_lazy_imports(tmp_path: Path) -> None:
+    (tmp_path / "test").mkdir()
+
+    # Validating a service imports neither the managers nor discord.py
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; "
+            "from nexus.core.service.service import Service; "
+            f"Service(name='test', parent_dir={str(tmp_path)!r}).is_valid(); "
+            "print(sorted(name for name in sys.modules "
+            "if name.split('.')[0] == 'discord' or name.endswith('.manager')))",
+        ],
+        env=os.environ | {"HOME": str(tmp_path), "USERPROFILE": str(tmp_path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "['nexus.core.plugin.manager']"
+
+
+def test_is_valid(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    service = Service(name="test", parent_dir=tmp_path)
+    assert not service.is_valid()
+    assert service._uuid is None
+
+    service.initialize()
+    assert service.is_valid()
+
+    shutil.rmtree(tmp_path / "test/config/plugins")
+    assert not service.is_valid()
+
+    with pytest.raises(InvalidServiceError):
+        Service.from_path(tmp_path / "test")
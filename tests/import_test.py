@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_HEAVY_MODULES = {"aiohttp", "catppuccin", "discord", "numpy", "rich", "rich_click"}
+
+
+def _imported_modules(stderr: str) -> set[str]:
+    # Lines of -X importtime look like
+    # "import time:  self [us] | cumulative | imported package"
+    modules = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+@pytest.mark.parametrize(
+    "module", ["nexus", "nexus.core", "nexus.core.service.register"]
+)
+def test_import_budget(tmp_path: Path, module: str) -> None:
+    home = tmp_path / "home"
+    home.mkdir()
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=os.environ | {"HOME": str(home), "USERPROFILE": str(home)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert list(home.rglob("*")) == []
+
+    imported = {name.split(".")[0] for name in _imported_modules(result.stderr)}
+    assert imported & _HEAVY_MODULES == set()
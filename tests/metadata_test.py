@@ -0,0 +1,33 @@
+import importlib.metadata
+from email.message import Message
+
+from nexus import metadata
+
+
+def test_metadata_from_distribution(monkeypatch) -> None:
+    dist_metadata = Message()
+    dist_metadata["Author-email"] = "Tom Groß <tom.gross@udo.edu>, Jane Doe <j@d.e>"
+    dist_metadata["License"] = "LGPL-3.0"
+    dist_metadata["Project-URL"] = "Repository, https://github.com/tgross03/nexus"
+    dist_metadata["Project-URL"] = "License, https://www.gnu.org/licenses/lgpl-3.0.html"
+
+    monkeypatch.setattr(importlib.metadata, "metadata", lambda name: dist_metadata)
+    metadata.get_metadata.cache_clear()
+
+    package_metadata = metadata.get_metadata()
+
+    assert package_metadata.authors == ["Tom Groß", "Jane Doe"]
+    assert package_metadata.license == "LGPL-3.0"
+    assert package_metadata.urls == {
+        "Repository": "https://github.com/tgross03/nexus",
+        "License": "https://www.gnu.org/licenses/lgpl-3.0.html",
+    }
+
+    metadata.get_metadata.cache_clear()
+
+
+def test_metadata_from_pyproject() -> None:
+    package_metadata = metadata._metadata_from_pyproject()
+
+    assert package_metadata.authors == ["Tom Groß"]
+    assert package_metadata.urls["Documentation"].startswith("https://")
@@ -0,0 +1,180 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from nexus.core.config import TOMLConfiguration
+from nexus.core.exceptions.generic import InvalidConfigurationError
+from nexus.modules.permissions.module import Module
+from nexus.modules.permissions.nodes import NodeResolver, NodeTrie
+
+
+def test_trie() -> None:
+    trie = NodeTrie(
+        [
+            "moderation.*",
+            "-moderation.ban.*",
+            "moderation.ban.temporary",
+            "music.play",
+            "-music.play",
+        ]
+    )
+
+    assert trie.match("moderation.kick")
+    assert trie.match("moderation.warn.list")
+    assert not trie.match("moderation.ban.permanent")
+    assert trie.match("moderation.ban.temporary")
+
+    # A wildcard only covers the descendants of a node
+    assert trie.match("moderation") is None
+    assert trie.match("moderation.ban")
+
+    # Negation wins over a grant of the same node
+    assert trie.match("music.play") is False
+    assert trie.match("music.skip") is None
+
+    assert NodeTrie(["*", "-admin.*"]).match("anything")
+
+    for node in ["", "a..b", "a.*.b", "-"]:
+        with pytest.raises(InvalidConfigurationError):
+            NodeTrie([node])
+
+
+def test_resolver() -> None:
+    resolver = NodeResolver()
+    resolver.set_role(1, ["moderation.*"])
+    resolver.set_role(2, ["music.*"])
+    resolver.set_member(10, 100, [1])
+    resolver.set_member(10, 200, [1, 2])
+
+    assert resolver.has_permission(10, 100, "moderation.ban")
+    assert not resolver.has_permission(10, 100, "music.play")
+    assert resolver.has_permission(10, 200, "music.play")
+
+    # Member overrides win over role overrides, which win over roles
+    resolver.set_role_override(50, 1, ["-moderation.ban"])
+    resolver.set_member_override(50, 200, ["moderation.ban"])
+
+    assert not resolver.has_permission(10, 100, "moderation.ban", channel=50)
+    assert resolver.has_permission(10, 100, "moderation.kick", channel=50)
+    assert resolver.has_permission(10, 200, "moderation.ban", channel=50)
+    assert resolver.has_permission(10, 100, "moderation.ban", channel=51)
+
+
+def test_cache() -> None:
+    resolver = NodeResolver(max_size=4)
+    resolver.set_role(1, ["a.*"])
+    resolver.set_role(2, ["b.*"])
+    resolver.set_member(10, 100, [1])
+    resolver.set_member(10, 200, [2])
+
+    for member, channel in [(100, None), (100, 50), (200, None), (200, 50)]:
+        resolver.get_effective(10, member, channel)
+        resolver.get_effective(10, member, channel)
+
+    stats = resolver.get_stats()
+    assert (stats.hits, stats.misses, stats.size, stats.hit_rate) == (4, 4, 4, 0.5)
+
+    # A role only invalidates the members having it
+    resolver.set_role(1, ["a.*", "c"])
+    assert resolver.get_stats().invalidations == 2
+    assert resolver.has_permission(10, 100, "c")
+
+    # Setting the same nodes again does not invalidate anything
+    resolver.set_role(1, ["a.*", "c"])
+    resolver.set_member(10, 100, [1])
+    assert resolver.get_stats().invalidations == 2
+
+    # A role override only invalidates members with the role in the channel
+    resolver.set_role_override(50, 2, ["-b.x"])
+    assert resolver.get_stats().invalidations == 3
+    assert not resolver.has_permission(10, 200, "b.x", channel=50)
+
+    # Changing the roles of a member invalidates all of their entries
+    resolver.set_member(10, 200, [1])
+    assert resolver.get_stats().invalidations == 5
+    assert resolver.has_permission(10, 200, "a.y")
+    assert not resolver.has_permission(10, 200, "b.y")
+
+    # The cache is bounded and evicts the least recently used entry
+    for member in range(300, 310):
+        resolver.get_effective(10, member)
+    assert resolver.get_stats().size == 4
+    assert resolver.get_stats().evictions > 0
+
+    resolver.set_role(2, [])
+    resolver.remove_member(10, 100)
+    assert resolver.get_stats().size == 4
+
+    resolver.set_max_size(2)
+    assert resolver.get_stats().size == 2
+
+    with pytest.raises(InvalidConfigurationError):
+        resolver.set_max_size(0)
+
+
+def test_module(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "permissions.toml", create_if_not_exists=True)
+    config.dump(
+        {
+            "nodes": {
+                "roles": {"1": ["moderation.*"]},
+                "channels": {"50": {"members": {"100": ["-moderation.ban"]}}},
+            }
+        }
+    )
+
+    module = Module(config=config)
+    module.enable()
+
+    payload = {"guild_id": "10", "user": {"id": "100"}, "roles": ["1"]}
+    asyncio.run(module.on_member_update(payload))
+
+    assert module.has_node(10, 100, "moderation.ban")
+    assert not module.has_node(10, 100, "moderation.ban", channel=50)
+
+    config.dump({"nodes": {"roles": {"1": ["moderation.*"]}}})
+    module.on_config_change(keys={"nodes.channels"})
+    assert module.has_node(10, 100, "moderation.ban", channel=50)
+
+    asyncio.run(module.on_member_remove(payload))
+    assert not module.has_node(10, 100, "moderation.ban")
+    assert module.get_cache_stats().invalidations == 3
+
+
+def test_module_members(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "permissions.toml", create_if_not_exists=True)
+    config.dump({"nodes": {"roles": {"1": ["music.*"], "2": ["moderation.*"]}}})
+
+    module = Module(config=config)
+    module.enable()
+
+    # Existing members are seeded from the guild and member chunks
+    asyncio.run(
+        module.on_guild_create(
+            {"id": "10", "members": [{"user": {"id": "100"}, "roles": ["1", "2"]}]}
+        )
+    )
+    asyncio.run(
+        module.on_members_chunk(
+            {"guild_id": "10", "members": [{"user": {"id": "101"}, "roles": ["2"]}]}
+        )
+    )
+    assert module.has_node(10, 100, "music.play")
+    assert module.has_node(10, 101, "moderation.ban")
+
+    # Reloading the module keeps the members
+    config.dump({"cache": {"max_size": 1}, "nodes": {"roles": {"1": ["music.*"]}}})
+    module.disable()
+    module.enable()
+    assert module.has_node(10, 100, "music.play")
+    assert module.get_cache_stats().max_size == 1
+
+    asyncio.run(module.on_role_delete({"guild_id": "10", "role_id": "1"}))
+    assert not module.has_node(10, 100, "music.play")
+    assert module.get_node_resolver()._members[10, 100] == (2,)
+
+    asyncio.run(module.on_guild_delete({"id": "10", "unavailable": True}))
+    assert module.get_node_resolver()._members
+    asyncio.run(module.on_guild_delete({"id": "10"}))
+    assert not module.get_node_resolver()._members
@@ -0,0 +1,75 @@
+from pathlib import Path
+
+import numpy as np
+
+from nexus.core.config import TOMLConfiguration
+from nexus.modules.permissions.module import Module
+from nexus.modules.permissions.resolver import PermissionRegistry, PermissionResolver
+
+
+def test_registry() -> None:
+    registry = PermissionRegistry()
+
+    assert registry.intern("music.play") == 0
+    assert registry.intern("music.skip") == 1
+    assert registry.intern("music.play") == 0
+
+    mask = registry.get_mask(["music.skip", "admin"])
+    assert mask == 0b110
+    assert registry.get_names(mask) == ["music.skip", "admin"]
+
+
+def test_resolve() -> None:
+    resolver = PermissionResolver()
+    resolver.set_role(1, ["music.play"])
+    resolver.set_role(2, ["music.skip", "music.stop"])
+
+    assert resolver.has_permissions([1, 2], "music.play", "music.stop")
+    assert not resolver.has_permissions([1], "music.play", "music.stop")
+    assert not resolver.has_permissions([1, 2], "unknown")
+    assert resolver.has_permissions([])
+
+    # Unknown and removed roles grant nothing
+    resolver.remove_role(2)
+    assert resolver.resolve([2, 3]) == 0
+
+
+def test_resolve_many() -> None:
+    rng = np.random.default_rng(0)
+
+    resolver = PermissionResolver()
+    for role in range(50):
+        resolver.set_role(role, [f"p{i}" for i in rng.choice(150, size=10)])
+
+    members = [list(rng.choice(60, size=rng.integers(0, 5))) for _ in range(200)]
+    resolved = resolver.resolve_many(members)
+
+    # More than 64 permissions span several words
+    assert resolved.shape == (200, 3)
+
+    for member, words in zip(members, resolved):
+        mask = sum(int(word) << (64 * i) for i, word in enumerate(words))
+        assert mask == resolver.resolve(member)
+
+    checked = resolver.check_many(members, "p3", "p140")
+    assert list(checked) == [
+        resolver.has_permissions(member, "p3", "p140") for member in members
+    ]
+
+    # The compiled matrix is rebuilt after a role changes
+    resolver.set_role(0, ["p3", "p140"])
+    assert resolver.check_many([[0]], "p3", "p140")[0]
+
+
+def test_module(tmp_path: Path) -> None:
+    config = TOMLConfiguration(tmp_path / "permissions.toml", create_if_not_exists=True)
+    config.dump({"roles": {"123": ["music.play"]}})
+
+    module = Module(config=config)
+    module.enable()
+    assert module.has_permissions([123], "music.play")
+
+    config.dump({"roles": {"123": [], "456": ["music.play"]}})
+    module.on_config_change(keys={"roles.123", "roles.456"})
+    assert not module.has_permissions([123], "music.play")
+    assert module.has_permissions([456], "music.play")